@@ -10,6 +10,7 @@ Usage:
 """
 
 import argparse
+import sys
 from pathlib import Path
 import pandas as pd
 import plotly.graph_objects as go
@@ -17,6 +18,9 @@ from plotly.subplots import make_subplots
 import plotly.express as px
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from core.excel_reader import read_excel
+
 
 def load_data(input_path, sheet_name="Case List"):
     """
@@ -30,7 +34,7 @@ def load_data(input_path, sheet_name="Case List"):
         DataFrame: 전처리된 데이터
     """
     print(f"[INFO] Loading data from: {input_path}")
-    df = pd.read_excel(input_path, sheet_name=sheet_name, engine="openpyxl")
+    df = read_excel(input_path, sheet_name=sheet_name)
 
     # 날짜 컬럼을 datetime으로 변환
     date_cols = [col for col in df.columns
@@ -41,11 +41,13 @@ except ImportError:
         calculate_pareto_analysis = None
         calculate_aisle_occupancy = None
 
+from core.excel_reader import read_excel
+
 
 def load_data(input_path, sheet_name="Case List, RIL", aisle_map_path=None):
     """데이터 로드 및 전처리"""
     print(f"[INFO] Loading data from: {input_path}")
-    df = pd.read_excel(input_path, sheet_name=sheet_name, engine="openpyxl")
+    df = read_excel(input_path, sheet_name=sheet_name)
 
     # 날짜 컬럼 변환 - 모든 Date/시간 관련 컬럼
     date_cols = [
@@ -10,6 +10,7 @@ Usage:
 """
 
 import argparse
+import sys
 from pathlib import Path
 import pandas as pd
 import numpy as np
@@ -17,6 +18,9 @@ import matplotlib.pyplot as plt
 import networkx as nx
 import seaborn as sns
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from core.excel_reader import ExcelReader
+
 
 def identify_movements(row, location_columns):
     """
@@ -207,9 +211,9 @@ def main():
         "--engine",
         "-e",
         type=str,
-        default="openpyxl",
-        choices=["openpyxl", "calamine"],
-        help="Excel 엔진 (기본값: openpyxl)",
+        default="auto",
+        choices=["auto", "openpyxl", "calamine"],
+        help="Excel 엔진 (기본값: auto = 설치된 가장 빠른 엔진)",
     )
 
     args = parser.parse_args()
@@ -228,7 +232,7 @@ def main():
 
     # Load the movement data
     try:
-        df = pd.read_excel(input_path, sheet_name=args.sheet, engine=args.engine)
+        df = ExcelReader(engine=args.engine).read(input_path, sheet_name=args.sheet)
         print(f"[OK] Loaded {len(df)} rows")
     except Exception as e:
         print(f"[ERROR] Failed to load data: {e}")
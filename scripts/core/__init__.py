@@ -7,19 +7,48 @@ Central header matching and detection system for all pipeline stages.
 This module provides robust, flexible header matching with zero hardcoding.
 
 Main Components:
-- header_detector: Automatically finds where headers start in Excel files
+- header_detector: Automatically finds where headers start in Excel files (batch row scoring)
 - header_normalizer: Normalizes header names handling all edge cases
 - semantic_matcher: Matches headers based on meaning, not exact strings
 - header_registry: Configuration for semantic mappings across all stages
 - data_parser: Core data parsing utilities (Stack_Status, SQM, unit conversions)
+- change_log: Columnar, array-backed change log for cell-level sync changes
+- case_fingerprint: Per-case fingerprints, SQLite state store and case delta files
+- excel_reader: Shared Excel read path (backend selection, dtype coercion, timings)
+- sheet_buffer: Read a sheet once and re-head it in memory for header candidates
+- case_index: Shared case-key index (normalized key -> rows) and its Stage 1 sidecar
+- dtype_policy: Category/Arrow-string dtypes for repeated labels and case keys
+- parse_cache: Parse distinct cell values once (factorize + bounded LRU), shared per run
+- excel_stream: Row-chunk Excel reads and constant-memory chunk writes
+- column_resolver: Warehouse/site key -> column resolution shared by Stages 2 and 3
 """
 
+from .case_fingerprint import (
+    CaseDelta,
+    CaseStateStore,
+    fingerprint_rows,
+    read_case_delta,
+    read_case_delta_meta,
+    write_case_delta,
+)
+from .case_index import (
+    CaseKeyIndex,
+    load_case_index,
+    normalize_case_keys,
+    read_case_index_sidecar,
+    write_case_index_sidecar,
+)
+from .change_log import CHANGE_TYPES, ChangeLog
+from .column_resolver import COLUMN_RESOLVER, ColumnResolution, ColumnResolver, resolve_columns
 from .data_parser import (
     calculate_sqm,
     convert_mm_to_cm,
     map_stack_status,
     parse_stack_status,
 )
+from .dtype_policy import MemoryReport, apply_dtype_policy, compact_frame, frame_memory
+from .excel_reader import ExcelReader, ReadTiming, coerce_frame, get_reader
+from .excel_stream import ExcelChunkWriter, iter_excel_chunks, list_sheet_names
 from .file_registry import (
     FileRegistry,
     get_master_file,
@@ -31,18 +60,28 @@ from .file_registry import (
 from .header_detector import (
     HeaderDetectionResult,
     HeaderDetector,
+    HeaderRowScores,
     detect_header_row,
     detect_header_row_with_diagnostics,
+    detect_workbook,
+)
+from .header_normalizer import (
+    HEADER_NORMALIZER,
+    CachedHeaderNormalizer,
+    HeaderNormalizer,
+    normalize_header,
 )
-from .header_normalizer import HeaderNormalizer, normalize_header
 from .header_registry import (
     HVDC_HEADER_REGISTRY,
+    AliasIndex,
     HeaderCategory,
     HeaderDefinition,
     HeaderRegistry,
 )
 from .name_resolver import FlexibleNameResolver, MatchResult
+from .parse_cache import STACK_STATUS_PARSER, DistinctValueParser
 from .semantic_matcher import SemanticMatcher, find_header_by_meaning
+from .sheet_buffer import SheetBuffer
 from .standard_header_order import (
     STAGE1_BASE_COLS_ORDER,
     STAGE2_HEADER_ORDER,
@@ -100,4 +139,40 @@ __all__ = [
     "get_synced_file",
     "normalize_vendor_name",
     "get_source_file_name",
+    "ChangeLog",
+    "CHANGE_TYPES",
+    "CaseDelta",
+    "CaseStateStore",
+    "fingerprint_rows",
+    "read_case_delta",
+    "read_case_delta_meta",
+    "write_case_delta",
+    "SheetBuffer",
+    "ExcelReader",
+    "ReadTiming",
+    "coerce_frame",
+    "get_reader",
+    "CaseKeyIndex",
+    "normalize_case_keys",
+    "load_case_index",
+    "read_case_index_sidecar",
+    "write_case_index_sidecar",
+    "apply_dtype_policy",
+    "compact_frame",
+    "frame_memory",
+    "MemoryReport",
+    "DistinctValueParser",
+    "STACK_STATUS_PARSER",
+    "ExcelChunkWriter",
+    "iter_excel_chunks",
+    "list_sheet_names",
+    "ColumnResolution",
+    "ColumnResolver",
+    "COLUMN_RESOLVER",
+    "resolve_columns",
+    "AliasIndex",
+    "CachedHeaderNormalizer",
+    "HEADER_NORMALIZER",
+    "HeaderRowScores",
+    "detect_workbook",
 ]
@@ -0,0 +1,297 @@
+"""케이스 지문/상태 저장소 / Per-case content fingerprints, state store and case deltas."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+DELTA_STATUSES = ("new", "changed", "deleted")
+DELTA_META_SUFFIX = ".meta.json"
+DELTA_META_VERSION = 1
+
+# Fixed key so fingerprints are stable across runs and processes
+_HASH_KEY = "hvdc-case-state1"  # hash_pandas_object requires 16 bytes
+
+
+def fingerprint_rows(df: pd.DataFrame, columns: Sequence[str]) -> np.ndarray:
+    """
+    행 지문 계산 / Stable uint64 fingerprint per row over ``columns``.
+
+    Values are compared by their ``str`` form (the same rule Stage 1 uses for
+    non-date fields), so dtype differences between runs do not change a hash.
+
+    Args:
+        df: Source DataFrame
+        columns: Columns to include (missing columns hash as empty)
+
+    Returns:
+        ``np.uint64`` array aligned with ``df`` rows
+    """
+    if len(df) == 0:
+        return np.empty(0, dtype=np.uint64)
+
+    text = pd.DataFrame(index=range(len(df)))
+    for col in columns:
+        if col in df.columns:
+            values = df[col]
+            if isinstance(values, pd.DataFrame):  # duplicated header
+                values = values.iloc[:, 0]
+            rendered = values.astype(object).map(str).to_numpy(dtype=object)
+            rendered[values.isna().to_numpy()] = ""
+        else:
+            rendered = np.full(len(df), "", dtype=object)
+        text[str(col)] = rendered
+    return pd.util.hash_pandas_object(text, index=False, hash_key=_HASH_KEY).to_numpy(
+        dtype=np.uint64
+    )
+
+
+def schema_signature(*column_groups: Iterable[str]) -> str:
+    """스키마 서명 / Short hash of the column lists used for fingerprints."""
+
+    payload = json.dumps([list(map(str, group)) for group in column_groups], ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class CaseDelta:
+    """케이스 변경 분류 / Case keys classified against the stored state."""
+
+    new: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+
+    def to_frame(self, sheet: str = "") -> pd.DataFrame:
+        """델타 데이터프레임 / Delta rows (sheet, case_no, status) without unchanged cases."""
+
+        records = [
+            (sheet, key, status) for status in DELTA_STATUSES for key in getattr(self, status)
+        ]
+        return pd.DataFrame(records, columns=["sheet", "case_no", "status"])
+
+    def summary(self) -> Dict[str, int]:
+        """건수 요약 / Counts per status."""
+
+        return {status: len(getattr(self, status)) for status in DELTA_STATUSES + ("unchanged",)}
+
+
+class CaseStateStore:
+    """
+    SQLite 기반 케이스 상태 저장소 / SQLite store of per-case fingerprints.
+
+    For every (scope, case key) it keeps the Master-side fingerprint and the
+    fingerprint of the synced Warehouse row produced by the last run. Each scope
+    also records the generation (run id) that last saved it, so consumers of a
+    case delta can check that it follows the state they last saw.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """저장소 열기 / Open (and create) the store."""
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS case_state (
+                scope TEXT NOT NULL,
+                case_key TEXT NOT NULL,
+                master_fp TEXT NOT NULL,
+                synced_fp TEXT,
+                PRIMARY KEY (scope, case_key)
+            );
+            CREATE TABLE IF NOT EXISTS scope_meta (
+                scope TEXT PRIMARY KEY,
+                schema_sig TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                generation TEXT
+            );
+            """)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(scope_meta)")}
+        if "generation" not in columns:  # stores created before generations were kept
+            with self._conn:
+                self._conn.execute("ALTER TABLE scope_meta ADD COLUMN generation TEXT")
+
+    def close(self) -> None:
+        """연결 종료 / Close the connection."""
+
+        self._conn.close()
+
+    def __enter__(self) -> "CaseStateStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def load(self, scope: str, schema_sig: str) -> pd.DataFrame:
+        """
+        저장 상태 로드 / Stored state for ``scope`` (empty if the schema changed).
+
+        Returns:
+            DataFrame indexed by case key with ``master_fp`` / ``synced_fp`` as decimal
+            strings (``synced_fp`` is None when the case had no Warehouse row)
+        """
+        empty = pd.DataFrame(
+            {"master_fp": pd.Series(dtype=object), "synced_fp": pd.Series(dtype=object)}
+        )
+        meta = self._conn.execute(
+            "SELECT schema_sig FROM scope_meta WHERE scope = ?", (scope,)
+        ).fetchone()
+        if meta is None or meta[0] != schema_sig:
+            return empty
+        rows = self._conn.execute(
+            "SELECT case_key, master_fp, synced_fp FROM case_state WHERE scope = ?", (scope,)
+        ).fetchall()
+        if not rows:
+            return empty
+        frame = pd.DataFrame(rows, columns=["case_key", "master_fp", "synced_fp"], dtype=object)
+        return frame.set_index("case_key")
+
+    def generation(self, scope: str, schema_sig: str) -> Optional[str]:
+        """
+        저장 세대 / Generation of the state ``load`` returns for ``scope``.
+
+        Returns:
+            The generation passed to the last ``save``, ``""`` for state saved without
+            one, or None when there is no state to compare against (unknown scope or
+            another schema)
+        """
+        meta = self._conn.execute(
+            "SELECT schema_sig, generation FROM scope_meta WHERE scope = ?", (scope,)
+        ).fetchone()
+        if meta is None or meta[0] != schema_sig:
+            return None
+        return meta[1] or ""
+
+    def save(
+        self,
+        scope: str,
+        schema_sig: str,
+        case_keys: Sequence[str],
+        master_fp: Sequence[int],
+        synced_fp: Sequence[Optional[int]],
+        generation: Optional[str] = None,
+    ) -> None:
+        """상태 교체 저장 / Replace the state of ``scope`` with the given fingerprints."""
+
+        with self._conn:
+            self._conn.execute("DELETE FROM case_state WHERE scope = ?", (scope,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO case_state VALUES (?, ?, ?, ?)",
+                (
+                    (scope, str(k), str(int(m)), None if s is None else str(int(s)))
+                    for k, m, s in zip(case_keys, master_fp, synced_fp)
+                ),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO scope_meta (scope, schema_sig, updated_at, generation) "
+                "VALUES (?, ?, ?, ?)",
+                (scope, schema_sig, datetime.now().isoformat(timespec="seconds"), generation),
+            )
+
+
+def classify_cases(
+    state: pd.DataFrame, case_keys: Sequence[str], master_fp: Sequence[int]
+) -> CaseDelta:
+    """
+    상태 대비 분류 / Classify current Master cases against the stored state.
+
+    Args:
+        state: Output of ``CaseStateStore.load``
+        case_keys: Current unique case keys
+        master_fp: Master fingerprints aligned with ``case_keys``
+
+    Returns:
+        CaseDelta (``unchanged`` = same Master fingerprint as last run)
+    """
+    delta = CaseDelta()
+    current = pd.Series([str(int(v)) for v in master_fp], index=pd.Index(case_keys, dtype=object))
+    stored = state["master_fp"] if len(state) else pd.Series(dtype=object)
+
+    known = current.index.isin(stored.index)
+    delta.new = current.index[~known].tolist()
+    same = np.zeros(len(current), dtype=bool)
+    if known.any():
+        previous = stored.reindex(current.index[known]).to_numpy(dtype=object)
+        same[known] = previous == current[known].to_numpy(dtype=object)
+    delta.unchanged = current.index[known & same].tolist()
+    delta.changed = current.index[known & ~same].tolist()
+    delta.deleted = stored.index[~stored.index.isin(current.index)].tolist()
+    return delta
+
+
+def case_delta_meta_path(path: Union[str, Path]) -> Path:
+    """델타 메타 경로 / ``<delta>.meta.json`` next to a case delta."""
+
+    path = Path(path)
+    return path.with_name(path.name + DELTA_META_SUFFIX)
+
+
+def write_case_delta(
+    frame: pd.DataFrame, path: Union[str, Path], meta: Optional[Dict[str, Any]] = None
+) -> Path:
+    """
+    델타 파일 저장 / Write a case delta (``.jsonl``, ``.csv`` or ``.parquet``).
+
+    Args:
+        frame: Delta rows (sheet, case_no, status)
+        path: Target path; the suffix selects the format
+        meta: Optional run metadata (generation, base generations, workbook stamps)
+            written to ``case_delta_meta_path(path)``; a stale meta file is removed
+            when omitted
+
+    Returns:
+        Written path
+    """
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    suffix = out.suffix.lower()
+    if suffix in (".parquet", ".pq"):
+        frame.to_parquet(out, index=False)
+    elif suffix == ".csv":
+        frame.to_csv(out, index=False, encoding="utf-8-sig")
+    else:
+        frame.to_json(out, orient="records", lines=True, force_ascii=False)
+
+    meta_path = case_delta_meta_path(out)
+    if meta is None:
+        meta_path.unlink(missing_ok=True)
+    else:
+        payload = dict(meta, version=DELTA_META_VERSION)
+        meta_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    return out
+
+
+def read_case_delta(path: Union[str, Path]) -> pd.DataFrame:
+    """델타 파일 로드 / Read a case delta written by ``write_case_delta``."""
+
+    src = Path(path)
+    suffix = src.suffix.lower()
+    if suffix in (".parquet", ".pq"):
+        return pd.read_parquet(src)
+    if suffix == ".csv":
+        return pd.read_csv(src, dtype=str, keep_default_na=False)
+    if src.stat().st_size == 0:
+        return pd.DataFrame(columns=["sheet", "case_no", "status"])
+    return pd.read_json(src, orient="records", lines=True, dtype=False)
+
+
+def read_case_delta_meta(path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """델타 메타 로드 / Metadata written with a case delta, or None if missing or unreadable."""
+
+    meta_path = case_delta_meta_path(path)
+    try:
+        payload = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != DELTA_META_VERSION:
+        return None
+    return payload
@@ -0,0 +1,373 @@
+# -*- coding: utf-8 -*-
+"""
+Case Key Index Module
+=====================
+
+케이스 번호 정규화/행 위치 색인을 모든 단계가 공유합니다.
+| One case-number index (normalized key → row positions) shared by every stage.
+
+- Vectorized normalization (``normalize_case_keys``) with the modes the stages
+  already use: ``"compact"`` (strip + upper + drop non-alphanumerics, Stage 1
+  matching and Stage 4 anomaly lookups) and ``"strip"`` (``str(v).strip()``,
+  highlight/colour row maps).
+- ``CaseKeyIndex`` groups row positions per key once; ``first_row`` / ``rows`` /
+  ``lookup`` are dictionary or ``Index.get_indexer`` lookups and ``duplicates``
+  reports keys found on several rows.
+- Sidecar file: Stage 1 writes ``<output>.case_index.json`` next to its workbook
+  (strip-mode keys per sheet plus the workbook's size/mtime). Later stages load it
+  when they read that same workbook instead of rescanning the case column.
+
+Examples:
+    >>> index = CaseKeyIndex.from_values(df["Case No."])
+    >>> index.first_row("HE0001")
+    >>> index.lookup(other["Case No."])      # row positions, -1 when missing
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+NORMALIZE_MODES = ("compact", "upper", "strip")
+SIDECAR_SUFFIX = ".case_index.json"
+SIDECAR_VERSION = 1
+
+
+def normalize_case_keys(values: Iterable[Any], mode: str = "compact") -> np.ndarray:
+    """
+    케이스 번호 일괄 정규화 / Normalize case numbers in one vectorized pass.
+
+    Args:
+        values: Case number cells (Series, array or list); NA becomes ``""``
+        mode: ``"strip"`` = ``str(v).strip()``, ``"upper"`` = strip + upper,
+            ``"compact"`` = upper without non-alphanumerics (``"HE-0001 "`` → ``"HE0001"``)
+
+    Returns:
+        Object array of normalized keys, one per input value
+    """
+    if mode not in NORMALIZE_MODES:
+        raise ValueError(f"Unknown case key mode '{mode}' (expected one of {NORMALIZE_MODES})")
+
+    series = values if isinstance(values, pd.Series) else pd.Series(list(values), dtype=object)
+    series = series.reset_index(drop=True).astype(object)
+    series = series.where(series.notna(), "").astype(str).str.strip()
+    if mode != "strip":
+        series = series.str.upper()
+    if mode == "compact":
+        series = series.str.replace(r"[^A-Z0-9]", "", regex=True)
+    return series.to_numpy(dtype=object)
+
+
+def normalize_case_key(value: Any, mode: str = "compact") -> str:
+    """단일 값 정규화 / ``normalize_case_keys`` for a single value."""
+
+    return normalize_case_keys([value], mode)[0]
+
+
+def find_case_column(columns: Sequence[Any]) -> Optional[Any]:
+    """
+    케이스 번호 컬럼 찾기 / Case number column of a written sheet.
+
+    Same rule as the Stage 1 highlight writer: the last header containing both
+    ``"Case"`` and ``"No"``.
+    """
+    found = None
+    for column in columns:
+        if column is not None and "Case" in str(column) and "No" in str(column):
+            found = column
+    return found
+
+
+@dataclass
+class CaseKeyIndex:
+    """
+    케이스 키 → 행 위치 색인 / Normalized case key → 0-based row positions.
+
+    Empty keys (blank or NA cells) are not indexed.
+
+    Attributes:
+        keys: Normalized key per row, in row order
+        mode: Normalization mode the keys were built with
+    """
+
+    keys: np.ndarray
+    mode: str = "compact"
+    _uniques: pd.Index = field(init=False, repr=False)
+    _sorted_rows: np.ndarray = field(init=False, repr=False)
+    _offsets: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.keys = np.asarray(self.keys, dtype=object)
+        positions = np.flatnonzero(self.keys != "")
+        codes, uniques = pd.factorize(self.keys[positions])
+        order = np.argsort(codes, kind="stable")
+        counts = np.bincount(codes, minlength=len(uniques))
+        self._uniques = pd.Index(uniques, dtype=object)
+        self._sorted_rows = positions[order]
+        self._offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+
+    @classmethod
+    def from_values(cls, values: Iterable[Any], mode: str = "compact") -> "CaseKeyIndex":
+        """값에서 생성 / Build from raw case number cells."""
+
+        return cls(normalize_case_keys(values, mode), mode)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, column: Any, mode: str = "compact") -> "CaseKeyIndex":
+        """데이터프레임 컬럼에서 생성 / Build from ``df[column]``."""
+
+        return cls.from_values(df[column], mode)
+
+    @classmethod
+    def concat(cls, indexes: Sequence["CaseKeyIndex"]) -> "CaseKeyIndex":
+        """
+        색인 이어붙이기 / Index of row-wise concatenated frames.
+
+        Row positions of each part are offset by the rows before it, matching
+        ``pd.concat(frames, ignore_index=True)``.
+        """
+        modes = {index.mode for index in indexes}
+        if len(modes) > 1:
+            raise ValueError(f"Cannot concatenate case indexes with modes {sorted(modes)}")
+        keys = [index.keys for index in indexes]
+        return cls(
+            np.concatenate(keys) if keys else np.empty(0, dtype=object),
+            modes.pop() if modes else "compact",
+        )
+
+    def with_mode(self, mode: str) -> "CaseKeyIndex":
+        """
+        모드 변환 / Same rows normalized with another mode.
+
+        Only narrowing works (``strip`` → ``upper`` → ``compact``); the stored keys
+        are re-normalized, not the original cells.
+        """
+        if mode == self.mode:
+            return self
+        if NORMALIZE_MODES.index(mode) > NORMALIZE_MODES.index(self.mode):
+            raise ValueError(f"Cannot derive '{mode}' keys from '{self.mode}' keys")
+        return CaseKeyIndex(normalize_case_keys(self.keys, mode), mode)
+
+    def __len__(self) -> int:
+        return len(self._uniques)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._uniques
+
+    @property
+    def n_rows(self) -> int:
+        """색인된 프레임의 행 수 / Number of rows the index was built from."""
+
+        return len(self.keys)
+
+    def _code(self, key: str) -> int:
+        try:
+            return int(self._uniques.get_loc(key))
+        except (KeyError, TypeError):
+            return -1
+
+    def rows(self, key: str) -> np.ndarray:
+        """키의 모든 행 / Row positions of a normalized key (ascending, empty if absent)."""
+
+        code = self._code(key)
+        if code < 0:
+            return np.empty(0, dtype=np.int64)
+        return self._sorted_rows[self._offsets[code] : self._offsets[code + 1]]
+
+    def first_row(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        """키의 첫 행 / First row position of a normalized key."""
+
+        code = self._code(key)
+        return int(self._sorted_rows[self._offsets[code]]) if code >= 0 else default
+
+    def last_row(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        """키의 마지막 행 / Last row position of a normalized key."""
+
+        code = self._code(key)
+        return int(self._sorted_rows[self._offsets[code + 1] - 1]) if code >= 0 else default
+
+    def _anchor_rows(self, keep: str) -> np.ndarray:
+        if keep == "first":
+            return self._sorted_rows[self._offsets[:-1]]
+        if keep == "last":
+            return self._sorted_rows[self._offsets[1:] - 1]
+        raise ValueError(f"keep must be 'first' or 'last', got '{keep}'")
+
+    def lookup(
+        self, values: Iterable[Any], keep: str = "first", normalize: bool = True
+    ) -> np.ndarray:
+        """
+        일괄 조회 / Row positions for many case numbers at once.
+
+        Args:
+            values: Raw case numbers (normalized with the index mode) or keys
+            keep: Row to return for duplicated keys (``"first"`` / ``"last"``)
+            normalize: Set False when ``values`` are already normalized keys
+
+        Returns:
+            int64 array of row positions, ``-1`` where the case is not indexed
+        """
+        keys = (
+            normalize_case_keys(values, self.mode)
+            if normalize
+            else np.asarray(values, dtype=object)
+        )
+        codes = self._uniques.get_indexer(keys)
+        anchors = self._anchor_rows(keep)
+        return np.where(
+            codes >= 0, anchors[np.maximum(codes, 0)] if len(anchors) else -1, -1
+        ).astype(np.int64)
+
+    def position_map(self, keep: str = "first") -> Dict[str, int]:
+        """
+        키 → 행 딕셔너리 / ``{key: row}`` for code that wants a plain dict.
+
+        ``keep="first"`` matches the Stage 1 warehouse index, ``keep="last"`` the
+        ``case_to_row`` maps built by overwriting while scanning rows.
+        """
+        return dict(zip(self._uniques.tolist(), self._anchor_rows(keep).tolist()))
+
+    def duplicates(self) -> pd.DataFrame:
+        """
+        중복 키 보고 / Keys found on more than one row.
+
+        Returns:
+            DataFrame with ``case_key``, ``count`` and ``rows`` (list of positions)
+        """
+        counts = np.diff(self._offsets)
+        dup_codes = np.flatnonzero(counts > 1)
+        return pd.DataFrame(
+            {
+                "case_key": self._uniques[dup_codes].tolist(),
+                "count": counts[dup_codes].astype(np.int64),
+                "rows": [
+                    self._sorted_rows[self._offsets[c] : self._offsets[c + 1]].tolist()
+                    for c in dup_codes
+                ],
+            }
+        )
+
+
+def case_index_sidecar_path(workbook: Union[str, Path]) -> Path:
+    """사이드카 경로 / ``<stem>.case_index.json`` next to ``workbook``."""
+
+    workbook = Path(workbook)
+    return workbook.with_name(workbook.stem + SIDECAR_SUFFIX)
+
+
+def file_stamp(path: Union[str, Path]) -> Dict[str, Any]:
+    """파일 스탬프 / Name, size and mtime of ``path``, to tell whether it was rewritten."""
+
+    path = Path(path)
+    stat = path.stat()
+    return {"name": path.name, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def write_case_index_sidecar(
+    workbook: Union[str, Path],
+    indexes: Mapping[str, CaseKeyIndex],
+    columns: Optional[Mapping[str, Any]] = None,
+) -> Path:
+    """
+    사이드카 저장 / Write the per-sheet case indexes of a saved workbook.
+
+    Call after the workbook is written: its size and mtime are stored so readers
+    can tell whether the sidecar still describes the file.
+
+    Args:
+        workbook: Saved workbook the indexes describe
+        indexes: ``{sheet name: CaseKeyIndex}`` in workbook sheet order
+        columns: Optional ``{sheet name: case column header}``
+
+    Returns:
+        Path of the sidecar file
+    """
+    workbook = Path(workbook)
+    columns = columns or {}
+    payload = {
+        "version": SIDECAR_VERSION,
+        "workbook": file_stamp(workbook),
+        "sheets": [
+            {
+                "sheet": sheet,
+                "column": None if columns.get(sheet) is None else str(columns[sheet]),
+                "mode": index.mode,
+                "keys": index.keys.tolist(),
+            }
+            for sheet, index in indexes.items()
+        ],
+    }
+    path = case_index_sidecar_path(workbook)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, ensure_ascii=False)
+    return path
+
+
+def read_case_index_sidecar(workbook: Union[str, Path]) -> Optional[Dict[str, CaseKeyIndex]]:
+    """
+    사이드카 로드 / Case indexes of ``workbook`` from its sidecar.
+
+    Returns:
+        ``{sheet name: CaseKeyIndex}`` in the written sheet order, or ``None`` when
+        the sidecar is missing, unreadable, from another version, or the workbook
+        changed after it was written
+    """
+    workbook = Path(workbook)
+    path = case_index_sidecar_path(workbook)
+    if not path.exists() or not workbook.exists():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError) as exc:
+        print(f"[WARN] Case index sidecar unreadable ({path.name}): {exc}")
+        return None
+
+    if payload.get("version") != SIDECAR_VERSION or payload.get("workbook") != file_stamp(workbook):
+        print(f"[INFO] Case index sidecar is stale for {workbook.name}; rebuilding")
+        return None
+    return {
+        entry["sheet"]: CaseKeyIndex(np.array(entry["keys"], dtype=object), entry["mode"])
+        for entry in payload.get("sheets", [])
+    }
+
+
+def load_case_index(
+    workbook: Union[str, Path],
+    frames: Mapping[str, pd.DataFrame],
+    mode: str = "compact",
+) -> Dict[str, CaseKeyIndex]:
+    """
+    사이드카 우선 로드 / Case index per sheet, from the sidecar when it fits.
+
+    Sheets missing from the sidecar, or whose row count differs from the loaded
+    frame, are rebuilt from their ``find_case_column`` column; sheets without a
+    case column get an empty index of the right length, so the result can be
+    passed to ``CaseKeyIndex.concat`` for the combined frame.
+
+    Args:
+        workbook: Workbook the frames were read from
+        frames: ``{sheet name: DataFrame}`` as loaded
+        mode: Normalization mode wanted by the caller
+
+    Returns:
+        ``{sheet name: CaseKeyIndex}`` for every frame, in ``frames`` order
+    """
+    stored = read_case_index_sidecar(workbook) or {}
+    indexes: Dict[str, CaseKeyIndex] = {}
+    for sheet, frame in frames.items():
+        index = stored.get(sheet)
+        if index is not None and index.n_rows == len(frame):
+            indexes[sheet] = index.with_mode(mode)
+            continue
+        column = find_case_column(frame.columns)
+        if column is not None:
+            indexes[sheet] = CaseKeyIndex.from_values(frame[column], mode)
+        else:
+            indexes[sheet] = CaseKeyIndex(np.full(len(frame), "", dtype=object), mode)
+    return indexes
@@ -0,0 +1,394 @@
+"""컬럼형 변경 로그 / Columnar, array-backed change log for cell-level sync changes."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+CHANGE_TYPES: Tuple[str, ...] = (
+    "date_update",
+    "field_update",
+    "new_record",
+    "master_only_update",
+)
+
+GROUP_FIELDS = ("change_type", "column_name", "semantic_key")
+
+# Compact delta layout (dry-run output): audit column → delta column
+DELTA_COLUMNS: Dict[str, str] = {
+    "case_no": "case",
+    "column_name": "column",
+    "old_value": "old",
+    "new_value": "new",
+    "change_type": "type",
+}
+
+ScalarOrMany = Union[str, Sequence[str], np.ndarray]
+
+
+class _StringTable:
+    """문자열 ↔ 정수 ID 사전 / Interned string table (string <-> int id)."""
+
+    def __init__(self, initial: Iterable[str] = ()) -> None:
+        self.values: List[str] = []
+        self._ids: Dict[str, int] = {}
+        for value in initial:
+            self.intern(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def intern(self, value: Any) -> int:
+        """단일 값 ID / Return the id of one value, adding it if needed."""
+
+        text = "" if value is None else str(value)
+        idx = self._ids.get(text)
+        if idx is None:
+            idx = len(self.values)
+            self._ids[text] = idx
+            self.values.append(text)
+        return idx
+
+    def intern_many(self, values: ScalarOrMany, size: int) -> np.ndarray:
+        """벡터 ID 변환 / Ids for a scalar (broadcast) or one id per element."""
+
+        if isinstance(values, str) or values is None:
+            return np.full(size, self.intern(values), dtype=np.int32)
+        codes, uniques = pd.factorize(np.asarray(values, dtype=object), use_na_sentinel=False)
+        table_ids = np.fromiter(
+            (self.intern(u) for u in uniques), dtype=np.int32, count=len(uniques)
+        )
+        return table_ids[codes]
+
+    def id_of(self, value: str) -> Optional[int]:
+        """등록 여부 확인 / Id of an already interned value (None if unknown)."""
+
+        return self._ids.get(value)
+
+
+class ChangeLog:
+    """
+    컬럼형 변경 로그 / Columnar change log.
+
+    Row index, column id, case key id, semantic key id and change type are stored
+    as typed NumPy arrays; old/new values live in a side table of object arrays.
+    Nothing is materialized per change unless a caller asks for records.
+
+    Example:
+        >>> log = ChangeLog()
+        >>> log.append(3, "ETA", "date_update", case_no="A1", old_value=None, new_value="2024-01-01")
+        >>> for (kind, column, key), positions in log.groups():
+        ...     print(kind, column, log.row_index[positions])
+    """
+
+    def __init__(self, initial_capacity: int = 256) -> None:
+        """배열 초기화 / Allocate empty arrays."""
+
+        capacity = max(int(initial_capacity), 1)
+        self._size = 0
+        self._row = np.empty(capacity, dtype=np.int64)
+        self._column = np.empty(capacity, dtype=np.int32)
+        self._semantic = np.empty(capacity, dtype=np.int32)
+        self._case = np.empty(capacity, dtype=np.int32)
+        self._type = np.empty(capacity, dtype=np.int8)
+        self._old = np.empty(capacity, dtype=object)
+        self._new = np.empty(capacity, dtype=object)
+
+        self.columns = _StringTable()
+        self.semantic_keys = _StringTable()
+        self.case_keys = _StringTable()
+        self.change_types = _StringTable(CHANGE_TYPES)
+
+    # ------------------------------------------------------------------ storage
+    def __len__(self) -> int:
+        return self._size
+
+    def _reserve(self, extra: int) -> None:
+        """용량 확보 / Grow the arrays (amortized doubling)."""
+
+        needed = self._size + extra
+        capacity = len(self._row)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        for name in ("_row", "_column", "_semantic", "_case", "_type", "_old", "_new"):
+            old = getattr(self, name)
+            grown = np.empty(new_capacity, dtype=old.dtype)
+            grown[: self._size] = old[: self._size]
+            setattr(self, name, grown)
+
+    def append(
+        self,
+        row_index: int,
+        column_name: str,
+        change_type: str,
+        semantic_key: str = "",
+        case_no: str = "",
+        old_value: Any = None,
+        new_value: Any = None,
+    ) -> None:
+        """단건 추가 / Append a single change."""
+
+        self._reserve(1)
+        i = self._size
+        self._row[i] = int(row_index)
+        self._column[i] = self.columns.intern(column_name)
+        self._semantic[i] = self.semantic_keys.intern(semantic_key)
+        self._case[i] = self.case_keys.intern(case_no)
+        self._type[i] = self.change_types.intern(change_type)
+        self._old[i] = old_value
+        self._new[i] = new_value
+        self._size += 1
+
+    def extend(
+        self,
+        row_index: Sequence[int],
+        column_name: ScalarOrMany,
+        change_type: ScalarOrMany,
+        semantic_key: ScalarOrMany = "",
+        case_no: ScalarOrMany = "",
+        old_values: Optional[Sequence[Any]] = None,
+        new_values: Optional[Sequence[Any]] = None,
+    ) -> None:
+        """
+        일괄 추가 / Append many changes at once.
+
+        String fields accept either one value (broadcast) or one value per change.
+        """
+
+        rows = np.asarray(row_index, dtype=np.int64).reshape(-1)
+        n = len(rows)
+        if n == 0:
+            return
+        self._reserve(n)
+        sl = slice(self._size, self._size + n)
+        self._row[sl] = rows
+        self._column[sl] = self.columns.intern_many(column_name, n)
+        self._semantic[sl] = self.semantic_keys.intern_many(semantic_key, n)
+        self._case[sl] = self.case_keys.intern_many(case_no, n)
+        self._type[sl] = self.change_types.intern_many(change_type, n)
+        self._old[sl] = _object_array(old_values, n)
+        self._new[sl] = _object_array(new_values, n)
+        self._size += n
+
+    # ------------------------------------------------------------------ views
+    @property
+    def row_index(self) -> np.ndarray:
+        return self._row[: self._size]
+
+    @property
+    def column_ids(self) -> np.ndarray:
+        return self._column[: self._size]
+
+    @property
+    def semantic_ids(self) -> np.ndarray:
+        return self._semantic[: self._size]
+
+    @property
+    def case_ids(self) -> np.ndarray:
+        return self._case[: self._size]
+
+    @property
+    def type_ids(self) -> np.ndarray:
+        return self._type[: self._size]
+
+    @property
+    def old_values(self) -> np.ndarray:
+        return self._old[: self._size]
+
+    @property
+    def new_values(self) -> np.ndarray:
+        return self._new[: self._size]
+
+    def case_no_array(self, positions: Optional[np.ndarray] = None) -> np.ndarray:
+        """케이스 키 배열 / Case keys (object array) for all or selected changes."""
+
+        ids = self.case_ids if positions is None else self.case_ids[positions]
+        return np.asarray(self.case_keys.values, dtype=object)[ids]
+
+    def count(self, change_type: Optional[str] = None) -> int:
+        """건수 / Number of changes (optionally of one type)."""
+
+        if change_type is None:
+            return self._size
+        return int(len(self.positions(change_type=change_type)))
+
+    def positions(
+        self, change_type: Optional[str] = None, column_name: Optional[str] = None
+    ) -> np.ndarray:
+        """필터 위치 / Positions of changes matching a type and/or column."""
+
+        mask = np.ones(self._size, dtype=bool)
+        if change_type is not None:
+            type_id = self.change_types.id_of(change_type)
+            if type_id is None:
+                return np.empty(0, dtype=np.int64)
+            mask &= self.type_ids == type_id
+        if column_name is not None:
+            column_id = self.columns.id_of(column_name)
+            if column_id is None:
+                return np.empty(0, dtype=np.int64)
+            mask &= self.column_ids == column_id
+        return np.flatnonzero(mask)
+
+    def groups(
+        self,
+        change_type: Optional[str] = None,
+        by: Sequence[str] = GROUP_FIELDS,
+    ) -> Iterator[Tuple[Tuple[str, ...], np.ndarray]]:
+        """
+        그룹 반복 / Iterate ``(group_key, positions)`` grouped by ``by`` fields.
+
+        Groups are yielded in first-appearance order and positions keep insertion
+        order, so callers can process one change type / column at a time.
+        """
+
+        base = self.positions(change_type=change_type)
+        if len(base) == 0:
+            return
+        id_arrays = [self._field_ids(name)[base] for name in by]
+        stacked = np.stack(id_arrays, axis=1)
+        _, first, inverse = np.unique(stacked, axis=0, return_index=True, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        order = np.argsort(first, kind="stable")
+        tables = [self._field_table(name) for name in by]
+        for group_no in order:
+            member = base[inverse == group_no]
+            row = stacked[first[group_no]]
+            key = tuple(table.values[int(idx)] for table, idx in zip(tables, row))
+            yield key, member
+
+    def _field_ids(self, name: str) -> np.ndarray:
+        return {
+            "change_type": self.type_ids,
+            "column_name": self.column_ids,
+            "semantic_key": self.semantic_ids,
+            "case_no": self.case_ids,
+        }[name]
+
+    def _field_table(self, name: str) -> _StringTable:
+        return {
+            "change_type": self.change_types,
+            "column_name": self.columns,
+            "semantic_key": self.semantic_keys,
+            "case_no": self.case_keys,
+        }[name]
+
+    # ------------------------------------------------------------------ records
+    def iter_records(self) -> Iterator[Tuple[int, str, Any, Any, str, str, str]]:
+        """레코드 반복 / Yield (row_index, column, old, new, type, semantic_key, case_no)."""
+
+        columns = self.columns.values
+        semantic = self.semantic_keys.values
+        cases = self.case_keys.values
+        types = self.change_types.values
+        for row, col, old, new, kind, key, case in zip(
+            self.row_index.tolist(),
+            self.column_ids.tolist(),
+            self.old_values,
+            self.new_values,
+            self.type_ids.tolist(),
+            self.semantic_ids.tolist(),
+            self.case_ids.tolist(),
+        ):
+            yield row, columns[col], old, new, types[kind], semantic[key], cases[case]
+
+    def to_frame(self, include_values: bool = True, value_as_text: bool = False) -> pd.DataFrame:
+        """
+        데이터프레임 변환 / Audit DataFrame (string fields as categoricals).
+
+        Args:
+            include_values: Include old/new value columns
+            value_as_text: Render values with ``str`` (None stays empty) for CSV/Parquet
+        """
+
+        frame = pd.DataFrame(
+            {
+                "row_index": self.row_index.copy(),
+                "case_no": _categorical(self.case_ids, self.case_keys),
+                "column_name": _categorical(self.column_ids, self.columns),
+                "semantic_key": _categorical(self.semantic_ids, self.semantic_keys),
+                "change_type": _categorical(self.type_ids, self.change_types),
+            }
+        )
+        if include_values:
+            old = self.old_values.copy()
+            new = self.new_values.copy()
+            if value_as_text:
+                old = _as_text(old)
+                new = _as_text(new)
+            frame["old_value"] = old
+            frame["new_value"] = new
+        return frame
+
+    def to_delta_frame(self) -> pd.DataFrame:
+        """
+        간결한 델타 / Compact delta rows: ``case, column, old, new, type``.
+
+        Values are rendered as text like the audit exports.
+        """
+        frame = self.to_frame(include_values=True, value_as_text=True)
+        return frame[list(DELTA_COLUMNS)].rename(columns=DELTA_COLUMNS)
+
+    def to_csv(self, path: Union[str, Path], include_values: bool = True) -> Path:
+        """CSV 감사 파일 / Write the log as a CSV audit artifact."""
+
+        out = Path(path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        self.to_frame(include_values=include_values, value_as_text=True).to_csv(
+            out, index=False, encoding="utf-8-sig"
+        )
+        return out
+
+    def to_parquet(self, path: Union[str, Path], include_values: bool = True) -> Path:
+        """Parquet 감사 파일 / Write the log as Parquet (requires pyarrow or fastparquet)."""
+
+        out = Path(path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        self.to_frame(include_values=include_values, value_as_text=True).to_parquet(
+            out, index=False
+        )
+        return out
+
+    def export(self, path: Union[str, Path], include_values: bool = True) -> Path:
+        """확장자별 내보내기 / Export by suffix (.parquet or .csv)."""
+
+        suffix = Path(path).suffix.lower()
+        if suffix in (".parquet", ".pq"):
+            return self.to_parquet(path, include_values=include_values)
+        if suffix == ".csv":
+            return self.to_csv(path, include_values=include_values)
+        raise ValueError(f"Unsupported change log format: '{suffix}' (use .parquet or .csv)")
+
+
+def _object_array(values: Optional[Sequence[Any]], size: int) -> np.ndarray:
+    """값 사이드 테이블 / Object array of exactly ``size`` values (None when omitted)."""
+
+    out = np.empty(size, dtype=object)
+    if values is None:
+        out[:] = None
+        return out
+    values = list(values) if not isinstance(values, np.ndarray) else values
+    if len(values) != size:
+        raise ValueError(f"Expected {size} values, got {len(values)}")
+    out[:] = values
+    return out
+
+
+def _categorical(ids: np.ndarray, table: _StringTable) -> pd.Categorical:
+    """ID 배열 → 범주형 / Categorical view over an id array."""
+
+    return pd.Categorical.from_codes(ids.astype(np.int32), categories=list(table.values))
+
+
+def _as_text(values: np.ndarray) -> np.ndarray:
+    """값 문자열화 / Render values as text, keeping missing values empty."""
+
+    out = np.empty(len(values), dtype=object)
+    out[:] = [
+        None if v is None or (isinstance(v, float) and np.isnan(v)) else str(v) for v in values
+    ]
+    return out
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Column Resolution Service
+=========================
+
+창고/현장 시맨틱 키 → 실제 컬럼 매핑을 한 번 계산해 단계 간에 재사용합니다.
+| Resolve warehouse/site semantic keys to actual columns once and share the result.
+
+- For every registry key the first alias present in the frame *with data* wins
+  (the rule Stage 2 used with one ``notna().sum()`` per alias).
+- The non-null counts of all alias columns come from one vectorized pass. Resolve
+  once per loaded frame and pass the ``ColumnResolution`` down: the result depends
+  on the data, so there is no cache to consult (it would have to count first).
+- ``ColumnResolution.non_null`` keeps the counts, so callers that report
+  per-column data (Stage 3 loading) reuse them instead of recounting.
+
+Examples:
+    >>> resolution = resolve_columns(df)
+    >>> resolution.get("dhl_wh")              # "DHL WH" or the alias holding data
+    >>> wh_cols, st_cols = resolution.location_columns
+    >>> resolution.non_null_count("MOSB")
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from .header_registry import HVDC_HEADER_REGISTRY, HeaderRegistry
+
+
+@dataclass(frozen=True)
+class ColumnResolution:
+    """
+    컬럼 해석 결과 / Semantic key → column map of one schema and data profile.
+
+    Attributes:
+        columns: Semantic key → first alias column holding data (keys without one are absent)
+        non_null: Alias column → non-null count (present alias columns only)
+        warehouse_columns: Resolved warehouse columns in registry order
+        site_columns: Resolved site columns in registry order
+    """
+
+    columns: Dict[str, str]
+    non_null: Dict[str, int]
+    warehouse_columns: Tuple[str, ...]
+    site_columns: Tuple[str, ...]
+
+    def get(self, semantic_key: str, default: Optional[str] = None) -> Optional[str]:
+        """시맨틱 키의 실제 컬럼 / Actual column of ``semantic_key``."""
+
+        return self.columns.get(semantic_key, default)
+
+    def non_null_count(self, column: str) -> int:
+        """컬럼 비어있지 않은 값 수 / Non-null count of an alias column (0 if absent)."""
+
+        return self.non_null.get(column, 0)
+
+    @property
+    def location_columns(self) -> Tuple[List[str], List[str]]:
+        """(창고, 현장) 컬럼 / ``(warehouse columns, site columns)`` as lists."""
+
+        return list(self.warehouse_columns), list(self.site_columns)
+
+
+class ColumnResolver:
+    """
+    컬럼 해석기 / Semantic key → column resolution (alias map built once).
+
+    Example:
+        >>> resolver = ColumnResolver()
+        >>> resolver.resolve(df).location_columns
+    """
+
+    def __init__(
+        self,
+        registry: Optional[HeaderRegistry] = None,
+        warehouse_keys: Optional[Iterable[str]] = None,
+        site_keys: Optional[Iterable[str]] = None,
+    ) -> None:
+        self.registry = registry or HVDC_HEADER_REGISTRY
+        self._warehouse_keys = None if warehouse_keys is None else tuple(warehouse_keys)
+        self._site_keys = None if site_keys is None else tuple(site_keys)
+        self._aliases: Optional[Dict[str, Tuple[str, ...]]] = None
+
+    def _alias_map(self) -> Dict[str, Tuple[str, ...]]:
+        """키별 별칭 (최초 1회) / Aliases per semantic key, built on first use."""
+
+        if self._aliases is None:
+            if self._warehouse_keys is None:
+                self._warehouse_keys = tuple(
+                    self.registry.get_warehouse_columns(use_primary_alias=False)
+                )
+            if self._site_keys is None:
+                self._site_keys = tuple(self.registry.get_site_columns(use_primary_alias=False))
+            self._aliases = {
+                key: tuple(self.registry.get_definition(key).aliases)
+                for key in self._warehouse_keys + self._site_keys
+            }
+        return self._aliases
+
+    def profile(self, df: pd.DataFrame) -> Dict[str, int]:
+        """
+        별칭 컬럼 비어있지 않은 값 수 / Non-null counts of the alias columns in ``df``.
+
+        One vectorized count over the alias columns; duplicated names count their
+        first occurrence.
+        """
+        aliases = {alias for names in self._alias_map().values() for alias in names}
+        subset = df.loc[:, df.columns.isin(aliases)]
+        counts = subset.notna().sum()
+        counts = counts[~counts.index.duplicated()]
+        return {str(column): int(count) for column, count in counts.items()}
+
+    def resolve(self, df: pd.DataFrame) -> ColumnResolution:
+        """
+        컬럼 해석 / Resolve the semantic keys of ``df``.
+
+        Args:
+            df: Frame with warehouse/site alias columns
+
+        Returns:
+            ``ColumnResolution`` of ``df`` as it is now (resolve again after
+            changing the frame's alias columns)
+        """
+        non_null = self.profile(df)
+        columns: Dict[str, str] = {}
+        for semantic_key, aliases in self._alias_map().items():
+            for alias in aliases:
+                if non_null.get(alias, 0) > 0:
+                    columns[semantic_key] = alias
+                    break  # first alias with data
+        return ColumnResolution(
+            columns=columns,
+            non_null=non_null,
+            warehouse_columns=tuple(columns[k] for k in self._warehouse_keys if k in columns),
+            site_columns=tuple(columns[k] for k in self._site_keys if k in columns),
+        )
+
+
+# Shared resolver (Stages 2 and 3 in one process build the alias map once)
+COLUMN_RESOLVER = ColumnResolver()
+
+
+def resolve_columns(df: pd.DataFrame) -> ColumnResolution:
+    """공유 해석기로 컬럼 해석 / ``COLUMN_RESOLVER.resolve(df)``."""
+
+    return COLUMN_RESOLVER.resolve(df)
@@ -218,7 +218,10 @@ def map_stack_status(series_like) -> "SeriesLike":
         >>> print(df["Stack_Status"].tolist())
         [0, 2, 3]
     """
-    return series_like.map(parse_stack_status)
+    from .parse_cache import STACK_STATUS_PARSER
+
+    # 고유값별 1회 파싱 (실행 내 공유 LRU 캐시)
+    return STACK_STATUS_PARSER.map(series_like)
 
 
 # ------------------------------------------------------------------------------
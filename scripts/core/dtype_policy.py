@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+DataFrame Dtype Policy Module
+=============================
+
+파이프라인 DataFrame의 반복 문자열 컬럼을 압축 dtype으로 변환합니다.
+| Compact dtypes for the repeated string columns of pipeline DataFrames.
+
+- Low-cardinality labels (``Source_Vendor``, ``Source_Sheet``, ``Status_*``,
+  ``FLOW_DESCRIPTION``, vendor/site names) become ``category``: one code per row
+  plus one copy of each label, instead of one Python string per cell.
+- Case keys (``Case No.``, ``CASE_NO``, ``HVDC CODE``) become Arrow-backed strings
+  when ``pyarrow`` is installed (NaN stays the missing value, as with ``str``).
+- Only columns holding nothing but strings are converted, so mixed or numeric
+  columns keep their dtype and values.
+- ``compact_frame`` returns a ``MemoryReport`` (deep ``memory_usage`` before/after)
+  that each stage prints as its ``[MEM]`` line.
+
+Notes:
+    A ``category`` column rejects values outside its categories
+    (``fillna("Unknown")``, ``.loc[mask, col] = "new"``). Apply the policy after
+    such edits, or to frames that are only read, renamed, reordered or written.
+
+Examples:
+    >>> df, report = compact_frame(df, "Stage 2 load")
+    >>> print(f"[MEM] {report}")
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+
+    HAS_PYARROW = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_PYARROW = False
+
+# Repeated labels: a few distinct values over many rows
+CATEGORY_COLUMNS = (
+    "Source_Vendor",
+    "Source_Sheet",
+    "Source_File",
+    "Status_Location",
+    "Status_Current",
+    "Status_Storage",
+    "FLOW_DESCRIPTION",
+    "Final_Location",
+    "Vendor",
+    "VENDOR",
+    "Site",
+    "SITE",
+    "Warehouse",
+)
+
+# Per-case identifiers: unique per row, so Arrow strings instead of categories
+KEY_COLUMNS = ("Case No.", "Case No", "CASE NO", "CASE_NO", "HVDC CODE", "HVDC_CODE")
+
+# Convert to category only when distinct labels <= ratio x rows
+MAX_CATEGORY_RATIO = 0.5
+
+
+def key_string_dtype() -> Optional[pd.StringDtype]:
+    """
+    키 컬럼용 Arrow 문자열 dtype / Arrow-backed string dtype for key columns.
+
+    Returns:
+        ``StringDtype("pyarrow")`` with NaN as missing value, or None without pyarrow
+    """
+    if not HAS_PYARROW:
+        return None
+    try:
+        return pd.StringDtype("pyarrow", na_value=np.nan)
+    except TypeError:  # pragma: no cover - pandas < 2.3
+        return pd.StringDtype("pyarrow_numpy")
+
+
+def frame_memory(df: pd.DataFrame) -> int:
+    """DataFrame 메모리 (bytes) / Deep memory usage of ``df`` in bytes."""
+
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+@dataclass
+class MemoryReport:
+    """dtype 정책 적용 전후 메모리 / Memory before and after the dtype policy."""
+
+    label: str
+    before: int
+    after: int
+    converted: List[str] = field(default_factory=list)
+
+    @property
+    def saved(self) -> int:
+        return self.before - self.after
+
+    @property
+    def ratio(self) -> float:
+        """감소율 (0-1) / Fraction of memory saved."""
+
+        return self.saved / self.before if self.before else 0.0
+
+    def __str__(self) -> str:
+        mb = 1024 * 1024
+        return (
+            f"{self.label}: {self.before / mb:.2f} MB -> {self.after / mb:.2f} MB "
+            f"(-{self.ratio:.1%}, {len(self.converted)}개 컬럼 변환)"
+        )
+
+
+def _string_column(df: pd.DataFrame, column: str) -> Optional[pd.Series]:
+    """문자열 전용 단일 컬럼 / The column when it is unique and holds only strings."""
+
+    if column not in df.columns:
+        return None
+    series = df[column]  # a DataFrame when the name is duplicated
+    if not isinstance(series, pd.Series) or isinstance(series.dtype, pd.CategoricalDtype):
+        return None
+    if pd.api.types.infer_dtype(series, skipna=True) != "string":
+        return None
+    return series
+
+
+def _converted_columns(
+    df: pd.DataFrame,
+    category_columns: Sequence[str] = CATEGORY_COLUMNS,
+    key_columns: Sequence[str] = KEY_COLUMNS,
+    max_category_ratio: float = MAX_CATEGORY_RATIO,
+) -> Dict[str, pd.Series]:
+    """변환 대상 컬럼 / ``{column: converted Series}`` under the policy."""
+
+    converted = {}
+    for column in category_columns:
+        series = _string_column(df, column)
+        if series is None or not len(series):
+            continue
+        if series.nunique(dropna=True) <= max_category_ratio * len(series):
+            converted[column] = series.astype("category")
+
+    key_dtype = key_string_dtype()
+    if key_dtype is not None:
+        for column in key_columns:
+            series = _string_column(df, column)
+            if series is not None and series.dtype != key_dtype:
+                converted[column] = series.astype(key_dtype)
+    return converted
+
+
+def apply_dtype_policy(df: pd.DataFrame, **policy) -> pd.DataFrame:
+    """
+    압축 dtype 적용 / Convert label columns to ``category`` and keys to Arrow strings.
+
+    Args:
+        df: Input DataFrame (not modified)
+        **policy: ``category_columns``, ``key_columns`` or ``max_category_ratio``
+            overriding the module defaults
+
+    Returns:
+        New DataFrame; unconverted columns are shared with ``df`` (copy-on-write)
+    """
+    # assign always returns a new frame, so callers may add columns freely
+    return df.assign(**_converted_columns(df, **policy))
+
+
+def compact_frame(df: pd.DataFrame, label: str, **policy) -> Tuple[pd.DataFrame, MemoryReport]:
+    """
+    dtype 정책 적용 + 메모리 보고 / ``apply_dtype_policy`` with a memory report.
+
+    Args:
+        df: Input DataFrame
+        label: Report label (e.g. ``"Stage 2 load"``)
+        **policy: Same overrides as ``apply_dtype_policy``
+
+    Returns:
+        (compacted DataFrame, MemoryReport)
+    """
+    converted = _converted_columns(df, **policy)
+    compacted = df.assign(**converted)
+    report = MemoryReport(label, frame_memory(df), frame_memory(compacted), list(converted))
+    return compacted, report
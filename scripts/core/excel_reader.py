@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+Excel Reader Module
+===================
+
+모든 단계가 공유하는 엑셀 읽기 계층입니다.
+| Central read path for every stage's ``.xlsx`` loads.
+
+- Backend selection: ``calamine`` (python-calamine, Rust) when installed, otherwise
+  pandas' openpyxl reader, which already streams with ``read_only=True``.
+  ``HVDC_EXCEL_ENGINE`` overrides the choice; a failed calamine read falls back
+  to openpyxl.
+- One dtype coercion for all stages (``coerce_frame``) so results do not depend
+  on the backend.
+- Per-read timing (``ReadTiming``) collected on the reader; only the most recent
+  ``MAX_TIMINGS`` reads are kept so long-running processes stay bounded.
+
+Examples:
+    >>> from core.excel_reader import read_excel
+    >>> df = read_excel("HVDC WAREHOUSE_HITACHI(HE).xlsx", sheet_name="Case List")
+    >>> get_reader().timings[-1].seconds
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Union
+
+import pandas as pd
+
+try:  # Optional fast backend
+    import python_calamine  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    python_calamine = None
+
+ENGINE_ENV_VAR = "HVDC_EXCEL_ENGINE"
+FALLBACK_ENGINE = "openpyxl"
+OPENPYXL_SUFFIXES = frozenset({".xlsx", ".xlsm", ".xltx", ".xltm"})
+MAX_TIMINGS = 1000
+
+ExcelSource = Union[str, Path, pd.ExcelFile]
+
+
+def available_engines() -> List[str]:
+    """사용 가능한 백엔드 (선호 순). | Installed read backends, fastest first."""
+
+    engines = ["calamine"] if python_calamine is not None else []
+    return engines + [FALLBACK_ENGINE]
+
+
+def select_engine(preferred: Optional[str] = None) -> str:
+    """
+    읽기 백엔드 선택 / Pick the backend for a read.
+
+    Args:
+        preferred: Explicit engine; defaults to ``$HVDC_EXCEL_ENGINE``, then the
+            fastest installed backend
+
+    Returns:
+        Engine name accepted by ``pd.read_excel``
+    """
+    choice = (preferred or os.environ.get(ENGINE_ENV_VAR, "")).strip().lower()
+    engines = available_engines()
+    if choice and choice != "auto":
+        if choice not in engines:
+            print(f"[WARN] Excel engine '{choice}' not available; using {engines[0]}")
+            return engines[0]
+        return choice
+    return engines[0]
+
+
+_DATETIME_KINDS = frozenset({"datetime", "datetime64", "date"})
+_NUMERIC_KINDS = frozenset({"integer", "floating", "mixed-integer-float", "decimal"})
+
+
+def coerce_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    공통 dtype 보정 / Dtype coercion applied to every read.
+
+    Object columns whose non-null cells are all dates/datetimes become
+    ``datetime64`` and all-numeric object columns become numeric. Backends differ
+    here (calamine returns ``date`` for date-only cells, openpyxl ``datetime``), so
+    this keeps stage inputs identical whichever backend read the file. Mixed
+    columns are left untouched.
+    """
+    for position, dtype in enumerate(df.dtypes):
+        if dtype != object:
+            continue
+        values = df.iloc[:, position]
+        kind = pd.api.types.infer_dtype(values, skipna=True)
+        if kind in _DATETIME_KINDS:
+            converted = pd.to_datetime(values, errors="coerce")
+        elif kind in _NUMERIC_KINDS:
+            converted = pd.to_numeric(values, errors="coerce")
+        else:
+            continue
+        df.isetitem(position, converted)
+    return df
+
+
+@dataclass
+class ReadTiming:
+    """읽기 1회 측정값 / Timing of one read."""
+
+    path: str
+    sheet: str
+    engine: str
+    rows: int
+    columns: int
+    seconds: float
+
+
+@dataclass
+class ExcelReader:
+    """
+    엑셀 읽기 서비스 / Backend-selecting Excel reader with timing.
+
+    Attributes:
+        engine: Backend name (``None`` = auto)
+        coerce: Apply ``coerce_frame`` to every returned frame
+        verbose: Print one ``[READ]`` line per read
+        timings: ``ReadTiming`` per read, in call order (last ``MAX_TIMINGS`` only)
+    """
+
+    engine: Optional[str] = None
+    coerce: bool = True
+    verbose: bool = True
+    timings: Deque[ReadTiming] = field(default_factory=lambda: deque(maxlen=MAX_TIMINGS))
+    _opened: "weakref.WeakKeyDictionary[pd.ExcelFile, str]" = field(
+        default_factory=weakref.WeakKeyDictionary, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        self.engine = select_engine(self.engine)
+
+    def engine_for(self, path: Union[str, Path], engine: Optional[str] = None) -> Optional[str]:
+        """
+        파일별 엔진 / Engine for ``path``.
+
+        openpyxl only reads OOXML workbooks; for other formats (``.xls``, ``.xlsb``,
+        ``.ods``) pandas picks the reader as before.
+        """
+        engine = engine or self.engine
+        if engine == FALLBACK_ENGINE and Path(path).suffix.lower() not in OPENPYXL_SUFFIXES:
+            return None
+        return engine
+
+    def open(self, path: Union[str, Path]) -> pd.ExcelFile:
+        """
+        워크북 열기 / Open ``path`` as a ``pd.ExcelFile`` on the selected backend.
+
+        Reuse the handle for several sheets of the same workbook (``read(xl, ...)``).
+        """
+        engine = self.engine_for(path)
+        try:
+            xl = pd.ExcelFile(path, engine=engine)
+        except Exception as exc:
+            if engine in (FALLBACK_ENGINE, None):
+                raise
+            print(f"[WARN] {engine} failed to open {Path(path).name} ({exc}); using pandas default")
+            xl = pd.ExcelFile(path, engine=self.engine_for(path, FALLBACK_ENGINE))
+        self._opened[xl] = str(path)
+        return xl
+
+    def sheet_names(self, path: Union[str, Path]) -> List[str]:
+        """시트 목록 / Sheet names of ``path``."""
+
+        with self.open(path) as xl:
+            return list(xl.sheet_names)
+
+    def read(
+        self,
+        source: ExcelSource,
+        sheet_name: Union[str, int, None] = 0,
+        coerce: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
+        """
+        시트 읽기 / ``pd.read_excel`` through the selected backend.
+
+        Args:
+            source: Path or an ``ExcelFile`` from ``open``
+            sheet_name: Sheet name/position, or ``None`` for all sheets (dict result)
+            coerce: Override the reader's ``coerce`` setting for this call
+            **kwargs: Passed to ``pd.read_excel`` (``header``, ``dtype``, ``nrows`` ...)
+
+        Returns:
+            DataFrame, or ``{sheet: DataFrame}`` when ``sheet_name`` is ``None``
+        """
+        started = time.perf_counter()
+        if isinstance(source, pd.ExcelFile):
+            engine = source.engine
+            result = pd.read_excel(source, sheet_name=sheet_name, **kwargs)
+        else:
+            engine = self.engine_for(source)
+            try:
+                result = pd.read_excel(source, sheet_name=sheet_name, engine=engine, **kwargs)
+            except Exception as exc:
+                if engine in (FALLBACK_ENGINE, None):
+                    raise
+                print(f"[WARN] {engine} read failed for {Path(source).name} ({exc}); falling back")
+                engine = self.engine_for(source, FALLBACK_ENGINE)
+                result = pd.read_excel(source, sheet_name=sheet_name, engine=engine, **kwargs)
+
+        frames = result if isinstance(result, dict) else {sheet_name: result}
+        if self.coerce if coerce is None else coerce:
+            frames = {name: coerce_frame(frame) for name, frame in frames.items()}
+
+        seconds = time.perf_counter() - started
+        if isinstance(source, pd.ExcelFile):
+            path = self._opened.get(source, "")  # handles not from ``open`` have no path
+        else:
+            path = str(source)
+        for name, frame in frames.items():
+            timing = ReadTiming(
+                path=path,
+                sheet=str(name),
+                engine=str(engine or "auto"),
+                rows=len(frame),
+                columns=frame.shape[1],
+                seconds=seconds / max(len(frames), 1),
+            )
+            self.timings.append(timing)
+            if self.verbose:
+                print(
+                    f"[READ] {Path(path).name}:{timing.sheet} via {timing.engine} "
+                    f"({timing.rows}x{timing.columns}) in {timing.seconds:.2f}s"
+                )
+
+        return frames if isinstance(result, dict) else frames[sheet_name]
+
+    def timing_frame(self) -> pd.DataFrame:
+        """측정값 표 / Recorded timings as a DataFrame."""
+
+        columns = ["path", "sheet", "engine", "rows", "columns", "seconds"]
+        return pd.DataFrame([vars(t) for t in self.timings], columns=columns)
+
+
+_DEFAULT_READER: Optional[ExcelReader] = None
+
+
+def get_reader() -> ExcelReader:
+    """공용 리더 / Process-wide default reader."""
+
+    global _DEFAULT_READER
+    if _DEFAULT_READER is None:
+        _DEFAULT_READER = ExcelReader()
+    return _DEFAULT_READER
+
+
+def read_excel(
+    source: ExcelSource, sheet_name: Union[str, int, None] = 0, **kwargs: Any
+) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    """공용 리더로 읽기 / ``get_reader().read(...)`` shortcut."""
+
+    return get_reader().read(source, sheet_name=sheet_name, **kwargs)
+
+
+def open_workbook(path: Union[str, Path]) -> pd.ExcelFile:
+    """공용 리더로 열기 / ``get_reader().open(path)`` shortcut."""
+
+    return get_reader().open(path)
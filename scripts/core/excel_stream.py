@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""
+Excel Streaming Module
+======================
+
+큰 시트를 행 청크 단위로 읽고 쓰는 스트리밍 입출력입니다.
+| Row-chunk reading and writing for sheets too large to hold in memory at once.
+
+- ``iter_excel_chunks`` walks a sheet with openpyxl in read-only mode and yields
+  DataFrames of ``chunksize`` rows. Cells are converted and parsed the way
+  ``pd.read_excel`` does it (integral floats → int, blank → NaN, duplicate
+  headers → ``name.1``), followed by ``coerce_frame``.
+- ``ExcelChunkWriter`` appends chunks to one sheet with XlsxWriter's
+  ``constant_memory`` mode, so every written row is flushed to disk.
+
+Peak memory is one chunk plus the writer's current row, independent of the
+sheet length.
+
+Examples:
+    >>> with ExcelChunkWriter("out.xlsx") as writer:
+    ...     for chunk in iter_excel_chunks("in.xlsx", "Case List", chunksize=20_000):
+    ...         writer.write(transform(chunk))
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+from .excel_reader import coerce_frame
+
+try:
+    from openpyxl import load_workbook
+    from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+except ImportError:  # pragma: no cover - optional dependency
+    load_workbook = None
+
+try:
+    import xlsxwriter
+except ImportError:  # pragma: no cover - optional dependency
+    xlsxwriter = None
+
+DEFAULT_CHUNK_SIZE = 20_000
+
+# pandas.ExcelWriter default for datetime cells
+DATETIME_FORMAT = "yyyy-mm-dd hh:mm:ss"
+
+
+def _convert_cell(cell: Any) -> Any:
+    """``pd.read_excel`` (openpyxl) 셀 변환 / Cell value as pandas' openpyxl reader returns it."""
+
+    value = cell.value
+    if value is None:
+        return ""
+    if cell.data_type == TYPE_ERROR:
+        return np.nan
+    if cell.data_type == TYPE_NUMERIC:
+        integral = int(value)
+        return integral if integral == value else float(value)
+    return value
+
+
+def _parse_rows(rows: List[list], width: int, header: Optional[Sequence[Any]]) -> pd.DataFrame:
+    """행 목록 파싱 / Parse raw rows like ``pd.read_excel`` (header row first when ``header`` is None)."""
+
+    padded = [row[:width] + [""] * (width - len(row)) for row in rows]
+    if header is None:
+        return TextParser(padded, header=0).read()
+    return TextParser(padded, header=None, names=list(header)).read()
+
+
+def list_sheet_names(path: Union[str, Path]) -> List[str]:
+    """시트 목록 / Sheet names without loading any cells."""
+
+    if load_workbook is None:  # pragma: no cover - optional dependency
+        raise ImportError("openpyxl is required for chunked Excel reads")
+    workbook = load_workbook(path, read_only=True)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+
+def iter_excel_chunks(
+    path: Union[str, Path],
+    sheet_name: Union[str, int] = 0,
+    chunksize: int = DEFAULT_CHUNK_SIZE,
+    coerce: bool = True,
+) -> Iterator[pd.DataFrame]:
+    """
+    시트 청크 읽기 / Yield a sheet as DataFrames of at most ``chunksize`` rows.
+
+    The header is the first row; columns past its last non-empty cell are
+    ignored. Blank rows are kept between data rows and dropped at the end, as
+    ``pd.read_excel`` does. Each chunk has a ``RangeIndex`` continuing the previous
+    one.
+
+    Args:
+        path: ``.xlsx``/``.xlsm`` workbook
+        sheet_name: Sheet name or position
+        chunksize: Rows per yielded chunk
+        coerce: Apply ``coerce_frame`` to each chunk
+
+    Yields:
+        DataFrame chunks with identical columns
+    """
+    if load_workbook is None:  # pragma: no cover - optional dependency
+        raise ImportError("openpyxl is required for chunked Excel reads")
+    if chunksize < 1:
+        raise ValueError("chunksize must be positive")
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = (
+            workbook.worksheets[sheet_name] if isinstance(sheet_name, int) else workbook[sheet_name]
+        )
+        sheet.reset_dimensions()
+        rows = iter(sheet.rows)
+
+        header_row: list = []
+        for cells in rows:
+            header_row = [_convert_cell(cell) for cell in cells]
+            while header_row and header_row[-1] == "":
+                header_row.pop()
+            if header_row:
+                break
+        if not header_row:
+            return
+        width = len(header_row)
+
+        columns: Optional[List[Any]] = None
+        pending: List[list] = []  # rows not yet yielded
+        blank_run: List[list] = []  # trailing blank rows, kept only if data follows
+        start = 0
+
+        def emit(batch: List[list]) -> pd.DataFrame:
+            nonlocal columns, start
+            if columns is None:
+                frame = _parse_rows([header_row] + batch, width, None)
+                columns = list(frame.columns)
+            else:
+                frame = _parse_rows(batch, width, columns)
+            frame.index = pd.RangeIndex(start, start + len(frame))
+            start += len(frame)
+            return coerce_frame(frame) if coerce else frame
+
+        for cells in rows:
+            row = [_convert_cell(cell) for cell in cells]
+            while row and row[-1] == "":
+                row.pop()
+            if not row:
+                blank_run.append(row)
+                continue
+            pending.extend(blank_run)
+            blank_run = []
+            pending.append(row)
+            while len(pending) >= chunksize:
+                yield emit(pending[:chunksize])
+                pending = pending[chunksize:]
+
+        if pending or columns is None:
+            yield emit(pending)
+    finally:
+        workbook.close()
+
+
+def _cell_value(value: Any) -> Any:
+    """XlsxWriter 셀 값 / Python value XlsxWriter can write (None = blank)."""
+
+    if value is None or value is pd.NaT:
+        return None
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    if isinstance(value, np.generic):
+        value = value.item()
+        if isinstance(value, float) and np.isnan(value):
+            return None
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    if value is pd.NA:
+        return None
+    return value
+
+
+class ExcelChunkWriter:
+    """
+    청크 단위 엑셀 쓰기 / Append DataFrame chunks to one sheet in constant memory.
+
+    The first chunk fixes the columns (later chunks are reindexed to them) and
+    writes the header row, formatted like ``DataFrame.to_excel`` (bold, bordered,
+    centered). Datetime cells use ``DATETIME_FORMAT``.
+    """
+
+    def __init__(self, path: Union[str, Path], sheet_name: str = "Sheet1") -> None:
+        if xlsxwriter is None:  # pragma: no cover - optional dependency
+            raise ImportError("XlsxWriter is required for streaming Excel writes")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._workbook = xlsxwriter.Workbook(
+            str(self.path), {"constant_memory": True, "nan_inf_to_errors": True}
+        )
+        self._sheet = self._workbook.add_worksheet(sheet_name)
+        self._header_format = self._workbook.add_format(
+            {"bold": True, "border": 1, "align": "center", "valign": "top"}
+        )
+        self._date_format = self._workbook.add_format({"num_format": DATETIME_FORMAT})
+        self.columns: Optional[List[Any]] = None
+        self.rows = 0
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        """청크 추가 / Append the rows of ``chunk``."""
+
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+            for position, column in enumerate(self.columns):
+                self._sheet.write(0, position, str(column), self._header_format)
+        elif list(chunk.columns) != self.columns:
+            chunk = chunk.reindex(columns=self.columns)
+
+        for values in chunk.itertuples(index=False, name=None):
+            self.rows += 1
+            for position, raw in enumerate(values):
+                value = _cell_value(raw)
+                if value is None:
+                    continue
+                if isinstance(value, (dt.datetime, dt.date)):
+                    self._sheet.write_datetime(self.rows, position, value, self._date_format)
+                else:
+                    self._sheet.write(self.rows, position, value)
+
+    def close(self) -> Path:
+        """파일 닫기 / Finish the workbook (header only if nothing was written)."""
+
+        self._workbook.close()
+        return self.path
+
+    def __enter__(self) -> "ExcelChunkWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
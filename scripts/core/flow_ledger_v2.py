@@ -6,7 +6,7 @@ from typing import Dict, List, Optional, Tuple
 import pandas as pd
 
 from core.header_registry import HVDC_HEADER_REGISTRY
-from core.header_normalizer import HeaderNormalizer
+from core.header_normalizer import HEADER_NORMALIZER
 
 # ------------------------------- Normalization Utils -------------------------------
 
@@ -33,14 +33,14 @@ WAREHOUSES = set(_warehouse_labels())
 
 
 def _canon_map() -> Dict[str, str]:
-    n = HeaderNormalizer()
+    n = HEADER_NORMALIZER
     m: Dict[str, str] = {}
     for lab in WAREHOUSES | SITES:
         m[n.normalize(lab)] = lab
     return m
 
 
-def _canon(v: object, amap: Dict[str, str], n=HeaderNormalizer()) -> Optional[str]:
+def _canon(v: object, amap: Dict[str, str], n=HEADER_NORMALIZER) -> Optional[str]:
     if v is None or (isinstance(v, float) and pd.isna(v)):
         return None
     s = str(v).strip()
@@ -165,87 +165,85 @@ def build_flow_ledger(
 
     # 4) Same-timestamp handling: sum same warehouse, preserve WH↔Site path transitions
     same_wh = (
-        long.groupby([col_case, "ts", "loc", "stage", "stage_prio", "wh_prio"], as_index=False)[
-            "qty"
-        ]
+        long.groupby(
+            [col_case, "ts", "Year_Month", "loc", "stage", "stage_prio", "wh_prio"], as_index=False
+        )["qty"]
         .sum()
         .sort_values([col_case, "ts", "stage_prio", "wh_prio"])
     )
 
-    events: List[Event] = []
-    edges: List[Tuple[str, pd.Timestamp, Optional[str], Optional[str], int]] = []
-    final_rows: List[Tuple[str, pd.Timestamp, str, int]] = []
-
-    # (a) Same-timestamp chain transitions: interpret path as adjacent pairs A→B
-    for case, gts in same_wh.groupby(col_case, sort=False):
-        for ts, one_ts in gts.groupby("ts", sort=False):
-            one_ts = one_ts.sort_values(["stage_prio", "wh_prio"])  # warehouse last (final state)
-            path = [r.loc for r in one_ts.itertuples()]  # includes WH + Site/Shipping
-
-            if len(path) >= 2:
-                for a, b in zip(path[:-1], path[1:]):
-                    if a == b:
-                        continue
-                    qty_a = int(one_ts.loc[one_ts["loc"] == a, "qty"].iloc[0])
-                    ym = ts.strftime("%Y-%m")
-                    if a in WAREHOUSES and b in WAREHOUSES:
-                        edges.append((str(case), ts, a, b, qty_a))
-                        events.append(Event(str(case), ym, "OUT", a, qty_a, ts, src=a, dst=b))
-                        events.append(Event(str(case), ym, "IN", b, qty_a, ts, src=a, dst=b))
-                    elif a in WAREHOUSES and b not in WAREHOUSES:
-                        events.append(Event(str(case), ym, "OUT", a, qty_a, ts, src=a, dst=b))
-                    elif a not in WAREHOUSES and b in WAREHOUSES:
-                        events.append(Event(str(case), ym, "IN", b, qty_a, ts, src=a, dst=b))
-
-            # (b) Store final state (WH or Site) for cross-timestamp transitions
-            if path:
-                last_loc = path[-1]
-                qty_last = int(one_ts.loc[one_ts["loc"] == last_loc, "qty"].iloc[0])
-                final_rows.append((str(case), ts, last_loc, qty_last))
-
-    # (c) Cross-timestamp transitions: use only final states, prevent duplicate transitions
-    if final_rows:
-        fr = pd.DataFrame(final_rows, columns=[col_case, "ts", "loc", "qty"]).sort_values(
-            [col_case, "ts"]
+    # (a) Same-timestamp chain transitions: path = (case, ts) rows in priority order,
+    #     adjacent pairs A→B come from the next row of the same (case, ts)
+    chain = same_wh.groupby([col_case, "ts"], sort=False)["loc"].shift(-1)
+    same_ts = pd.DataFrame(
+        {
+            "case": same_wh[col_case].astype(str),
+            "ts": same_wh["ts"],
+            "ym": same_wh["Year_Month"],
+            "src": same_wh["loc"],
+            "dst": chain,
+            "qty": same_wh["qty"],
+        }
+    )
+    paired = same_ts[chain.notna()]
+    src_wh = paired["src"].isin(WAREHOUSES)
+    dst_wh = paired["dst"].isin(WAREHOUSES)
+
+    # (b) Final state (WH or Site) of each timestamp = last row of the path
+    final = same_ts.loc[chain.isna(), ["case", "ts", "ym", "src", "qty"]].rename(
+        columns={"src": "loc"}
+    )
+
+    # (c) Cross-timestamp transitions between consecutive final states of a case
+    fr = final.reset_index(drop=True).sort_values(["case", "ts"])
+    prev_loc = fr.groupby("case", sort=False)["loc"].shift(1)
+    loc_wh = fr["loc"].isin(WAREHOUSES)
+    prev_wh = prev_loc.isin(WAREHOUSES)
+    moved = prev_loc.notna() & (prev_loc != fr["loc"])
+    cross = pd.DataFrame(
+        {
+            "case": fr["case"],
+            "ts": fr["ts"],
+            "ym": fr["ym"],
+            "src": prev_loc,
+            "dst": fr["loc"],
+            "qty": fr["qty"],
+        }
+    )
+    edge_cols = ["case", "ts", "src", "dst", "qty"]
+
+    # WH→WH edges: same-timestamp pairs first, then cross-timestamp moves
+    edges = pd.concat(
+        [paired.loc[src_wh & dst_wh, edge_cols], cross.loc[moved & prev_wh & loc_wh, edge_cols]],
+        ignore_index=True,
+    )
+
+    # OUT leaves the source warehouse, IN enters the destination warehouse
+    moves = [
+        (paired[src_wh], "src", "OUT"),
+        (paired[dst_wh], "dst", "IN"),
+        (cross[moved & prev_wh], "src", "OUT"),
+        (cross[loc_wh & (prev_loc.isna() | moved)], "dst", "IN"),
+    ]
+    events = [
+        pd.DataFrame(
+            {
+                "ym": part["ym"],
+                "warehouse": part[side],
+                "kind": kind,
+                "qty": part["qty"],
+            }
         )
-        for case, g in fr.groupby(col_case, sort=False):
-            prev_loc = None
-            for r in g.itertuples(index=False):
-                loc, ts, qty = r.loc, r.ts, int(r.qty)
-                ym = ts.strftime("%Y-%m")
-                if prev_loc is None:
-                    if loc in WAREHOUSES:
-                        events.append(Event(str(case), ym, "IN", loc, qty, ts, src=None, dst=loc))
-                else:
-                    if prev_loc != loc:
-                        if prev_loc in WAREHOUSES and loc in WAREHOUSES:
-                            edges.append((str(case), ts, prev_loc, loc, qty))
-                            events.append(
-                                Event(
-                                    str(case), ym, "OUT", prev_loc, qty, ts, src=prev_loc, dst=loc
-                                )
-                            )
-                            events.append(
-                                Event(str(case), ym, "IN", loc, qty, ts, src=prev_loc, dst=loc)
-                            )
-                        elif prev_loc in WAREHOUSES and loc not in WAREHOUSES:
-                            events.append(
-                                Event(
-                                    str(case), ym, "OUT", prev_loc, qty, ts, src=prev_loc, dst=loc
-                                )
-                            )
-                        elif prev_loc not in WAREHOUSES and loc in WAREHOUSES:
-                            events.append(
-                                Event(str(case), ym, "IN", loc, qty, ts, src=prev_loc, dst=loc)
-                            )
-                prev_loc = loc
+        for part, side, kind in moves
+        if not part.empty
+    ]
 
     # 5) Monthly warehouse IN/OUT aggregation
     if not events:
         cols = ["Year_Month", "Warehouse", "Kind", "Qty"]
         return pd.DataFrame(columns=cols), pd.DataFrame(columns=["case", "ts", "src", "dst", "qty"])
 
-    ev = pd.DataFrame([e.__dict__ for e in events])
+    ev = pd.concat(events, ignore_index=True)
     ledger = (
         ev.groupby(["ym", "warehouse", "kind"], as_index=False)["qty"]
         .sum()
@@ -253,9 +251,9 @@ def build_flow_ledger(
             columns={"ym": "Year_Month", "warehouse": "Warehouse", "kind": "Kind", "qty": "Qty"}
         )
     )
-    edges_df = pd.DataFrame(edges, columns=["case", "ts", "src", "dst", "qty"]).sort_values(
-        ["case", "ts"]
-    )
+    if edges.empty:
+        edges = pd.DataFrame([], columns=edge_cols)
+    edges_df = edges.sort_values(["case", "ts"])
 
     return ledger, edges_df
 
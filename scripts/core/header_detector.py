@@ -18,14 +18,21 @@ Detection Strategy:
 2. Check for rows with many unique non-null values
 3. Detect common header keywords (No, Name, Date, etc.)
 4. Verify that subsequent rows contain data matching the header types
+
+All candidate rows are scored in one batch (``score_rows``) from NumPy
+null/text masks, and ``detect_workbook`` scores every sheet of a file from a
+single open of the workbook.
 """
 
+import re
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 
+from .excel_reader import get_reader
+
 
 @dataclass
 class HeaderDetectionResult:
@@ -50,6 +57,38 @@ class HeaderDetectionResult:
         return self.row_index, self.confidence
 
 
+@dataclass(frozen=True)
+class HeaderRowScores:
+    """
+    후보 행별 특징 점수 / Per-row feature scores of the candidate header rows.
+
+    Every attribute is an array with one entry per candidate row (row ``i`` of
+    the frame), computed by ``HeaderDetector.score_rows``.
+    """
+
+    density: np.ndarray
+    text: np.ndarray
+    uniqueness: np.ndarray
+    keywords: np.ndarray
+    validation: np.ndarray
+
+    @property
+    def combined(self) -> np.ndarray:
+        """가중 합계 / Weighted score used to pick the header row."""
+
+        return (
+            self.density * 0.30  # Headers have many filled cells
+            + self.text * 0.25  # Headers are usually text
+            + self.uniqueness * 0.20  # Headers are unique values
+            + self.keywords * 0.15  # Headers contain common keywords
+            + self.validation * 0.10  # Following rows should be data
+        )
+
+
+# Vectorized ``isinstance(value, str)`` over an object matrix
+_is_text = np.frompyfunc(lambda value: isinstance(value, str), 1, 1)
+
+
 class HeaderDetector:
     """
     Automatically detects the header row in Excel files.
@@ -112,6 +151,28 @@ class HeaderDetector:
             "current",
             "container",
         ]
+        self._keyword_regex: Optional[Tuple[Tuple[str, ...], "re.Pattern[str]", Dict]] = None
+
+    def _keyword_matcher(self) -> Tuple["re.Pattern[str]", Dict[str, Tuple[str, ...]]]:
+        """
+        키워드 정규식 / One compiled alternation over ``header_keywords``.
+
+        The alternation sits in a lookahead so it is tried at every position, with
+        longer keywords first. A keyword hidden inside a longer match at the same
+        position (or anywhere inside it) is recovered through ``contained``, so the
+        found set equals ``{k for k in header_keywords if k in text}``.
+        Rebuilt when ``header_keywords`` changes.
+        """
+        keywords = tuple(dict.fromkeys(self.header_keywords))
+        if self._keyword_regex is None or self._keyword_regex[0] != keywords:
+            ordered = sorted(keywords, key=len, reverse=True)
+            pattern = re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+            contained = {
+                keyword: tuple(other for other in keywords if other in keyword)
+                for keyword in keywords
+            }
+            self._keyword_regex = (keywords, pattern, contained)
+        return self._keyword_regex[1], self._keyword_regex[2]
 
     def detect_from_file(
         self, file_path: str, sheet_name: Optional[str] = None
@@ -140,11 +201,12 @@ class HeaderDetector:
         """
         # Read the first N rows of the file for analysis
         try:
-            df = pd.read_excel(
+            df = get_reader().read(
                 file_path,
                 sheet_name=sheet_name or 0,
                 header=None,  # Don't assume any row is the header yet
                 nrows=self.max_search_rows,
+                coerce=False,
             )
         except Exception as e:
             raise ValueError(f"Failed to read Excel file: {e}")
@@ -159,13 +221,64 @@ class HeaderDetector:
     ) -> HeaderDetectionResult:
         """엑셀 파일을 분석하여 진단 정보와 함께 헤더 위치를 반환합니다. | Detect header with diagnostics from file."""
 
-        df = pd.read_excel(
+        df = get_reader().read(
             file_path,
             sheet_name=sheet_name or 0,
             header=None,
             nrows=self.max_search_rows,
+            coerce=False,
         )
+        return self.detect_from_frame(df, expected_columns=expected_columns)
+
+    def detect_workbook(
+        self,
+        file_path: str,
+        expected_columns: Optional[List[str]] = None,
+        sheet_names: Optional[Sequence[str]] = None,
+    ) -> Dict[str, HeaderDetectionResult]:
+        """
+        워크북의 모든 시트를 한 번 열어 헤더를 탐지합니다.
+        | Detect the header of every sheet from a single open of the workbook.
+
+        Args:
+            file_path: Path to the Excel file
+            expected_columns: Column names for semantic validation (all sheets)
+            sheet_names: Sheets to analyze. If None, every sheet in the workbook.
+
+        Returns:
+            Sheet name → HeaderDetectionResult, in workbook order
+        """
+        reader = get_reader()
+        try:
+            with reader.open(file_path) as workbook:
+                names = list(workbook.sheet_names) if sheet_names is None else list(sheet_names)
+                frames = reader.read(
+                    workbook,
+                    sheet_name=names,
+                    header=None,
+                    nrows=self.max_search_rows,
+                    coerce=False,
+                )
+        except Exception as e:
+            raise ValueError(f"Failed to read Excel file: {e}")
+
+        return {
+            name: self.detect_from_frame(frames[name], expected_columns=expected_columns)
+            for name in names
+        }
 
+    def detect_from_frame(
+        self,
+        df: pd.DataFrame,
+        expected_columns: Optional[List[str]] = None,
+    ) -> HeaderDetectionResult:
+        """
+        이미 읽은 원시 프레임(header=None)에서 진단과 함께 헤더를 탐지합니다.
+        | Detect header with diagnostics from an already loaded ``header=None`` frame.
+
+        Lets callers that hold the sheet in memory (e.g. ``SheetBuffer.preview``)
+        skip the extra file read of ``detect_with_diagnostics``.
+        """
         if expected_columns:
             row_index, confidence = self.detect_with_column_names(df, expected_columns)
             method = "heuristic+semantic"
@@ -217,39 +330,80 @@ class HeaderDetector:
         if df.empty or len(df) == 0:
             return 0, 0.0
 
-        scores = []
-
-        for idx in range(min(len(df), self.max_search_rows)):
-            row = df.iloc[idx]
-
-            # Calculate multiple scoring factors
-            density = self._calculate_density_score(row)
-            text_ratio = self._calculate_text_score(row)
-            uniqueness = self._calculate_uniqueness_score(row)
-            keywords = self._calculate_keyword_score(row)
+        combined = self.score_rows(df).combined
+        if len(combined) == 0:
+            return 0, 0.0
 
-            # Validate that subsequent rows look like data
-            data_validation = self._validate_data_rows(df, idx)
+        best_row = int(np.argmax(combined))  # first row on ties
+        return best_row, float(combined[best_row])
 
-            # Combined weighted score
-            # Density and text ratio are most important
-            combined_score = (
-                density * 0.30  # Headers have many filled cells
-                + text_ratio * 0.25  # Headers are usually text
-                + uniqueness * 0.20  # Headers are unique values
-                + keywords * 0.15  # Headers contain common keywords
-                + data_validation * 0.10  # Following rows should be data
-            )
+    def score_rows(self, df: pd.DataFrame) -> HeaderRowScores:
+        """
+        Score every candidate header row of ``df`` in one batch.
 
-            scores.append((idx, combined_score))
+        Builds an object matrix of the first ``max_search_rows`` rows plus the three
+        rows used for data validation, with boolean null/text masks, and derives the
+        five features for all rows at once. The results equal the per-row
+        ``_calculate_*`` / ``_validate_data_rows`` helpers.
 
-        # Find the row with the highest score
-        if not scores:
-            return 0, 0.0
+        Args:
+            df: DataFrame with header=None (raw data from Excel)
 
-        best_row, best_score = max(scores, key=lambda x: x[1])
+        Returns:
+            HeaderRowScores with one entry per candidate row
+        """
+        candidates = min(len(df), self.max_search_rows)
+        values = df.iloc[: candidates + 3].to_numpy(dtype=object)
+        rows, width = values.shape
+
+        filled = ~pd.isna(values)
+        text = _is_text(values).astype(bool) & filled
+        filled_count = filled.sum(axis=1)
+        text_count = text.sum(axis=1)
+        has_values = filled_count > 0
+        safe_count = np.maximum(filled_count, 1)
+
+        density = filled_count / width if width else np.zeros(rows)
+        text_score = np.where(has_values, text_count / safe_count, 0.0)
+
+        # Distinct values per row: factorize once (same equality as Series.unique),
+        # then count the code changes of each sorted row
+        codes, _ = pd.factorize(values.ravel())
+        codes = np.sort(np.where(filled, codes.reshape(rows, width), -1), axis=1)
+        changes = (np.diff(codes, axis=1) != 0).sum(axis=1) if width else np.zeros(rows)
+        unique_count = changes + (codes[:, 0] >= 0 if width else 0)
+        uniqueness = np.where(has_values, unique_count / safe_count, 0.0)
+
+        pattern, contained = self._keyword_matcher()
+        keyword_matches = np.zeros(rows)
+        for idx in np.flatnonzero(has_values[:candidates]):
+            row_text = " ".join(str(value).lower() for value in values[idx][filled[idx]])
+            found = set()
+            for keyword in pattern.findall(row_text):
+                found.update(contained[keyword])
+            keyword_matches[idx] = len(found)
+        expected_keywords = np.maximum(1, filled_count // 5)  # 1 keyword per 5 columns
+        keyword_score = np.where(
+            has_values, np.minimum(1.0, keyword_matches / expected_keywords), 0.0
+        )
 
-        return best_row, best_score
+        # Data validation: mean row score of the (up to) three following rows
+        row_score = density * 0.5 + (1 - text_count / safe_count) * 0.5
+        following = np.minimum(3, len(df) - np.arange(rows) - 1)
+        validation_sum = np.zeros(rows)
+        for offset in range(1, 4):
+            shifted = np.zeros(rows)
+            shifted[: max(rows - offset, 0)] = row_score[offset:]
+            validation_sum += np.where(offset <= following, shifted, 0.0)
+        validation = np.where(following > 0, validation_sum / np.maximum(following, 1), 0.0)
+
+        return HeaderRowScores(
+            density=density[:candidates],
+            text=text_score[:candidates],
+            uniqueness=uniqueness[:candidates],
+            keywords=keyword_score[:candidates],
+            validation=validation[:candidates],
+        )
 
     def _calculate_density_score(self, row: pd.Series) -> float:
         """
@@ -445,6 +599,20 @@ class HeaderDetector:
         return header_row, adjusted_confidence
 
 
+def detect_workbook(
+    file_path: str,
+    expected_columns: Optional[List[str]] = None,
+    sheet_names: Optional[Sequence[str]] = None,
+) -> Dict[str, HeaderDetectionResult]:
+    """워크북 전체 시트 헤더 탐지. | Detect headers of every sheet from one open."""
+
+    return HeaderDetector().detect_workbook(
+        file_path,
+        expected_columns=expected_columns,
+        sheet_names=sheet_names,
+    )
+
+
 def detect_header_row(
     file_path: str,
     sheet_name: Optional[str] = None,
@@ -17,8 +17,18 @@ to work reliably regardless of how the header was originally written.
 
 import re
 import unicodedata
+from functools import lru_cache
 from typing import Optional
 
+# Separators removed by ``normalize`` (compiled once for every normalizer)
+SEPARATOR_PATTERN = re.compile(r"[._\-/\\|:;,\s]+")
+# Separators removed by the space-keeping alternative, then the spaces themselves
+_PUNCTUATION_PATTERN = re.compile(r"[._\-/\\|:;,]+")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Distinct header strings kept by the shared normalizer
+DEFAULT_NORMALIZER_CACHE_SIZE = 8192
+
 
 class HeaderNormalizer:
     """
@@ -65,7 +75,7 @@ class HeaderNormalizer:
 
         # Patterns for common separators that should be removed
         # These include punctuation, underscores, hyphens, etc.
-        self.separator_pattern = re.compile(r"[._\-/\\|:;,\s]+")
+        self.separator_pattern = SEPARATOR_PATTERN
 
     def normalize(self, header: str, expand_abbreviations: bool = True) -> str:
         """
@@ -156,8 +166,8 @@ class HeaderNormalizer:
         # Some headers like "Case No" might be better as "caseno" than "casenumber"
         partial = header.lower().strip()
         partial = unicodedata.normalize("NFKC", partial)
-        partial = re.sub(r"[._\-/\\|:;,]+", "", partial)  # Remove separators but keep spaces
-        partial = re.sub(r"\s+", "", partial)  # Then remove spaces
+        partial = _PUNCTUATION_PATTERN.sub("", partial)  # Remove separators but keep spaces
+        partial = _WHITESPACE_PATTERN.sub("", partial)  # Then remove spaces
         partial = self._filter_letters_and_numbers(partial)
         if partial not in alternatives:
             alternatives.append(partial)
@@ -174,6 +184,82 @@ class HeaderNormalizer:
         return "".join(ch for ch in value if unicodedata.category(ch)[0] in {"L", "N"})
 
 
+class CachedHeaderNormalizer(HeaderNormalizer):
+    """
+    Header normalizer that memoizes its results in a bounded LRU cache.
+
+    Pipeline stages normalize the same few hundred header strings thousands of
+    times per run; this subclass computes each distinct (header, option) pair
+    once. Results are identical to ``HeaderNormalizer``. The cache assumes the
+    abbreviation map is not changed after construction (call ``cache_clear``
+    if it is).
+
+    Examples:
+        >>> normalizer = CachedHeaderNormalizer(maxsize=1024)
+        >>> normalizer.normalize("Case No.")
+        'casenumber'
+        >>> normalizer.cache_info().hits
+        0
+    """
+
+    def __init__(self, maxsize: Optional[int] = DEFAULT_NORMALIZER_CACHE_SIZE):
+        """
+        Initialize the normalizer and its caches.
+
+        Args:
+            maxsize: Distinct entries kept per cache (None = unbounded)
+        """
+        super().__init__()
+        self._normalize_cached = lru_cache(maxsize=maxsize, typed=True)(super().normalize)
+        self._alternatives_cached = lru_cache(maxsize=maxsize, typed=True)(self._alternatives_tuple)
+
+    def _alternatives_tuple(self, header: str) -> tuple:
+        """Uncached alternatives as an immutable tuple (safe to share from the cache)."""
+        return tuple(super().normalize_with_alternatives(header))
+
+    def normalize(self, header: str, expand_abbreviations: bool = True) -> str:
+        """Cached ``HeaderNormalizer.normalize``."""
+        try:
+            return self._normalize_cached(header, expand_abbreviations)
+        except TypeError:  # unhashable header
+            return super().normalize(header, expand_abbreviations)
+
+    def normalize_with_alternatives(self, header: str) -> list[str]:
+        """Cached ``HeaderNormalizer.normalize_with_alternatives`` (a new list per call)."""
+        try:
+            return list(self._alternatives_cached(header))
+        except TypeError:  # unhashable header
+            return super().normalize_with_alternatives(header)
+
+    @property
+    def hits(self) -> int:
+        """Cache hits of both methods."""
+        return (
+            self._normalize_cached.cache_info().hits + self._alternatives_cached.cache_info().hits
+        )
+
+    @property
+    def misses(self) -> int:
+        """Cache misses (actual normalizations) of both methods."""
+        return (
+            self._normalize_cached.cache_info().misses
+            + self._alternatives_cached.cache_info().misses
+        )
+
+    def cache_info(self):
+        """``functools`` statistics of the ``normalize`` cache."""
+        return self._normalize_cached.cache_info()
+
+    def cache_clear(self) -> None:
+        """Drop all cached results (e.g. after editing ``abbreviation_map``)."""
+        self._normalize_cached.cache_clear()
+        self._alternatives_cached.cache_clear()
+
+
+# Process-wide shared normalizer: use this instead of constructing HeaderNormalizer()
+HEADER_NORMALIZER = CachedHeaderNormalizer()
+
+
 def normalize_header(header: str, expand_abbreviations: bool = True) -> str:
     """
     Convenience function for quick header normalization.
@@ -194,8 +280,7 @@ def normalize_header(header: str, expand_abbreviations: bool = True) -> str:
         >>> normalize_header("ETA/ATA")
         'etaata'
     """
-    normalizer = HeaderNormalizer()
-    return normalizer.normalize(header, expand_abbreviations)
+    return HEADER_NORMALIZER.normalize(header, expand_abbreviations)
 
 
 if __name__ == "__main__":
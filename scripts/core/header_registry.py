@@ -21,12 +21,46 @@ Semantic Categories:
 - STATUS: Headers indicating current state (Status, Condition, etc.)
 - DESCRIPTION: Headers with textual descriptions
 - DERIVED: Calculated headers added by the pipeline
+
+The definitions are built on first use, not at import. With a snapshot path
+(``$HVDC_REGISTRY_SNAPSHOT``) the normalized alias index of the shared
+normalizer is loaded from a version-stamped marshal file instead of being
+rebuilt in every process.
 """
 
-from typing import Dict, List, Set
+import hashlib
+import logging
+import marshal
+import os
+import sys
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
+from .header_normalizer import HEADER_NORMALIZER, HeaderNormalizer
+
+logger = logging.getLogger(__name__)
+
+# Length of the n-grams in the partial-match candidate index
+ALIAS_NGRAM_SIZE = 3
+
+# Precomputed alias index snapshot (set to reuse it across processes)
+REGISTRY_SNAPSHOT_ENV_VAR = "HVDC_REGISTRY_SNAPSHOT"
+# Bump when the normalizer or AliasIndex.build changes what an index contains
+REGISTRY_SNAPSHOT_VERSION = 1
+
+
+def alias_ngrams(text: str, n: int = ALIAS_NGRAM_SIZE) -> Set[str]:
+    """
+    Character n-grams of a normalized name.
+
+    Two names with a containment or a common prefix of at least ``n`` characters
+    always share one of these n-grams, which makes them a safe candidate filter
+    for partial matching.
+    """
+    return {text[i : i + n] for i in range(len(text) - n + 1)}
+
 
 class HeaderCategory(Enum):
     """
@@ -84,6 +118,81 @@ class HeaderDefinition:
         return normalized_name in [alias.lower().replace(" ", "") for alias in self.aliases]
 
 
+@dataclass(frozen=True)
+class AliasIndex:
+    """
+    Normalized alias variants of every semantic key, with the inverted lookup.
+
+    Built once per registry and normalizer (see ``HeaderRegistry.alias_index``)
+    so matching does not re-normalize the aliases for every key and sheet.
+
+    Attributes:
+        variants: Semantic key → normalized alias variants, in preference order
+        by_variant: Normalized variant → {semantic key: rank of the variant for that key}
+        ngrams: Semantic key → n-grams of all its variants
+        short_variants: Semantic key → its non-empty variants shorter than the
+            n-gram size (matched by substring test instead of n-grams)
+    """
+
+    variants: Dict[str, Tuple[str, ...]]
+    by_variant: Dict[str, Dict[str, int]]
+    ngrams: Dict[str, FrozenSet[str]]
+    short_variants: Dict[str, Tuple[str, ...]]
+
+    @classmethod
+    def build(cls, definitions: Dict[str, HeaderDefinition], normalizer) -> "AliasIndex":
+        """
+        Normalize all aliases once and invert them.
+
+        Args:
+            definitions: Semantic key → definition (registry order)
+            normalizer: Object with ``normalize_with_alternatives``
+
+        Returns:
+            The index
+        """
+        variants: Dict[str, Tuple[str, ...]] = {}
+        by_variant: Dict[str, Dict[str, int]] = {}
+        ngrams: Dict[str, FrozenSet[str]] = {}
+        short_variants: Dict[str, Tuple[str, ...]] = {}
+
+        for key, definition in definitions.items():
+            normalized = []
+            for alias in definition.aliases:
+                normalized.extend(normalizer.normalize_with_alternatives(alias))
+            # Remove duplicates while preserving order
+            ordered = tuple(dict.fromkeys(normalized))
+
+            variants[key] = ordered
+            for rank, variant in enumerate(ordered):
+                by_variant.setdefault(variant, {})[key] = rank
+            ngrams[key] = frozenset().union(*(alias_ngrams(v) for v in ordered))
+            short = tuple(v for v in ordered if 0 < len(v) < ALIAS_NGRAM_SIZE)
+            if short:
+                short_variants[key] = short
+
+        return cls(variants, by_variant, ngrams, short_variants)
+
+    def to_payload(self) -> Dict[str, dict]:
+        """Fields as plain dicts/tuples/frozensets (``marshal``-able)."""
+        return {
+            "variants": self.variants,
+            "by_variant": self.by_variant,
+            "ngrams": self.ngrams,
+            "short_variants": self.short_variants,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, dict]) -> "AliasIndex":
+        """Rebuild an index from ``to_payload`` output."""
+        return cls(
+            payload["variants"],
+            payload["by_variant"],
+            payload["ngrams"],
+            payload["short_variants"],
+        )
+
+
 class HeaderRegistry:
     """
     Central registry of all header definitions used in the HVDC pipeline.
@@ -97,18 +206,35 @@ class HeaderRegistry:
     - Category filtering (get all temporal headers)
     - Alias expansion (find all ways a header could be written)
     - Validation (check if required headers are present)
+
+    Definitions are built on first access of ``definitions``, so creating a
+    registry (and importing this module) costs nothing until a lookup.
     """
 
-    def __init__(self):
+    def __init__(self, snapshot_path: Optional[Union[str, Path]] = None):
         """
         Initialize the registry with all HVDC pipeline header definitions.
 
-        This constructor builds the complete registry of headers. Each header
+        The definitions themselves are built lazily on first use. Each header
         is defined with its semantic meaning, possible variations, and metadata
         that helps with matching and validation.
+
+        Args:
+            snapshot_path: Alias index snapshot file. When set, ``alias_index``
+                loads a matching snapshot instead of building the index, and
+                writes a new one after building.
         """
-        self.definitions: Dict[str, HeaderDefinition] = {}
-        self._initialize_definitions()
+        self._definitions: Optional[Dict[str, HeaderDefinition]] = None
+        self._alias_indexes: Dict[tuple, AliasIndex] = {}
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+
+    @property
+    def definitions(self) -> Dict[str, HeaderDefinition]:
+        """Semantic key → definition (built on first access)."""
+        if self._definitions is None:
+            self._definitions = {}
+            self._initialize_definitions()
+        return self._definitions
 
     def _initialize_definitions(self):
         """
@@ -709,6 +835,7 @@ class HeaderRegistry:
             definition: The header definition to register
         """
         self.definitions[definition.semantic_key] = definition
+        self._alias_indexes.clear()
 
     def get_definition(self, semantic_key: str) -> HeaderDefinition:
         """
@@ -859,6 +986,137 @@ class HeaderRegistry:
         else:
             return [h.semantic_key for h in all_date_headers]
 
+    @staticmethod
+    def _normalizer_key(normalizer) -> tuple:
+        """Alias index cache key: normalizer type and abbreviation map."""
+        return (
+            type(normalizer),
+            tuple(sorted(getattr(normalizer, "abbreviation_map", {}).items())),
+        )
+
+    def snapshot_fingerprint(self, normalizer: Optional[HeaderNormalizer] = None) -> str:
+        """
+        Version stamp of the alias index for the current definitions.
+
+        Covers the snapshot format version, the Python version (``marshal``
+        format), the n-gram size, the normalizer key and every alias, so a
+        snapshot is only reused when it would equal a freshly built index.
+        """
+        normalizer = normalizer or HEADER_NORMALIZER
+        normalizer_type, abbreviations = self._normalizer_key(normalizer)
+        stamp = (
+            REGISTRY_SNAPSHOT_VERSION,
+            sys.version_info[:2],
+            ALIAS_NGRAM_SIZE,
+            f"{normalizer_type.__module__}.{normalizer_type.__qualname__}",
+            abbreviations,
+            [(key, tuple(d.aliases)) for key, d in self.definitions.items()],
+        )
+        return hashlib.sha1(repr(stamp).encode("utf-8")).hexdigest()
+
+    def save_snapshot(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        normalizer: Optional[HeaderNormalizer] = None,
+    ) -> Optional[Path]:
+        """
+        Write the alias index of ``normalizer`` as a version-stamped marshal file.
+
+        Args:
+            path: Target file (defaults to ``snapshot_path``)
+            normalizer: Normalizer of the index (defaults to the shared one)
+
+        Returns:
+            The written path, or None when there is no path or the write failed
+        """
+        path = Path(path) if path else self.snapshot_path
+        if path is None:
+            return None
+        normalizer = normalizer or HEADER_NORMALIZER
+        payload = {
+            "version": REGISTRY_SNAPSHOT_VERSION,
+            "fingerprint": self.snapshot_fingerprint(normalizer),
+            "alias_index": self.alias_index(normalizer).to_payload(),
+        }
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(marshal.dumps(payload))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write registry snapshot {path}: {e}")
+            return None
+        return path
+
+    def load_snapshot(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        normalizer: Optional[HeaderNormalizer] = None,
+    ) -> bool:
+        """
+        Load the alias index of ``normalizer`` from a snapshot file.
+
+        Args:
+            path: Snapshot file (defaults to ``snapshot_path``)
+            normalizer: Normalizer the snapshot was written for (defaults to the shared one)
+
+        Returns:
+            True if the snapshot matched the current definitions and was loaded
+        """
+        path = Path(path) if path else self.snapshot_path
+        if path is None or not path.exists():
+            return False
+        normalizer = normalizer or HEADER_NORMALIZER
+        try:
+            payload = marshal.loads(path.read_bytes())
+            stale = (
+                payload["version"] != REGISTRY_SNAPSHOT_VERSION
+                or payload["fingerprint"] != self.snapshot_fingerprint(normalizer)
+            )
+            index = None if stale else AliasIndex.from_payload(payload["alias_index"])
+        except (OSError, EOFError, ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable registry snapshot {path}: {e}")
+            return False
+        if index is None:
+            logger.info(f"Registry snapshot {path} is stale; rebuilding the alias index")
+            return False
+        self._alias_indexes[self._normalizer_key(normalizer)] = index
+        return True
+
+    def alias_index(self, normalizer: Optional[HeaderNormalizer] = None) -> AliasIndex:
+        """
+        Get the inverted alias index for a normalizer (built once, then cached).
+
+        The cache is keyed by the normalizer's type and abbreviation map and is
+        dropped whenever a definition is registered. With a ``snapshot_path`` the
+        shared normalizer's index is first looked up in the snapshot, and written
+        there after a build.
+
+        Args:
+            normalizer: Normalizer used for the alias variants (defaults to the shared one)
+
+        Returns:
+            The ``AliasIndex`` of all registered definitions
+        """
+        normalizer = normalizer or HEADER_NORMALIZER
+        cache_key = self._normalizer_key(normalizer)
+        index = self._alias_indexes.get(cache_key)
+        if index is not None:
+            return index
+
+        # The snapshot holds the index of the shared normalizer only
+        use_snapshot = self.snapshot_path is not None and cache_key == self._normalizer_key(
+            HEADER_NORMALIZER
+        )
+        if use_snapshot and self.load_snapshot(normalizer=normalizer):
+            return self._alias_indexes[cache_key]
+
+        index = AliasIndex.build(self.definitions, normalizer)
+        self._alias_indexes[cache_key] = index
+        if use_snapshot:
+            self.save_snapshot(normalizer=normalizer)
+        return index
+
     def get_all_semantic_keys(self) -> List[str]:
         """
         Get all registered semantic keys.
@@ -870,7 +1128,10 @@ class HeaderRegistry:
 
 
 # Global registry instance that all pipeline stages can import and use
-HVDC_HEADER_REGISTRY = HeaderRegistry()
+# (built lazily; ``$HVDC_REGISTRY_SNAPSHOT`` enables the alias index snapshot)
+HVDC_HEADER_REGISTRY = HeaderRegistry(
+    snapshot_path=os.environ.get(REGISTRY_SNAPSHOT_ENV_VAR) or None
+)
 
 
 if __name__ == "__main__":
@@ -6,13 +6,19 @@ import re
 import unicodedata
 from dataclasses import dataclass
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Optional, Sequence, Tuple
 
-from .header_normalizer import HeaderNormalizer
+from .header_normalizer import HEADER_NORMALIZER, HeaderNormalizer
 
 Kind = str
 
+# 정규화 결과 캐시 크기 / Distinct (value, kind) pairs kept per resolver
+DEFAULT_RESOLVER_CACHE_SIZE = 4096
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
 
 @dataclass(frozen=True)
 class MatchResult:
@@ -25,17 +31,34 @@ class MatchResult:
 class FlexibleNameResolver:
     """헤더/파일/시트명 유연 매칭 / Flexible resolver for header, file, sheet names."""
 
-    def __init__(self, normalizer: Optional[HeaderNormalizer] = None) -> None:
-        """정규화 엔진 설정 / Configure optional header normalizer."""
+    def __init__(
+        self,
+        normalizer: Optional[HeaderNormalizer] = None,
+        maxsize: Optional[int] = DEFAULT_RESOLVER_CACHE_SIZE,
+    ) -> None:
+        """정규화 엔진 설정 / Configure the header normalizer (shared cached one by default)."""
 
-        self._normalizer = normalizer or HeaderNormalizer()
+        self._normalizer = normalizer or HEADER_NORMALIZER
+        self._normalize_cached = lru_cache(maxsize=maxsize)(self._normalize_text)
 
     def normalize(self, value: str, kind: Kind) -> str:
-        """값 정규화 / Normalize raw value by kind."""
+        """값 정규화 (LRU 캐시) / Normalize raw value by kind, memoized per (text, kind)."""
 
         text = str(value or "").strip()
         if not text:
             return ""
+        return self._normalize_cached(text, kind)
+
+    def cache_info(self):
+        """캐시 적중/미스 통계 / ``functools`` statistics of the normalize cache."""
+
+        return self._normalize_cached.cache_info()
+
+    def cache_clear(self) -> None:
+        self._normalize_cached.cache_clear()
+
+    def _normalize_text(self, text: str, kind: Kind) -> str:
+        """정규화 본체 / Uncached normalization of stripped, non-empty text."""
 
         normalized = unicodedata.normalize("NFKC", text)
 
@@ -104,7 +127,7 @@ class FlexibleNameResolver:
 
         cleaned = value.replace("_", " ").replace("-", " ")
         filtered = self._filter_letters_numbers_and_space(cleaned, keep_spaces=True)
-        return re.sub(r"\s+", " ", filtered).strip().lower()
+        return _WHITESPACE_PATTERN.sub(" ", filtered).strip().lower()
 
     def _normalize_generic(self, value: str) -> str:
         """일반 정규화 / Generic normalization for non-specific kinds."""
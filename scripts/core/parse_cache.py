@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Distinct-Value Parse Cache
+==========================
+
+텍스트 컬럼을 고유값 단위로 한 번만 파싱하고 결과를 코드로 되돌려 배치합니다.
+| Parse each distinct value of a text column once and broadcast back by code.
+
+- ``DistinctValueParser.map`` factorizes a column, parses only its distinct
+  values and indexes the results with the factor codes (a few hundred parses
+  instead of one per row).
+- Parsed values sit in a bounded LRU cache on the parser instance. The shared
+  parsers below are module-level, so Stage 2 and Stage 3 reuse each other's
+  results when they run in the same process.
+- Missing values (None/NaN/NaT) are not cached: every missing cell maps to
+  ``parse(None)``.
+
+Examples:
+    >>> STACK_STATUS_PARSER.map(df["Stack"])      # == df["Stack"].apply(parse_stack_status)
+    >>> STACK_STATUS_PARSER.cache_info().hits
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from .data_parser import parse_stack_status
+
+# Distinct values kept per parser (Stack columns hold a few hundred)
+DEFAULT_CACHE_SIZE = 4096
+
+# Columns whose values pandas factorizes without merging 1 / 1.0 / True
+_FACTORIZE_KINDS = ("string", "empty", "integer", "floating")
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (pd.api.types.is_scalar(value) and bool(pd.isna(value)))
+
+
+class DistinctValueParser:
+    """
+    고유값 파싱 + LRU 캐시 / Memoized parser for repeated cell values.
+
+    Example:
+        >>> parser = DistinctValueParser(parse_stack_status)
+        >>> parser("X2")                     # parsed once, then served from the cache
+        >>> parser.map(df["Stack"])          # one parse per distinct value
+    """
+
+    def __init__(
+        self,
+        parse: Callable[[Any], Any],
+        maxsize: Optional[int] = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        self.parse = parse
+        self._cached = lru_cache(maxsize=maxsize, typed=True)(parse)
+
+    def __call__(self, value: Any) -> Any:
+        """단일 값 파싱 / Parse one value through the cache."""
+
+        if _is_missing(value):
+            return self.parse(None)
+        try:
+            return self._cached(value)
+        except TypeError:  # unhashable cell (list, dict)
+            return self.parse(value)
+
+    def map(self, values: Iterable[Any]) -> pd.Series:
+        """
+        컬럼 일괄 파싱 / Parse a column, one call per distinct value.
+
+        Args:
+            values: Series (index kept) or any iterable of cells
+
+        Returns:
+            Series with the same values and dtype inference as ``values.apply(parse)``
+        """
+        series = values if isinstance(values, pd.Series) else pd.Series(list(values), dtype=object)
+        if series.empty:
+            return series.apply(self.parse)
+
+        if pd.api.types.infer_dtype(series, skipna=True) in _FACTORIZE_KINDS:
+            codes, uniques = pd.factorize(series, use_na_sentinel=True)
+            # code -1 (missing) picks the trailing parse(None) entry
+            parsed = np.empty(len(uniques) + 1, dtype=object)
+            parsed[:] = [self(value) for value in uniques] + [self.parse(None)]
+            results = parsed[codes]
+        else:
+            results = np.empty(len(series), dtype=object)
+            results[:] = [self(value) for value in series]
+
+        # Built from a list so int/None results infer like Series.apply (float64 + NaN)
+        return pd.Series(results.tolist(), index=series.index)
+
+    def cache_info(self):
+        """LRU 적중/미스 통계 / ``functools`` cache statistics."""
+
+        return self._cached.cache_info()
+
+    def cache_clear(self) -> None:
+        self._cached.cache_clear()
+
+
+# Shared parsers (one cache per run)
+STACK_STATUS_PARSER = DistinctValueParser(parse_stack_status)
@@ -31,8 +31,14 @@ import numpy as np
 from typing import Dict, List, Optional, Tuple, Set
 from dataclasses import dataclass, field
 
-from .header_normalizer import HeaderNormalizer
-from .header_registry import HVDC_HEADER_REGISTRY, HeaderDefinition
+from .header_normalizer import HEADER_NORMALIZER
+from .header_registry import (
+    ALIAS_NGRAM_SIZE,
+    HVDC_HEADER_REGISTRY,
+    AliasIndex,
+    HeaderDefinition,
+    alias_ngrams,
+)
 
 
 @dataclass
@@ -206,12 +212,12 @@ class SemanticMatcher:
 
         Args:
             registry: Header registry to use (defaults to HVDC_HEADER_REGISTRY)
-            normalizer: Header normalizer to use (defaults to new instance)
+            normalizer: Header normalizer to use (defaults to the shared cached one)
             min_confidence: Minimum confidence score to accept a match (0-1)
             allow_partial: Whether to allow partial matching as fallback
         """
         self.registry = registry or HVDC_HEADER_REGISTRY
-        self.normalizer = normalizer or HeaderNormalizer()
+        self.normalizer = normalizer or HEADER_NORMALIZER
         self.min_confidence = min_confidence
         self.allow_partial = allow_partial
 
@@ -256,6 +262,12 @@ class SemanticMatcher:
         # Normalize all DataFrame column names once for efficiency
         normalized_columns = self._normalize_dataframe_columns(df)
 
+        # Exact matches come from the registry's inverted alias index (one lookup
+        # per column variant); partial matching is narrowed by column n-grams
+        index = self.registry.alias_index(self.normalizer)
+        exact_hits = self._exact_hits(normalized_columns, index)
+        column_grams = self._column_ngrams(normalized_columns)
+
         # Attempt to match each semantic key
         results = []
         matched_columns = set()
@@ -263,7 +275,13 @@ class SemanticMatcher:
         for key in semantic_keys:
             try:
                 result = self._match_single_key(
-                    key, df.columns.tolist(), normalized_columns, matched_columns
+                    key,
+                    df.columns.tolist(),
+                    normalized_columns,
+                    matched_columns,
+                    index=index,
+                    exact_hits=exact_hits,
+                    column_grams=column_grams,
                 )
                 results.append(result)
 
@@ -352,12 +370,79 @@ class SemanticMatcher:
 
         return mapping
 
+    def _exact_hits(
+        self, normalized_columns: Dict[str, str], index: AliasIndex
+    ) -> Dict[str, List[Tuple[int, str]]]:
+        """
+        Invert the column variants through the alias index.
+
+        Args:
+            normalized_columns: Mapping of normalized to original names
+            index: The registry's alias index
+
+        Returns:
+            Dict mapping semantic keys to (alias rank, normalized column) pairs,
+            sorted by rank (the order the aliases would be tried in)
+        """
+        hits: Dict[str, List[Tuple[int, str]]] = {}
+        for norm_col in normalized_columns:
+            for key, rank in index.by_variant.get(norm_col, {}).items():
+                hits.setdefault(key, []).append((rank, norm_col))
+        for pairs in hits.values():
+            pairs.sort()
+        return hits
+
+    def _column_ngrams(
+        self, normalized_columns: Dict[str, str]
+    ) -> Tuple[Dict[str, Set[str]], Set[str]]:
+        """
+        Build the n-gram candidate index of the normalized column names.
+
+        Args:
+            normalized_columns: Mapping of normalized to original names
+
+        Returns:
+            (n-gram → normalized columns containing it, columns shorter than the n-gram)
+        """
+        grams: Dict[str, Set[str]] = {}
+        short: Set[str] = set()
+        for norm_col in normalized_columns:
+            if len(norm_col) < ALIAS_NGRAM_SIZE:
+                short.add(norm_col)
+            for gram in alias_ngrams(norm_col):
+                grams.setdefault(gram, set()).add(norm_col)
+        return grams, short
+
+    def _partial_candidates(
+        self,
+        semantic_key: str,
+        index: AliasIndex,
+        normalized_columns: Dict[str, str],
+        column_grams: Tuple[Dict[str, Set[str]], Set[str]],
+    ) -> Set[str]:
+        """
+        Normalized columns that can score above zero against a key's aliases.
+
+        Containment and a common prefix of ``ALIAS_NGRAM_SIZE`` characters both
+        imply a shared n-gram; names shorter than that are checked directly.
+        """
+        grams, short_columns = column_grams
+        candidates = set(short_columns)
+        for gram in index.ngrams.get(semantic_key, ()):
+            candidates.update(grams.get(gram, ()))
+        for variant in index.short_variants.get(semantic_key, ()):
+            candidates.update(col for col in normalized_columns if variant in col)
+        return candidates
+
     def _match_single_key(
         self,
         semantic_key: str,
         actual_columns: List[str],
         normalized_columns: Dict[str, str],
         already_matched: Set[str],
+        index: Optional[AliasIndex] = None,
+        exact_hits: Optional[Dict[str, List[Tuple[int, str]]]] = None,
+        column_grams: Optional[Tuple[Dict[str, Set[str]], Set[str]]] = None,
     ) -> MatchResult:
         """
         Attempt to match a single semantic key to a column.
@@ -372,43 +457,50 @@ class SemanticMatcher:
             actual_columns: List of actual column names in the DataFrame
             normalized_columns: Mapping of normalized to original names
             already_matched: Set of columns already matched (to avoid duplicates)
+            index: Registry alias index (looked up when omitted)
+            exact_hits: ``_exact_hits`` of the columns (computed when omitted)
+            column_grams: ``_column_ngrams`` of the columns (computed when omitted)
 
         Returns:
             A MatchResult describing what was found
         """
         result = MatchResult(semantic_key=semantic_key)
 
-        # Get the definition for this semantic key
-        definition = self.registry.get_definition(semantic_key)
-
-        # Normalize all aliases for this semantic key
-        normalized_aliases = []
-        for alias in definition.aliases:
-            alternatives = self.normalizer.normalize_with_alternatives(alias)
-            normalized_aliases.extend(alternatives)
+        # Unknown keys raise KeyError (callers skip them)
+        self.registry.get_definition(semantic_key)
 
-        # Remove duplicates while preserving order
-        normalized_aliases = list(dict.fromkeys(normalized_aliases))
+        # Aliases of this key, normalized once per process by the registry
+        if index is None:
+            index = self.registry.alias_index(self.normalizer)
+        normalized_aliases = list(index.variants[semantic_key])
+        if exact_hits is None:
+            exact_hits = self._exact_hits(normalized_columns, index)
 
-        # Strategy 1: Try exact matching
-        for norm_alias in normalized_aliases:
-            if norm_alias in normalized_columns:
-                original_col = normalized_columns[norm_alias]
+        # Strategy 1: Try exact matching (column variants equal to an alias, by alias order)
+        for _, norm_alias in exact_hits.get(semantic_key, ()):
+            original_col = normalized_columns[norm_alias]
 
-                # Skip if this column was already matched to another semantic key
-                if original_col in already_matched:
-                    continue
+            # Skip if this column was already matched to another semantic key
+            if original_col in already_matched:
+                continue
 
-                result.matched = True
-                result.column_name = original_col
-                result.confidence = 1.0
-                result.match_type = "exact"
-                return result
+            result.matched = True
+            result.column_name = original_col
+            result.confidence = 1.0
+            result.match_type = "exact"
+            return result
 
         # Strategy 2: Try partial matching (if enabled)
         if self.allow_partial:
+            if column_grams is None:
+                column_grams = self._column_ngrams(normalized_columns)
             partial_matches = self._find_partial_matches(
-                normalized_aliases, normalized_columns, already_matched
+                normalized_aliases,
+                normalized_columns,
+                already_matched,
+                candidates=self._partial_candidates(
+                    semantic_key, index, normalized_columns, column_grams
+                ),
             )
 
             if partial_matches:
@@ -438,6 +530,7 @@ class SemanticMatcher:
         normalized_aliases: List[str],
         normalized_columns: Dict[str, str],
         already_matched: Set[str],
+        candidates: Optional[Set[str]] = None,
     ) -> List[Tuple[str, float]]:
         """
         Find columns that partially match the aliases.
@@ -450,6 +543,8 @@ class SemanticMatcher:
             normalized_aliases: List of normalized alias variations
             normalized_columns: Mapping of normalized to original names
             already_matched: Columns to exclude
+            candidates: Normalized columns worth scoring (all when None);
+                the others cannot score above zero
 
         Returns:
             List of (normalized_column, score) tuples, sorted by score descending
@@ -460,6 +555,8 @@ class SemanticMatcher:
             # Skip already matched columns
             if original_col in already_matched:
                 continue
+            if candidates is not None and norm_col not in candidates:
+                continue
 
             # Calculate best match score against all aliases
             best_score = 0.0
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Sheet Buffer Module
+===================
+
+시트를 한 번만 읽고 메모리에서 헤더를 다시 지정합니다.
+| Read an Excel sheet once (``header=None``) and re-head it in memory.
+
+``pd.read_excel(header=h)`` parses the whole sheet again for every header
+candidate. ``SheetBuffer`` keeps the raw cell rows of one read and rebuilds
+the same DataFrame for any header row with pandas' own ``TextParser`` (the
+parser ``read_excel`` uses), so dtypes, ``Unnamed: n`` / ``.1`` column names
+and NA handling match a direct ``read_excel`` call.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, List, Optional, Union
+
+import pandas as pd
+from pandas.errors import EmptyDataError
+from pandas.io.parsers import TextParser
+
+from .excel_reader import get_reader
+
+ExcelSource = Union[str, pd.ExcelFile]
+
+
+@dataclass
+class SheetBuffer:
+    """
+    시트 원시 셀 버퍼 / Raw cell rows of one sheet, as returned by the Excel reader.
+
+    Examples:
+        >>> buffer = SheetBuffer.read("data.xlsx", "Case List")
+        >>> preview = buffer.preview(20)      # header=None frame for detection
+        >>> df = buffer.with_header(4)        # == pd.read_excel(..., header=4)
+    """
+
+    sheet_name: str
+    rows: List[List[Any]]
+
+    @classmethod
+    def read(cls, source: ExcelSource, sheet_name: Union[str, int] = 0) -> "SheetBuffer":
+        """
+        시트 1회 읽기 / Read ``sheet_name`` once without header or NA conversion.
+
+        Args:
+            source: Workbook path or an open ``pd.ExcelFile`` (read via ``ExcelReader``)
+            sheet_name: Sheet name or position
+
+        Returns:
+            SheetBuffer holding the cell values (empty cells as ``""``)
+        """
+        raw = get_reader().read(
+            source, sheet_name=sheet_name, header=None, dtype=object, na_filter=False, coerce=False
+        )
+        return cls(sheet_name=str(sheet_name), rows=raw.to_numpy(dtype=object).tolist())
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _rows(self, limit: Optional[int] = None) -> List[List[Any]]:
+        """
+        리더와 같은 행 정리 / Rows as the Excel reader returns them for ``limit`` rows.
+
+        Trailing empty cells and rows are trimmed and rows padded to the widest one,
+        so a partial read has the width ``read_excel(nrows=...)`` would give it.
+        """
+        if limit is None:
+            return [list(row) for row in self.rows]
+
+        data: List[List[Any]] = []
+        for row in self.rows[:limit]:
+            row = list(row)
+            while row and row[-1] == "":
+                row.pop()
+            data.append(row)
+        while data and not data[-1]:
+            data.pop()
+        width = max((len(row) for row in data), default=0)
+        return [row + [""] * (width - len(row)) for row in data]
+
+    def _parse(self, header: Optional[int], nrows: Optional[int] = None) -> pd.DataFrame:
+        """read_excel과 같은 파서 호출 / Run the parser with ``read_excel``'s settings."""
+
+        # read_excel fetches one extra row when header=None and nrows is set
+        data = self._rows(None if header is not None or nrows is None else nrows + 1)
+        if not data:
+            return pd.DataFrame()
+        try:
+            parser = TextParser(
+                data,
+                header=header,
+                nrows=nrows,
+                skip_blank_lines=False,
+            )
+            return parser.read(nrows=nrows)
+        except EmptyDataError:
+            return pd.DataFrame()
+
+    def preview(self, nrows: int) -> pd.DataFrame:
+        """
+        탐지용 미리보기 / First ``nrows`` rows with ``header=None``.
+
+        Same frame as ``pd.read_excel(path, sheet, header=None, nrows=nrows)``.
+        """
+        return self._parse(header=None, nrows=nrows)
+
+    def with_header(self, header_row: int) -> pd.DataFrame:
+        """
+        헤더 지정 데이터프레임 / DataFrame with ``header_row`` as the header.
+
+        Same frame as ``pd.read_excel(path, sheet, header=header_row)``.
+        """
+        return self._parse(header=header_row)
@@ -11,13 +11,18 @@ Stage 2 및 Stage 3 출력 파일의 컬럼 순서를 통일합니다.
 """
 
 import pandas as pd
-from typing import Optional, List, Dict, Tuple, Set
+from typing import Optional, List, Dict, Tuple, Set, Union
+import hashlib
+import json
 import logging
+import os
 import re
+from dataclasses import dataclass
 from difflib import SequenceMatcher
+from pathlib import Path
 
 # 기존 core 로직 import
-from .header_normalizer import HeaderNormalizer
+from .header_normalizer import HEADER_NORMALIZER
 from .header_registry import HeaderRegistry
 from .semantic_matcher import SemanticMatcher
 
@@ -203,7 +208,7 @@ class FlexibleHeaderMatcher:
 
     def __init__(self):
         """초기화"""
-        self.normalizer = HeaderNormalizer()
+        self.normalizer = HEADER_NORMALIZER
         self.registry = HeaderRegistry()
         self.semantic_matcher = SemanticMatcher()
 
@@ -351,17 +356,247 @@ class FlexibleHeaderMatcher:
         return None
 
 
+# 재정렬 결과 캐시 파일 (설정 시 실행 간 재사용)
+HEADER_ORDER_CACHE_ENV_VAR = "HVDC_HEADER_ORDER_CACHE"
+HEADER_ORDER_CACHE_VERSION = 1
+
+
+def column_signature(columns) -> str:
+    """
+    컬럼 목록 서명 (실행 간 안정적인 해시)
+
+    Python ``hash()``는 프로세스마다 달라지므로 repr 기반 SHA-1을 사용합니다
+    (1 과 "1" 은 서로 다른 서명).
+    """
+    payload = "\x1f".join(repr(c) for c in columns)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _standard_orders_signature() -> str:
+    """표준 순서 정의 서명 (순서가 바뀌면 디스크 캐시 무효화)"""
+    return column_signature(STANDARD_HEADER_ORDER + ["|"] + STAGE2_HEADER_ORDER)
+
+
+def _order_cache_stamp() -> Dict[str, str]:
+    """
+    디스크 캐시 유효성 스탬프
+
+    표준 순서와 헤더 레지스트리(별칭) 지문 - 별칭이 바뀌면 매칭 결과도 달라지므로
+    둘 중 하나라도 다르면 저장된 캐시를 무시합니다.
+    """
+    return {
+        "standard_orders": _standard_orders_signature(),
+        "registry": HVDC_HEADER_REGISTRY.snapshot_fingerprint(),
+    }
+
+
+@dataclass(frozen=True)
+class ColumnOrder:
+    """
+    컬럼 시그니처별 재정렬 결과
+
+    Attributes:
+        mapping: {현재_컬럼: 표준_컬럼}
+        reverse: {표준_컬럼: 현재_컬럼} (O(1) 역방향 조회)
+        order: 재정렬된 컬럼 순서 (``df[order]``)
+        standard_count: 표준 순서로 배치된 컬럼 수
+    """
+
+    mapping: Dict[str, str]
+    reverse: Dict[str, str]
+    order: List[str]
+    standard_count: int
+
+
 class HeaderOrderManager:
     """
     헤더 순서 관리 클래스
 
     기존 core 로직과 유연한 매칭을 활용하여
     헤더 매칭 및 재정렬을 수행합니다.
+
+    재정렬 결과는 (컬럼 시그니처, Stage, keep_unlisted, 의미론적 매칭 여부)별로
+    캐시되어 같은 컬럼 구성에는 매칭을 다시 수행하지 않습니다. ``cache_path``를
+    지정하면 캐시를 JSON으로 저장/로드하여 다음 실행에서도 재사용합니다.
     """
 
-    def __init__(self):
-        """초기화"""
+    def __init__(self, cache_path: Optional[Union[str, Path]] = None):
+        """
+        초기화
+
+        Args:
+            cache_path: 재정렬 캐시 JSON 경로 (있으면 로드, 새 결과마다 저장)
+        """
         self.matcher = FlexibleHeaderMatcher()
+        self._orders: Dict[Tuple[str, bool, bool, bool], ColumnOrder] = {}
+        self.hits = 0
+        self.misses = 0
+        self.cache_path = Path(cache_path) if cache_path else None
+        if self.cache_path is not None:
+            self.load_order_cache(self.cache_path)
+
+    def load_order_cache(self, path: Union[str, Path]) -> int:
+        """
+        디스크의 재정렬 캐시를 로드합니다
+
+        Args:
+            path: ``save_order_cache``로 저장한 JSON 파일
+
+        Returns:
+            로드된 항목 수 (파일이 없거나 버전/표준 순서/레지스트리가 다르면 0)
+        """
+        path = Path(path)
+        if not path.exists():
+            return 0
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"헤더 순서 캐시 로드 실패, 무시: {e}")
+            return 0
+        stamp = _order_cache_stamp()
+        if payload.get("version") != HEADER_ORDER_CACHE_VERSION or any(
+            payload.get(name) != value for name, value in stamp.items()
+        ):
+            logger.info("헤더 순서 캐시 버전/표준 순서/레지스트리 변경 - 캐시 무시")
+            return 0
+
+        loaded = 0
+        for entry in payload.get("entries", []):
+            key = (
+                entry["signature"],
+                entry["is_stage2"],
+                entry["keep_unlisted"],
+                entry["use_semantic_matching"],
+            )
+            mapping = dict(entry["mapping"])
+            self._orders[key] = ColumnOrder(
+                mapping=mapping,
+                reverse=self._reverse_mapping(mapping),
+                order=list(entry["order"]),
+                standard_count=entry["standard_count"],
+            )
+            loaded += 1
+        logger.info(f"헤더 순서 캐시 로드: {loaded}개 ({path})")
+        return loaded
+
+    def save_order_cache(self, path: Optional[Union[str, Path]] = None) -> Optional[Path]:
+        """
+        재정렬 캐시를 JSON으로 저장합니다
+
+        문자열 컬럼명만 있는 항목만 저장합니다 (JSON으로 그대로 복원 가능한 경우).
+        임시 파일에 쓴 뒤 ``os.replace``로 교체하므로 동시에 읽는 프로세스가
+        쓰다 만 파일을 보지 않습니다.
+
+        Args:
+            path: 저장 경로 (기본: ``cache_path``)
+
+        Returns:
+            저장된 경로 (경로가 없거나 저장 실패 시 None)
+        """
+        target = Path(path) if path else self.cache_path
+        if target is None:
+            return None
+
+        entries = []
+        for (signature, is_stage2, keep_unlisted, semantic), cached in self._orders.items():
+            if not all(isinstance(c, str) for c in list(cached.mapping) + cached.order):
+                continue
+            entries.append(
+                {
+                    "signature": signature,
+                    "is_stage2": is_stage2,
+                    "keep_unlisted": keep_unlisted,
+                    "use_semantic_matching": semantic,
+                    "mapping": list(cached.mapping.items()),
+                    "order": cached.order,
+                    "standard_count": cached.standard_count,
+                }
+            )
+        payload = {"version": HEADER_ORDER_CACHE_VERSION, **_order_cache_stamp(), "entries": entries}
+        tmp_path = target.with_name(target.name + ".tmp")
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, target)
+        except OSError as e:
+            logger.warning(f"헤더 순서 캐시 저장 실패: {e}")
+            return None
+        return target
+
+    @staticmethod
+    def _reverse_mapping(mapping: Dict[str, str]) -> Dict[str, str]:
+        """{표준_컬럼: 현재_컬럼} (같은 표준 컬럼이면 먼저 매핑된 컬럼 유지)"""
+        reverse: Dict[str, str] = {}
+        for current_col, std_col in mapping.items():
+            reverse.setdefault(std_col, current_col)
+        return reverse
+
+    def column_order(
+        self,
+        columns: List[str],
+        is_stage2: bool = False,
+        keep_unlisted: bool = True,
+        use_semantic_matching: bool = True,
+    ) -> ColumnOrder:
+        """
+        컬럼 목록의 재정렬 결과 (캐시 사용)
+
+        헤더 매칭은 컬럼명만 사용하므로 결과를 컬럼 시그니처로 캐시합니다.
+
+        Args:
+            columns: 현재 컬럼 리스트
+            is_stage2: Stage 2 출력인 경우 True
+            keep_unlisted: 표준 순서에 없는 컬럼을 끝에 추가할지 여부
+            use_semantic_matching: 의미론적 매칭 사용 여부
+
+        Returns:
+            ``ColumnOrder`` (매핑, 역매핑, 최종 순서)
+        """
+        current_columns = list(columns)
+        key = (
+            column_signature(current_columns),
+            bool(is_stage2),
+            bool(keep_unlisted),
+            bool(use_semantic_matching),
+        )
+        cached = self._orders.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        standard_order = STAGE2_HEADER_ORDER if is_stage2 else STANDARD_HEADER_ORDER
+
+        # 헤더 매칭 (유연한 검색)
+        mapping = self.match_columns_to_standard(
+            current_columns, standard_order, use_semantic_matching=use_semantic_matching
+        )
+        reverse = self._reverse_mapping(mapping)
+
+        # 표준 순서에 맞춰 컬럼 재정렬 (역매핑으로 O(1) 조회)
+        present = set(current_columns)
+        ordered_columns = []
+        for std_col in standard_order:
+            original_col = reverse.get(std_col)
+            if original_col and original_col in present:
+                ordered_columns.append(original_col)
+
+        # 표준 순서에 없는 컬럼 추가 (끝에)
+        remaining_columns = []
+        if keep_unlisted:
+            ordered_set = set(ordered_columns)
+            remaining_columns = [c for c in current_columns if c not in ordered_set]
+
+        cached = ColumnOrder(
+            mapping=mapping,
+            reverse=reverse,
+            order=ordered_columns + remaining_columns,
+            standard_count=len(ordered_columns),
+        )
+        self._orders[key] = cached
+        if self.cache_path is not None:
+            self.save_order_cache()
+        return cached
 
     def match_columns_to_standard(
         self,
@@ -461,35 +696,24 @@ class HeaderOrderManager:
         Returns:
             재정렬된 DataFrame
         """
-        standard_order = STAGE2_HEADER_ORDER if is_stage2 else STANDARD_HEADER_ORDER
         current_columns = list(df.columns)
 
         logger.info(
             f"🔄 헤더 재정렬 시작 ({'Stage 2' if is_stage2 else 'Stage 3'}): {len(current_columns)}개 컬럼"
         )
 
-        # 헤더 매칭 (유연한 검색)
-        mapping = self.match_columns_to_standard(
-            current_columns, standard_order, use_semantic_matching=use_semantic_matching
+        # 헤더 매칭 (유연한 검색, 컬럼 시그니처별 캐시)
+        cached = self.column_order(
+            current_columns,
+            is_stage2=is_stage2,
+            keep_unlisted=keep_unlisted,
+            use_semantic_matching=use_semantic_matching,
         )
-
-        # 표준 순서에 맞춰 컬럼 재정렬
-        ordered_columns = []
-        for std_col in standard_order:
-            # 매핑된 원본 컬럼명 찾기
-            original_col = next((k for k, v in mapping.items() if v == std_col), None)
-            if original_col and original_col in df.columns:
-                ordered_columns.append(original_col)
-
-        # 표준 순서에 없는 컬럼 추가 (끝에)
-        remaining_columns = []
-        if keep_unlisted:
-            remaining_columns = [c for c in current_columns if c not in ordered_columns]
-
-        final_order = ordered_columns + remaining_columns
+        final_order = cached.order
 
         logger.info(
-            f"✅ 헤더 재정렬 완료: {len(ordered_columns)}개 표준 순서, {len(remaining_columns)}개 추가 컬럼"
+            f"✅ 헤더 재정렬 완료: {cached.standard_count}개 표준 순서, "
+            f"{len(final_order) - cached.standard_count}개 추가 컬럼"
         )
 
         return df[final_order]
@@ -529,10 +753,16 @@ _manager = None
 
 
 def get_header_manager() -> HeaderOrderManager:
-    """HeaderOrderManager 싱글톤 인스턴스 반환"""
+    """
+    HeaderOrderManager 싱글톤 인스턴스 반환
+
+    ``$HVDC_HEADER_ORDER_CACHE``가 설정되어 있으면 해당 JSON 파일에 재정렬
+    캐시를 저장/로드하여 실행 간에 매칭을 건너뜁니다.
+    """
     global _manager
     if _manager is None:
-        _manager = HeaderOrderManager()
+        cache_path = os.environ.get(HEADER_ORDER_CACHE_ENV_VAR) or None
+        _manager = HeaderOrderManager(cache_path=cache_path)
     return _manager
 
 
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Stage 1 combined output
+=======================
+
+다중 시트 파일과 합친 단일 시트 파일을 같은 시트 프레임에서 만듭니다.
+| Builds the multi-sheet and merged Stage 1 artifacts from the same sheet frames.
+
+- ``standard_column_order`` / ``reorder_standard``: the 63-column standard order
+  from the shared ``HeaderOrderManager``, which caches it per column signature
+  (sheets of one vendor layout share it).
+- ``build_merged_frame``: the merged sheet is concatenated from column views of
+  the processed sheets, already in standard order, instead of copying every sheet,
+  concatenating all columns and reordering the result.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Mapping, Sequence
+
+import pandas as pd
+
+from scripts.core.standard_header_order import get_header_manager
+
+SOURCE_SHEET_COLUMN = "Source_Sheet"
+
+# Sheets written first in the merged file, in this order
+MERGED_SHEET_PRIORITY = ("Case List, RIL", "HE Local", "HE-0214,0252 (Capacitor)")
+
+
+def standard_column_order(columns: Iterable[str]) -> List[str]:
+    """
+    표준 순서 컬럼 목록. | Columns ``reorder_dataframe_columns`` keeps, in its order.
+
+    Stage 1 output settings (``keep_unlisted=False``, semantic matching); served
+    from the shared manager's signature cache after the first frame of a layout.
+    """
+    cached = get_header_manager().column_order(
+        list(columns), is_stage2=False, keep_unlisted=False, use_semantic_matching=True
+    )
+    return cached.order
+
+
+def reorder_standard(df: pd.DataFrame) -> pd.DataFrame:
+    """표준 순서 재정렬. | ``df`` in Stage 1 standard column order."""
+
+    return df[standard_column_order(df.columns)]
+
+
+def merged_sheet_order(sheet_names: Sequence[str]) -> List[str]:
+    """합친 파일의 시트 순서. | Priority sheets first, then the rest in processing order."""
+
+    order = [name for name in MERGED_SHEET_PRIORITY if name in sheet_names]
+    return order + [name for name in sheet_names if name not in order]
+
+
+def _union_columns(frames: Sequence[pd.DataFrame]) -> List[str]:
+    """시트별 출처 컬럼을 붙인 뒤의 합집합 (concat 순서). | Column union as ``pd.concat`` orders it."""
+
+    columns: Dict[str, None] = {}
+    for df in frames:
+        columns.update(dict.fromkeys(df.columns))
+        if SOURCE_SHEET_COLUMN not in df.columns:
+            columns[SOURCE_SHEET_COLUMN] = None
+    return list(columns)
+
+
+def build_merged_frame(sheets: Mapping[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    합친 단일 시트 프레임. | Merged frame of all sheets, in standard column order.
+
+    Same frame as copying each sheet, setting ``Source_Sheet`` to its sheet name,
+    concatenating in ``merged_sheet_order`` and reordering the result, but only the
+    kept columns are concatenated.
+
+    Args:
+        sheets: ``{sheet name: processed DataFrame}``
+
+    Returns:
+        Merged DataFrame
+    """
+    names = merged_sheet_order(list(sheets))
+    frames = [sheets[name] for name in names]
+    if not frames:
+        return pd.DataFrame()
+
+    final_order = standard_column_order(_union_columns(frames))
+    parts = []
+    for name, df in zip(names, frames):
+        keep = [c for c in final_order if c in df.columns and c != SOURCE_SHEET_COLUMN]
+        parts.append(df[keep].assign(**{SOURCE_SHEET_COLUMN: name}))
+    merged = pd.concat(parts, ignore_index=True, sort=False)
+    return merged[final_order]
@@ -39,10 +39,13 @@ from __future__ import annotations
 
 import os
 import sys
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 import numpy as np
 import pandas as pd
@@ -58,6 +61,7 @@ sys.path.insert(0, str(project_root))
 from scripts.core import (
     HVDC_HEADER_REGISTRY,
     STAGE1_BASE_COLS_ORDER,
+    ChangeLog,
     HeaderCategory,
     HeaderDetectionResult,
     HeaderDetector,
@@ -65,7 +69,31 @@ from scripts.core import (
     SemanticMatcher,
     find_header_by_meaning,
 )
-from scripts.core.standard_header_order import reorder_dataframe_columns
+from scripts.core.case_fingerprint import (
+    CaseDelta,
+    CaseStateStore,
+    classify_cases,
+    fingerprint_rows,
+    schema_signature,
+    write_case_delta,
+)
+from scripts.core.case_index import (
+    CaseKeyIndex,
+    file_stamp,
+    find_case_column,
+    normalize_case_keys,
+    write_case_index_sidecar,
+)
+from scripts.core.change_log import DELTA_COLUMNS
+from scripts.core.excel_reader import open_workbook
+from scripts.core.sheet_buffer import SheetBuffer
+from scripts.core.standard_header_order import get_header_manager
+from scripts.stage1_sync_sorted.combined_output import build_merged_frame, reorder_standard
+from scripts.stage1_sync_sorted.highlight_writer import (
+    HighlightingExcelWriter,
+    excel_engine,
+    plan_highlights,
+)
 
 # ===== Configuration =====
 ORANGE = "FFFFA500"  # Changed date cell (ARGB format) - True ORANGE
@@ -128,6 +156,9 @@ DATE_SEMANTIC_KEYS = [
 
 ALWAYS_OVERWRITE_NONDATE = True
 
+# Update engines for _apply_updates ("loop" = legacy iterrows implementation)
+UPDATE_ENGINES = ("vectorized", "loop")
+
 
 def _to_date(val) -> Optional[pd.Timestamp]:
     """Convert various date formats to pandas Timestamp."""
@@ -141,6 +172,137 @@ def _to_date(val) -> Optional[pd.Timestamp]:
         return None
 
 
+_NAT_DAY = np.datetime64("NaT", "D")
+
+
+def _to_day_array(parsed: pd.Series) -> np.ndarray:
+    """Parsed timestamps → ``datetime64[D]`` (wall-clock date for tz-aware values)."""
+
+    if getattr(parsed.dt, "tz", None) is not None:
+        parsed = parsed.dt.tz_localize(None)
+    return parsed.to_numpy().astype("datetime64[D]")
+
+
+def _parse_day_keys(uniques: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse distinct date cell values into day keys.
+
+    Strings and date/datetime objects are converted in one ``pd.to_datetime`` call per
+    kind (``format="mixed"`` parses every string on its own, like the scalar call);
+    anything else, or a batch that cannot be converted together (mixed time zones),
+    goes through ``_to_date`` one value at a time.
+
+    Returns:
+        Tuple of (is_none, day): ``is_none`` marks values ``_to_date`` maps to None,
+        ``day`` the normalized ``datetime64[D]`` (NaT when unparseable)
+    """
+    n = len(uniques)
+    is_none = np.zeros(n, dtype=bool)
+    day = np.full(n, _NAT_DAY, dtype="datetime64[D]")
+
+    is_text = np.fromiter((isinstance(u, str) for u in uniques), dtype=bool, count=n)
+    is_datetime = np.fromiter(
+        (isinstance(u, (datetime, date, np.datetime64)) for u in uniques), dtype=bool, count=n
+    )
+    scalar = ~(is_text | is_datetime)
+    for mask, fmt in ((is_text, "mixed"), (is_datetime, None)):
+        if not mask.any():
+            continue
+        try:
+            parsed = pd.to_datetime(
+                pd.Series(uniques[mask], dtype=object), errors="coerce", format=fmt
+            )
+            day[mask] = _to_day_array(parsed)
+        except (ValueError, TypeError, OverflowError):
+            scalar |= mask
+
+    for i in np.flatnonzero(scalar):
+        ts = _to_date(uniques[i])
+        if ts is None:
+            is_none[i] = True
+        elif not pd.isna(ts):
+            if ts.tzinfo is not None:
+                ts = ts.tz_localize(None)
+            day[i] = ts.to_datetime64().astype("datetime64[D]")
+    return is_none, day
+
+
+def _date_day_keys(values: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Column-wise counterpart of ``_to_date(val).normalize()``.
+
+    ``datetime64`` columns are truncated to days directly; other columns are
+    factorized so each distinct value is parsed once (see ``_parse_day_keys``).
+
+    Returns:
+        Tuple of (is_none, day): ``is_none`` marks cells that ``_to_date`` maps to
+        None (None / float NaN / values it cannot convert); ``day`` holds the
+        normalized date as ``datetime64[D]`` with NaT for unparseable or missing values.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        return np.zeros(len(values), dtype=bool), _to_day_array(values)
+
+    arr = values.to_numpy(dtype=object)
+    codes, uniques = pd.factorize(arr)
+    uniq_none, uniq_days = _parse_day_keys(np.asarray(uniques, dtype=object))
+
+    has_code = codes >= 0
+    day = np.full(len(arr), _NAT_DAY, dtype="datetime64[D]")
+    day[has_code] = uniq_days[codes[has_code]]
+
+    is_none = np.zeros(len(arr), dtype=bool)
+    is_none[has_code] = uniq_none[codes[has_code]]
+    na_pos = np.flatnonzero(~has_code)
+    is_none[na_pos] = [v is None or isinstance(v, float) for v in arr[na_pos]]
+    return is_none, day
+
+
+def _dates_equal_arrays(
+    a_none: np.ndarray, a_day: np.ndarray, b_none: np.ndarray, b_day: np.ndarray
+) -> np.ndarray:
+    """Element-wise ``DataSynchronizerV30._dates_equal`` over precomputed day keys."""
+    a_nat = np.isnat(a_day)
+    b_nat = np.isnat(b_day)
+    both_valid = ~a_nat & ~b_nat & (a_day == b_day)
+    return (a_none & b_none) | (~a_none & ~b_none & ((a_nat & b_nat) | both_valid))
+
+
+class DateKeyCache:
+    """
+    Normalized date keys per column, computed once per frame.
+
+    Date comparisons in the vectorized engine read slices of these arrays instead of
+    parsing cells again. Writes copy the source keys along with the values, so the
+    cache stays in step with the frame; any other write to a column drops its keys.
+    """
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        self.frame = frame
+        self._keys: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def keys(self, column: str) -> Tuple[np.ndarray, np.ndarray]:
+        """(is_none, day) arrays of ``column`` aligned with the frame rows."""
+
+        if column not in self._keys:
+            self._keys[column] = _date_day_keys(self.frame[column])
+        return self._keys[column]
+
+    def assign(
+        self, column: str, positions: np.ndarray, is_none: np.ndarray, day: np.ndarray
+    ) -> None:
+        """Record that ``positions`` of ``column`` now hold values with these keys."""
+
+        if column in self._keys:
+            cached_none, cached_day = self._keys[column]
+            cached_none[positions] = is_none
+            cached_day[positions] = day
+
+    def invalidate(self, column: str) -> None:
+        """Forget ``column`` (recomputed on the next lookup)."""
+
+        self._keys.pop(column, None)
+
+
 @dataclass
 class Change:
     """Record of a single cell change."""
@@ -156,12 +318,35 @@ class Change:
 
 @dataclass
 class ChangeTracker:
-    """Tracks all changes made during synchronization."""
+    """Tracks all changes made during synchronization.
+
+    Changes are stored in a columnar ``ChangeLog``; ``changes`` materializes
+    ``Change`` objects on demand for callers that still iterate records.
+    """
 
-    changes: List[Change] = field(default_factory=list)
+    log: ChangeLog = field(default_factory=ChangeLog)
     new_cases: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     semantic_to_column: Dict[str, str] = field(default_factory=dict)  # ✅ Phase 2: Mapping storage
 
+    @property
+    def changes(self) -> List[Change]:
+        """Change records (built from the columnar log on each access)."""
+        return [
+            Change(
+                row_index=row,
+                column_name=column,
+                old_value=old,
+                new_value=new,
+                change_type=kind,
+                semantic_key=key,
+                case_no=case,
+            )
+            for row, column, old, new, kind, key, case in self.log.iter_records()
+        ]
+
+    def __len__(self) -> int:
+        return len(self.log)
+
     def set_column_mapping(self, semantic_key: str, column_name: str):
         """✅ Phase 2: Store semantic key → actual column name mapping"""
         if semantic_key and column_name:
@@ -173,16 +358,26 @@ class ChangeTracker:
 
     def add_change(self, **kw):
         """Add a change record."""
-        self.changes.append(
-            Change(
-                row_index=int(kw.get("row_index", -1)),
-                column_name=str(kw.get("column_name", "")),
-                old_value=kw.get("old_value"),
-                new_value=kw.get("new_value"),
-                change_type=str(kw.get("change_type", "field_update")),
-                semantic_key=str(kw.get("semantic_key", "")),  # ✅ Phase 2: Include semantic_key
-                case_no=str(kw.get("case_no", "")),  # ✅ Phase 4: Include case_no
-            )
+        self.log.append(
+            row_index=int(kw.get("row_index", -1)),
+            column_name=str(kw.get("column_name", "")),
+            old_value=kw.get("old_value"),
+            new_value=kw.get("new_value"),
+            change_type=str(kw.get("change_type", "field_update")),
+            semantic_key=str(kw.get("semantic_key", "")),  # ✅ Phase 2: Include semantic_key
+            case_no=str(kw.get("case_no", "")),  # ✅ Phase 4: Include case_no
+        )
+
+    def add_changes(self, **kw):
+        """Add many change records at once (array fields, see ``ChangeLog.extend``)."""
+        self.log.extend(
+            row_index=kw["row_index"],
+            column_name=kw.get("column_name", ""),
+            change_type=kw.get("change_type", "field_update"),
+            semantic_key=kw.get("semantic_key", ""),
+            case_no=kw.get("case_no", ""),
+            old_values=kw.get("old_values"),
+            new_values=kw.get("new_values"),
         )
 
     def log_new_case(self, case_no: str, row_data: Dict[str, Any], row_index: Optional[int] = None):
@@ -197,6 +392,67 @@ class ChangeTracker:
                 change_type="new_record",
             )
 
+    def export(self, path: str) -> Path:
+        """Write the change log as a Parquet/CSV audit file (by suffix)."""
+        return self.log.export(path)
+
+
+@dataclass
+class NewCaseBuffer:
+    """
+    신규 케이스 추가 버퍼. | Append buffer for Master cases missing from the Warehouse.
+
+    New cases are collected first and appended with a single ``pd.concat`` on
+    ``flush``; row indexes are reserved in collection order starting at ``base_len``.
+    """
+
+    base_len: int
+    master_positions: List[int] = field(default_factory=list)
+    case_keys: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.master_positions)
+
+    def add(self, master_pos: int, case_key: str) -> int:
+        """Buffer one Master row and return the Warehouse row index it will get."""
+        self.master_positions.append(int(master_pos))
+        self.case_keys.append(str(case_key))
+        return self.base_len + len(self.master_positions) - 1
+
+    def row_index(self, i: int) -> int:
+        """Warehouse row index of the i-th buffered case."""
+        return self.base_len + i
+
+    def flush(
+        self, wh: pd.DataFrame, master: pd.DataFrame, layout: Dict[str, str]
+    ) -> Tuple[pd.DataFrame, List[Dict[str, Any]]]:
+        """
+        Append all buffered rows to ``wh`` in one concatenation.
+
+        Args:
+            wh: Warehouse DataFrame (must have exactly ``base_len`` rows)
+            master: Master DataFrame the positions refer to
+            layout: Warehouse column -> Master column mapping for appended rows
+
+        Returns:
+            Tuple of (extended_warehouse, appended row dicts in buffer order)
+        """
+        if not self.master_positions:
+            return wh, []
+        if len(wh) != self.base_len:
+            raise ValueError(
+                f"Warehouse has {len(wh)} rows, buffer was created for {self.base_len}"
+            )
+
+        # Semantic renames for all new rows at once (Master name -> Warehouse name)
+        block = master.iloc[self.master_positions][list(layout.values())]
+        block.columns = list(layout.keys())
+        block = block.reset_index(drop=True)
+
+        rows = block.to_dict("records")
+        wh = pd.concat([wh, block], ignore_index=True)
+        return wh, rows
+
 
 @dataclass
 class SyncResult:
@@ -209,6 +465,27 @@ class SyncResult:
     matching_report: Optional[str] = None  # New: matching diagnostics
 
 
+# (master, warehouse, output) — output None = auto-generated next to the warehouse
+SyncJob = Tuple[str, str, Optional[str]]
+
+# Per-job stats summed into the batch report
+BATCH_SUM_KEYS = ("updates", "appends", "field_updates", "date_updates", "merged_rows")
+
+
+@dataclass
+class BatchSyncResult:
+    """배치 동기화 결과. | Result of ``synchronize_many``: one SyncResult per job."""
+
+    results: List[SyncResult]
+    stats: Dict[str, Any]
+
+    @property
+    def success(self) -> bool:
+        """모든 작업 성공 여부. | True when every job succeeded."""
+
+        return all(result.success for result in self.results)
+
+
 @dataclass
 class HeaderCandidate:
     """헤더 후보 정보를 저장합니다. | Container for header candidate metadata."""
@@ -255,8 +532,29 @@ class DataSynchronizerV30:
         date_semantic_keys: Optional[List[str]] = None,
         header_overrides: Optional[Dict[Tuple[str, str], int]] = None,
         min_header_confidence: float = 0.7,
+        update_engine: str = "vectorized",
+        state_store: Optional[str] = None,
+        load_workers: Optional[int] = 1,
+        concurrent_writes: bool = False,
     ) -> None:
-        """동기화기를 초기화합니다. | Initialize the synchronizer."""
+        """동기화기를 초기화합니다. | Initialize the synchronizer.
+
+        Args:
+            update_engine: "vectorized" (column-wise masks, bulk writes) or "loop"
+                (legacy ``iterrows`` engine, kept for output comparison)
+            state_store: Optional SQLite path for incremental sync. Cases whose Master
+                row and synced Warehouse row are unchanged since the last run are skipped,
+                and a case-level delta file is written next to the output.
+            load_workers: Worker processes for sheet loading (1 = serial, None/0 = CPU
+                count). Sheets of all workbooks are parsed concurrently.
+            concurrent_writes: Write the multi-sheet and merged outputs in two threads.
+        """
+
+        if update_engine not in UPDATE_ENGINES:
+            raise ValueError(
+                f"Unknown update_engine '{update_engine}' (expected one of {UPDATE_ENGINES})"
+            )
+        self.update_engine = update_engine
 
         # Use semantic keys instead of hardcoded column names
         self.date_semantic_keys = date_semantic_keys or DATE_SEMANTIC_KEYS
@@ -279,6 +577,18 @@ class DataSynchronizerV30:
         self.master_columns: Dict[str, str] = {}  # semantic_key -> actual_column
         self.warehouse_columns: Dict[str, str] = {}
 
+        # Incremental sync (per-case fingerprints)
+        self.state_store_path: Optional[Path] = Path(state_store) if state_store else None
+
+        # Parallel sheet loading
+        self.load_workers = int(load_workers) if load_workers else (os.cpu_count() or 1)
+        if self.load_workers < 1:
+            raise ValueError(f"load_workers must be >= 1 (got {load_workers})")
+        self._prefetched_sheets: Dict[str, Dict[str, Tuple[pd.DataFrame, int]]] = {}
+
+        # Output stage
+        self.concurrent_writes = bool(concurrent_writes)
+
         # Debug tracking flag
         self.debug_dhl_wh = True  # Enable DHL WH tracking for debugging
 
@@ -530,11 +840,15 @@ class DataSynchronizerV30:
         file_label: str,
         vendor_header_row: Optional[int],
     ) -> Tuple[pd.DataFrame, HeaderCandidate]:
-        """헤더 후보를 순차 적용하여 시트를 로드합니다. | Load sheet trying header candidates."""
+        """헤더 후보를 순차 적용하여 시트를 로드합니다. | Load sheet trying header candidates.
 
-        auto_result = self.header_detector.detect_with_diagnostics(
-            file_path=file_path,
-            sheet_name=sheet_name,
+        The sheet is read once (``header=None``); header scoring, candidate validation
+        and the final DataFrame are all built from that in-memory buffer.
+        """
+
+        buffer = SheetBuffer.read(xl, sheet_name)
+        auto_result = self.header_detector.detect_from_frame(
+            buffer.preview(self.header_detector.max_search_rows)
         )
 
         candidates = self._build_header_candidates(
@@ -557,12 +871,7 @@ class DataSynchronizerV30:
 
             print(f"  [TRY] {self._format_header_candidate(candidate)}")
 
-            df = pd.read_excel(
-                xl,
-                sheet_name=sheet_name,
-                header=candidate.row_index,
-                engine="openpyxl",
-            )
+            df = buffer.with_header(candidate.row_index)
 
             if df.empty:
                 errors.append(f"row {candidate.row_index} produced empty DataFrame")
@@ -635,22 +944,10 @@ class DataSynchronizerV30:
 
         master_sheets.update(hitachi_sheets)
 
-        # Look for SIEMENS file in the same directory first
         master_dir = Path(master_xlsx).parent
-        siemens_files = list(master_dir.glob("*SIMENSE*.xls*")) + list(
-            master_dir.glob("*SIM*.xls*")
-        )
-
-        # If not found, search in parent directory's subdirectories
-        if not siemens_files:
-            parent_dir = master_dir.parent  # data/raw/
-            print(f"[INFO] Searching for SIEMENS files in subdirectories of {parent_dir}")
-            siemens_files = list(parent_dir.glob("*/*SIMENSE*.xls*")) + list(
-                parent_dir.glob("*/*SIM*.xls*")
-            )
+        siemens_file = self._find_siemens_file(master_xlsx)
 
-        if siemens_files:
-            siemens_file = siemens_files[0]  # Take the first SIEMENS file found
+        if siemens_file is not None:
             print(f"[INFO] Found SIEMENS file: {siemens_file.name}")
             print(f"[INFO] Loading SIEMENS Master file...")
 
@@ -792,7 +1089,7 @@ class DataSynchronizerV30:
         print(f"Loading {file_label} file: {Path(file_path).name}")
         print(f"{'='*60}")
 
-        xl = pd.ExcelFile(file_path, engine="openpyxl")
+        xl = open_workbook(file_path)
         all_dfs: List[pd.DataFrame] = []
         header_row: Optional[int] = None
 
@@ -898,14 +1195,37 @@ class DataSynchronizerV30:
         Returns:
             Dict mapping sheet_name to (dataframe, header_row_index)
         """
+        prefetched = self._prefetched_sheets.pop(self._workbook_key(file_path), None)
+        if prefetched is not None:
+            print(f"\n[OK] {file_label}: using {len(prefetched)} sheets loaded in parallel")
+            return prefetched
+
+        return self._load_workbooks([(file_path, file_label)])[self._workbook_key(file_path)]
+
+    @staticmethod
+    def _workbook_key(file_path: str) -> str:
+        """워크북 식별 키. | Normalized path used to key loaded workbooks."""
+
+        return str(Path(file_path).resolve())
+
+    def _plan_sheet_tasks(
+        self, file_path: str, file_label: str
+    ) -> List[Tuple[str, str, str, Optional[int]]]:
+        """
+        워크북의 시트 로드 작업 목록을 만듭니다. | List sheet load tasks of one workbook.
+
+        Returns:
+            ``(file_path, sheet_name, file_label, vendor_header_row)`` in workbook order,
+            aggregate sheets excluded
+        """
         print(f"\n{'='*60}")
         print(f"Loading {file_label} file by sheets: {Path(file_path).name}")
         print(f"{'='*60}")
 
-        xl = pd.ExcelFile(file_path, engine="openpyxl")
-        sheet_data: Dict[str, Tuple[pd.DataFrame, int]] = {}
+        with open_workbook(file_path) as xl:
+            sheet_names = list(xl.sheet_names)
 
-        print(f"Found {len(xl.sheet_names)} sheets in file")
+        print(f"Found {len(sheet_names)} sheets in file")
 
         vendor_type, vendor_header_row = self._detect_vendor_and_header_row(Path(file_path))
         if vendor_header_row is not None:
@@ -915,43 +1235,165 @@ class DataSynchronizerV30:
                 f"[INFO] Vendor could not be determined from name; falling back to heuristic detection"
             )
 
-        for sheet_name in xl.sheet_names:
-            print(f"\n  Loading sheet: '{sheet_name}'")
-
+        tasks = []
+        for sheet_name in sheet_names:
             # Skip summary/aggregate sheets
             if self._should_skip_sheet(sheet_name):
-                print(f"  [SKIP] Aggregate sheet (not Case data)")
+                print(f"  [SKIP] '{sheet_name}': aggregate sheet (not Case data)")
                 continue
+            tasks.append((file_path, sheet_name, file_label, vendor_header_row))
+        return tasks
 
-            df, candidate = self._load_sheet_with_candidates(
-                xl=xl,
-                file_path=file_path,
-                sheet_name=sheet_name,
-                file_label=file_label,
-                vendor_header_row=vendor_header_row,
-            )
+    def _load_sheet(
+        self,
+        file_path: str,
+        sheet_name: str,
+        file_label: str,
+        vendor_header_row: Optional[int],
+        xl: Optional[pd.ExcelFile] = None,
+    ) -> Tuple[pd.DataFrame, int]:
+        """
+        단일 시트를 로드하고 정제합니다. | Load and clean one sheet.
 
-            sheet_header_row = candidate.row_index
+        Returns:
+            Tuple of (dataframe, header_row_index)
+        """
+        print(f"\n  Loading sheet: '{sheet_name}'")
 
-            # Track source sheet (preserve original sheet name)
-            df["Source_Sheet"] = sheet_name
+        if xl is None:
+            with open_workbook(file_path) as own_xl:
+                return self._load_sheet(
+                    file_path, sheet_name, file_label, vendor_header_row, xl=own_xl
+                )
 
-            # DEBUG: Track DHL WH in each sheet
-            self._track_dhl_wh(df, f"Sheet '{sheet_name}' loaded")
+        df, candidate = self._load_sheet_with_candidates(
+            xl=xl,
+            file_path=file_path,
+            sheet_name=sheet_name,
+            file_label=file_label,
+            vendor_header_row=vendor_header_row,
+        )
 
-            # Process each sheet independently
-            df = self._filter_invalid_columns(df)
-            df = self._consolidate_warehouse_columns(df)
-            df = self._ensure_all_location_columns(df)
+        # Track source sheet (preserve original sheet name)
+        df["Source_Sheet"] = sheet_name
 
-            sheet_data[sheet_name] = (df, sheet_header_row)
-            print(f"  [OK] {len(df)} rows loaded")
+        # DEBUG: Track DHL WH in each sheet
+        self._track_dhl_wh(df, f"Sheet '{sheet_name}' loaded")
 
-        if not sheet_data:
-            raise ValueError(f"No valid sheets found in {file_label}")
+        # Process each sheet independently
+        df = self._filter_invalid_columns(df)
+        df = self._consolidate_warehouse_columns(df)
+        df = self._ensure_all_location_columns(df)
+
+        print(f"  [OK] {len(df)} rows loaded")
+        return df, candidate.row_index
+
+    def _loader_settings(self) -> Dict[str, Any]:
+        """워커용 로더 설정. | Picklable settings that rebuild this loader in a worker."""
+
+        return {
+            "date_semantic_keys": list(self.date_semantic_keys),
+            "header_overrides": dict(self.manual_header_overrides),
+            "min_header_confidence": self.header_confidence_threshold,
+            "debug_dhl_wh": self.debug_dhl_wh,
+        }
+
+    def _load_workbooks(
+        self, workbooks: List[Tuple[str, str]]
+    ) -> Dict[str, Dict[str, Tuple[pd.DataFrame, int]]]:
+        """
+        여러 워크북의 시트를 병렬로 로드합니다. | Load the sheets of several workbooks.
+
+        With ``load_workers > 1`` every (workbook, sheet) pair is parsed in a process
+        pool; otherwise sheets are loaded one after another in this process. Results
+        always follow the order of ``workbooks`` and each workbook's sheet order.
+
+        Args:
+            workbooks: ``(file_path, file_label)`` pairs
+
+        Returns:
+            Dict mapping ``_workbook_key(file_path)`` to ``{sheet_name: (df, header_row)}``
+        """
+        tasks = []
+        for file_path, file_label in workbooks:
+            tasks.extend(self._plan_sheet_tasks(file_path, file_label))
+
+        workers = min(self.load_workers, len(tasks))
+        if workers > 1:
+            print(f"\n[INFO] Loading {len(tasks)} sheets with {workers} worker processes")
+            settings = self._loader_settings()
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_load_sheet_task, settings, *task) for task in tasks]
+                results = [future.result() for future in futures]
+        else:
+            results = []
+            open_books: Dict[str, pd.ExcelFile] = {}
+            try:
+                for file_path, sheet_name, file_label, vendor_header_row in tasks:
+                    if file_path not in open_books:
+                        open_books[file_path] = open_workbook(file_path)
+                    results.append(
+                        self._load_sheet(
+                            file_path,
+                            sheet_name,
+                            file_label,
+                            vendor_header_row,
+                            xl=open_books[file_path],
+                        )
+                    )
+            finally:
+                for xl in open_books.values():
+                    xl.close()
+
+        loaded: Dict[str, Dict[str, Tuple[pd.DataFrame, int]]] = {
+            self._workbook_key(path): {} for path, _ in workbooks
+        }
+        for (file_path, sheet_name, _, _), result in zip(tasks, results):
+            loaded[self._workbook_key(file_path)][sheet_name] = result
+
+        for file_path, file_label in workbooks:
+            sheet_data = loaded[self._workbook_key(file_path)]
+            if not sheet_data:
+                raise ValueError(f"No valid sheets found in {file_label}")
+            print(f"\n[OK] {file_label}: loaded {len(sheet_data)} sheets")
+        return loaded
+
+    def _find_siemens_file(self, master_xlsx: str) -> Optional[Path]:
+        """SIEMENS 마스터 파일 탐색. | Locate the SIEMENS Master next to (or near) the HITACHI file."""
+
+        # Look for SIEMENS file in the same directory first
+        master_dir = Path(master_xlsx).parent
+        siemens_files = list(master_dir.glob("*SIMENSE*.xls*")) + list(
+            master_dir.glob("*SIM*.xls*")
+        )
+
+        # If not found, search in parent directory's subdirectories
+        if not siemens_files:
+            parent_dir = master_dir.parent  # data/raw/
+            print(f"[INFO] Searching for SIEMENS files in subdirectories of {parent_dir}")
+            siemens_files = list(parent_dir.glob("*/*SIMENSE*.xls*")) + list(
+                parent_dir.glob("*/*SIM*.xls*")
+            )
+
+        return siemens_files[0] if siemens_files else None
 
-        print(f"\n[OK] Loaded {len(sheet_data)} sheets")
-        return sheet_data
+    def _prefetch_workbooks(self, master_xlsx: str, warehouse_xlsx: str) -> None:
+        """
+        Master/SIEMENS/Warehouse 워크북을 한 번에 병렬 로드합니다.
+        | Load all Stage 1 workbooks in one process pool before the serial phases.
+
+        Later ``_load_file_by_sheets`` calls pick their workbook from this cache.
+        """
+        workbooks = [(master_xlsx, "Master")]
+        siemens_file = self._find_siemens_file(master_xlsx)
+        if siemens_file is not None:
+            workbooks.append((str(siemens_file), "SIEMENS"))
+        workbooks.append((warehouse_xlsx, "Warehouse"))
+
+        unique: Dict[str, Tuple[str, str]] = {}
+        for file_path, file_label in workbooks:
+            unique.setdefault(self._workbook_key(file_path), (file_path, file_label))
+        self._prefetched_sheets = self._load_workbooks(list(unique.values()))
 
     @staticmethod
     def parse_header_override_args(
@@ -1146,7 +1588,7 @@ class DataSynchronizerV30:
         """
         # Get column order from core registry (Single Source of Truth)
         # All warehouse/site column definitions are centrally managed in @core/header_registry.py
-        from core import get_site_columns, get_warehouse_columns
+        from scripts.core import get_site_columns, get_warehouse_columns
 
         WAREHOUSE_ORDER = get_warehouse_columns()
         SITE_ORDER = get_site_columns()
@@ -1296,22 +1738,9 @@ class DataSynchronizerV30:
 
         Returns:
             Dictionary mapping normalized case numbers to row indices
+            (uppercase, special characters removed, first occurrence kept)
         """
-        import re
-
-        idx: Dict[str, int] = {}
-
-        # Normalize case numbers: uppercase, remove special characters
-        series = df[case_col].fillna("").astype(str).str.strip().str.upper()
-        series = series.apply(lambda x: re.sub(r"[^A-Z0-9]", "", x))
-
-        for i, v in enumerate(series.tolist()):
-            if not v:
-                continue
-            if v not in idx:  # Keep first occurrence
-                idx[v] = i
-
-        return idx
+        return CaseKeyIndex.from_frame(df, case_col).position_map("first")
 
     def _apply_master_order_sorting(
         self,
@@ -1398,57 +1827,272 @@ class DataSynchronizerV30:
 
         return sorted_warehouse
 
-    def _apply_updates(
+    def _master_case_keys(self, master: pd.DataFrame, master_case_col: str) -> np.ndarray:
+        """Master case keys exactly as the update engines build them (strip + upper)."""
+        m_case = master[master_case_col]
+        return (
+            m_case.astype(object).astype(str).str.strip().str.upper().where(m_case.notna(), "")
+        ).to_numpy(dtype=object)
+
+    def _incremental_columns(
+        self, master_cols: Dict[str, str], wh_cols: Dict[str, str]
+    ) -> Tuple[List[str], List[str]]:
+        """Columns hashed on the Master side and on the synced Warehouse side."""
+        master_fp_cols = [master_cols[k] for k in sorted(master_cols)] + list(METADATA_COLUMNS)
+        synced_fp_cols = [
+            wh_cols[k] if k in wh_cols else master_cols[k]
+            for k in sorted(master_cols)
+            if wh_cols.get(k) not in METADATA_COLUMNS
+        ]
+        # Source_Sheet is dropped from the output, so it cannot be part of the synced hash
+        synced_fp_cols.append("Source_Vendor")
+        return master_fp_cols, synced_fp_cols
+
+    @staticmethod
+    def _incremental_scope(master_path: Path, warehouse_path: Path, sheet_name: str) -> str:
+        """
+        State store scope of one sync job sheet.
+
+        ``CaseStateStore.save`` replaces a whole scope, so jobs sharing a store
+        (``synchronize_many``) must not share scopes: the resolved Master and
+        Warehouse paths are part of the key.
+        """
+        return f"{Path(master_path).resolve()}|{Path(warehouse_path).resolve()}|{sheet_name}"
+
+    def _prepare_incremental(
         self,
+        state_store: CaseStateStore,
+        scope: str,
         master: pd.DataFrame,
         wh: pd.DataFrame,
         master_cols: Dict[str, str],
         wh_cols: Dict[str, str],
+        label: Optional[str] = None,
     ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
         """
-        Apply updates from Master to Warehouse using matched column names.
+        Fingerprint Master cases and drop those that would not change the Warehouse.
+
+        A case is skipped when its Master fingerprint equals the stored one and its
+        current Warehouse row hashes to the synced row written by the last run; the
+        update is idempotent, so re-applying it would produce no change.
 
         Args:
-            master: Master DataFrame
-            wh: Warehouse DataFrame
-            master_cols: Master column mapping
-            wh_cols: Warehouse column mapping
+            scope: State store scope (``_incremental_scope``)
+            label: Name used in the log line (default: ``scope``)
 
         Returns:
-            Tuple of (updated_warehouse, statistics)
+            Tuple of (master rows to synchronize, context for ``_finish_incremental``)
         """
-        print("\nApplying updates from Master to Warehouse...")
+        master_fp_cols, synced_fp_cols = self._incremental_columns(master_cols, wh_cols)
+        sig = schema_signature(master_fp_cols, synced_fp_cols)
+
+        keys = self._master_case_keys(master, master_cols["case_number"])
+        master_fp = fingerprint_rows(master, master_fp_cols)
+        valid = keys != ""
+        key_series = pd.Series(keys[valid])
+        first = ~key_series.duplicated(keep="first").to_numpy()
+        unique_keys = key_series[first].tolist()
+        unique_fp = master_fp[valid][first]
+
+        state = state_store.load(scope, sig)
+        base_generation = state_store.generation(scope, sig)
+        delta = classify_cases(state, unique_keys, unique_fp)
+
+        # Duplicate Master keys are never skipped (their rows are applied in sequence)
+        duplicated = set(key_series[key_series.duplicated(keep=False)].tolist())
+        wh_index = self._build_case_index(wh, wh_cols["case_number"])
+        wh_fp = fingerprint_rows(wh, synced_fp_cols)
+        stored_synced = state["synced_fp"] if len(state) else pd.Series(dtype=object)
+
+        skip_keys = set()
+        for key in delta.unchanged:
+            pos = wh_index.get(key)
+            if key in duplicated or pos is None:
+                continue
+            if stored_synced.get(key) == str(int(wh_fp[pos])):
+                skip_keys.add(key)
 
-        stats = dict(updates=0, date_updates=0, field_updates=0, appends=0)
+        keep = ~pd.Series(keys).isin(skip_keys).to_numpy()
+        print(
+            f"  [INCREMENTAL] {label or scope}: new {len(delta.new)}, changed {len(delta.changed)}, "
+            f"deleted {len(delta.deleted)}, skipped {len(skip_keys)} unchanged cases"
+        )
+        ctx = {
+            "scope": scope,
+            "sig": sig,
+            "keys": unique_keys,
+            "master_fp": unique_fp,
+            "synced_fp_cols": synced_fp_cols,
+            "wh_case_col": wh_cols["case_number"],
+            "delta": delta,
+            "skipped": len(skip_keys),
+            "stored_synced": stored_synced,
+            "base_generation": base_generation,
+        }
+        return master.loc[keep], ctx
 
-        # Build warehouse index by case number
-        wh_case_col = wh_cols["case_number"]
-        wh_index = self._build_case_index(wh, wh_case_col)
+    def _finish_incremental(
+        self,
+        state_store: CaseStateStore,
+        ctx: Dict[str, Any],
+        updated_wh: pd.DataFrame,
+        generation: Optional[str] = None,
+    ) -> None:
+        """
+        Store Master and synced-row fingerprints of this run for the next one.
 
-        # Get master case column
-        master_case_col = master_cols["case_number"]
+        Cases with an unchanged Master row whose synced row differs from the one the
+        last run wrote (the Warehouse side changed) move from ``unchanged`` to
+        ``changed`` in ``ctx["delta"]``, so the case delta covers every output change.
+        """
+        upd_index = self._build_case_index(updated_wh, ctx["wh_case_col"])
+        synced_fp = fingerprint_rows(updated_wh, ctx["synced_fp_cols"])
+        synced = [
+            int(synced_fp[upd_index[key]]) if key in upd_index else None for key in ctx["keys"]
+        ]
 
-        # Find all semantic keys that exist in both files
-        common_keys = set(master_cols.keys()) & set(wh_cols.keys())
+        delta = ctx["delta"]
+        stored_synced = ctx["stored_synced"]
+        current = dict(zip(ctx["keys"], synced))
+        drifted = {
+            key
+            for key in delta.unchanged
+            if stored_synced.get(key) != (None if current[key] is None else str(current[key]))
+        }
+        if drifted:
+            delta.changed += [key for key in delta.unchanged if key in drifted]
+            delta.unchanged = [key for key in delta.unchanged if key not in drifted]
 
-        # Find master-only keys (columns that exist in Master but not in Warehouse)
-        # These need to be added to Warehouse during synchronization
-        master_only_keys = set(master_cols.keys()) - set(wh_cols.keys())
+        state_store.save(
+            ctx["scope"], ctx["sig"], ctx["keys"], ctx["master_fp"], synced, generation
+        )
 
-        print(f"  Master columns: {list(master_cols.keys())}")
-        print(f"  Warehouse columns: {list(wh_cols.keys())}")
-        print(f"  Common keys: {list(common_keys)}")
-        print(f"  Master-only keys: {list(master_only_keys)}")
+    def _track_output_rows(
+        self,
+        state_store: CaseStateStore,
+        scope: str,
+        frame: pd.DataFrame,
+        case_col: Optional[Any],
+        generation: Optional[str] = None,
+    ) -> Tuple[CaseDelta, Optional[str]]:
+        """
+        Fingerprint output rows by case key over all output columns.
 
-        if master_only_keys:
-            print(f"  Master-only columns found: {list(master_only_keys)}")
-            print(f"  These will be added to Warehouse during sync")
+        The Master state only hashes matched columns of Master cases; this covers
+        everything a sheet writes (Warehouse-only rows and columns, Warehouse-only
+        and Master-only sheets), classified against the last run. Rows without a
+        case key (or without a case column) are not tracked.
 
-        # ✅ Phase 3: Store semantic key → actual column name mappings
-        for semantic_key in common_keys:
-            w_col = wh_cols.get(semantic_key)
-            if w_col:
-                self.change_tracker.set_column_mapping(semantic_key, w_col)
+        Args:
+            scope: State store scope for these rows
+            frame: Output rows as written
+            case_col: Case number column of ``frame``
+
+        Returns:
+            Tuple of (CaseDelta of the tracked keys, generation of the state it was
+            classified against)
+        """
+        if case_col is None:
+            keys = np.full(len(frame), "", dtype=object)
+        else:
+            values = frame[case_col]
+            if isinstance(values, pd.DataFrame):  # duplicated header
+                values = values.iloc[:, 0]
+            keys = normalize_case_keys(values, mode="upper")
+        tracked = keys != ""
+        key_series = pd.Series(keys[tracked])
+        first = ~key_series.duplicated(keep="first").to_numpy()
+
+        # Sorted: a new column position alone does not change the hash
+        columns = sorted(frame.columns, key=str)
+        sig = schema_signature([str(c) for c in columns])
+        row_fp = fingerprint_rows(frame, columns)[tracked][first]
+        row_keys = key_series[first].tolist()
+
+        base_generation = state_store.generation(scope, sig)
+        delta = classify_cases(state_store.load(scope, sig), row_keys, row_fp)
+        state_store.save(scope, sig, row_keys, row_fp, [None] * len(row_keys), generation)
+        return delta, base_generation
+
+    def _apply_updates(
+        self,
+        master: pd.DataFrame,
+        wh: pd.DataFrame,
+        master_cols: Dict[str, str],
+        wh_cols: Dict[str, str],
+    ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Apply updates from Master to Warehouse using matched column names.
+
+        ``self.update_engine`` 값에 따라 벡터화 엔진 또는 기존 행 단위 루프를 사용합니다.
+        | Dispatches to the vectorized engine or the legacy row loop.
+
+        Args:
+            master: Master DataFrame
+            wh: Warehouse DataFrame
+            master_cols: Master column mapping
+            wh_cols: Warehouse column mapping
+
+        Returns:
+            Tuple of (updated_warehouse, statistics)
+        """
+        if self.update_engine == "loop":
+            return self._apply_updates_loop(master, wh, master_cols, wh_cols)
+        return self._apply_updates_vectorized(master, wh, master_cols, wh_cols)
+
+    def _apply_updates_loop(
+        self,
+        master: pd.DataFrame,
+        wh: pd.DataFrame,
+        master_cols: Dict[str, str],
+        wh_cols: Dict[str, str],
+    ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Legacy row-by-row update engine (``iterrows`` + ``wh.at``).
+
+        Kept for output comparison with the vectorized engine.
+
+        Args:
+            master: Master DataFrame
+            wh: Warehouse DataFrame
+            master_cols: Master column mapping
+            wh_cols: Warehouse column mapping
+
+        Returns:
+            Tuple of (updated_warehouse, statistics)
+        """
+        print("\nApplying updates from Master to Warehouse...")
+
+        stats = dict(updates=0, date_updates=0, field_updates=0, appends=0)
+
+        # Build warehouse index by case number
+        wh_case_col = wh_cols["case_number"]
+        wh_index = self._build_case_index(wh, wh_case_col)
+
+        # Get master case column
+        master_case_col = master_cols["case_number"]
+
+        # Find all semantic keys that exist in both files
+        common_keys = set(master_cols.keys()) & set(wh_cols.keys())
+
+        # Find master-only keys (columns that exist in Master but not in Warehouse)
+        # These need to be added to Warehouse during synchronization
+        master_only_keys = set(master_cols.keys()) - set(wh_cols.keys())
+
+        print(f"  Master columns: {list(master_cols.keys())}")
+        print(f"  Warehouse columns: {list(wh_cols.keys())}")
+        print(f"  Common keys: {list(common_keys)}")
+        print(f"  Master-only keys: {list(master_only_keys)}")
+
+        if master_only_keys:
+            print(f"  Master-only columns found: {list(master_only_keys)}")
+            print(f"  These will be added to Warehouse during sync")
+
+        # ✅ Phase 3: Store semantic key → actual column name mappings
+        for semantic_key in common_keys:
+            w_col = wh_cols.get(semantic_key)
+            if w_col:
+                self.change_tracker.set_column_mapping(semantic_key, w_col)
 
         for semantic_key in master_only_keys:
             m_col = master_cols.get(semantic_key)
@@ -1612,8 +2256,324 @@ class DataSynchronizerV30:
 
         return wh, stats
 
+    def _new_case_layout(
+        self,
+        master: pd.DataFrame,
+        common_keys: Set[str],
+        master_cols: Dict[str, str],
+        wh_cols: Dict[str, str],
+    ) -> Dict[str, str]:
+        """
+        Column layout of an appended new-case row (warehouse column -> master column).
+
+        All Master columns are copied; common columns are renamed to their Warehouse
+        names (renamed columns move to the end, as in the legacy engine).
+        """
+        layout = {col: col for col in master.columns}
+        for semantic_key in common_keys:
+            m_col = master_cols[semantic_key]
+            w_col = wh_cols[semantic_key]
+            if m_col != w_col and m_col in layout:
+                layout[w_col] = layout.pop(m_col)
+        return layout
+
+    def _apply_updates_vectorized(
+        self,
+        master: pd.DataFrame,
+        wh: pd.DataFrame,
+        master_cols: Dict[str, str],
+        wh_cols: Dict[str, str],
+    ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Column-wise update engine: aligns Master and Warehouse once on the case key.
+
+        Produces the same Warehouse frame, statistics and ChangeTracker entries as
+        ``_apply_updates_loop``. Master rows that hit the same Warehouse row are applied
+        in successive rounds so later rows still see earlier writes.
+
+        Args:
+            master: Master DataFrame
+            wh: Warehouse DataFrame
+            master_cols: Master column mapping
+            wh_cols: Warehouse column mapping
+
+        Returns:
+            Tuple of (updated_warehouse, statistics)
+        """
+        print("\nApplying updates from Master to Warehouse (vectorized)...")
+
+        stats = dict(updates=0, date_updates=0, field_updates=0, appends=0)
+
+        wh_case_col = wh_cols["case_number"]
+        wh_index = self._build_case_index(wh, wh_case_col)
+        master_case_col = master_cols["case_number"]
+
+        common_keys = set(master_cols.keys()) & set(wh_cols.keys())
+        master_only_keys = set(master_cols.keys()) - set(wh_cols.keys())
+
+        print(f"  Master columns: {list(master_cols.keys())}")
+        print(f"  Warehouse columns: {list(wh_cols.keys())}")
+        print(f"  Common keys: {list(common_keys)}")
+        print(f"  Master-only keys: {list(master_only_keys)}")
+
+        for semantic_key in common_keys:
+            w_col = wh_cols.get(semantic_key)
+            if w_col:
+                self.change_tracker.set_column_mapping(semantic_key, w_col)
+        for semantic_key in master_only_keys:
+            m_col = master_cols.get(semantic_key)
+            if m_col:
+                self.change_tracker.set_column_mapping(semantic_key, m_col)
+
+        # 1. Align Master rows to Warehouse rows on the case key
+        m_keys = self._master_case_keys(master, master_case_col)
+        has_key = m_keys != ""
+        w_target = pd.Series(m_keys).map(wh_index).to_numpy()
+        exists = has_key & ~pd.isna(w_target)
+
+        exist_m = np.flatnonzero(exists)
+        exist_w = w_target[exists].astype(np.int64)
+        new_m = np.flatnonzero(has_key & ~exists)
+        base_len = len(wh)
+        wh_columns_before = set(wh.columns)
+
+        layout = self._new_case_layout(master, common_keys, master_cols, wh_cols)
+
+        # 2. Add missing columns in the order the row loop would create them
+        additions = []
+        if len(new_m):
+            additions.append((new_m[0], list(layout.keys())))
+        if len(exist_m):
+            additions.append((exist_m[0], [master_cols[k] for k in master_only_keys]))
+        missing_cols: List[str] = []
+        for _, cols in sorted(additions, key=lambda item: item[0]):
+            missing_cols.extend(c for c in cols if c not in wh.columns and c not in missing_cols)
+        if missing_cols:
+            filler = pd.DataFrame(
+                {c: [None] * len(wh) for c in missing_cols}, index=wh.index, dtype=object
+            )
+            wh = pd.concat([wh, filler], axis=1)
+
+        # Date keys (datetime64[D]) of both sides, parsed once per column
+        master_dates = DateKeyCache(master)
+        wh_dates = DateKeyCache(wh)
+
+        # Change batches: (master positions, slot, row_index, column, semantic key, type, old, new)
+        batches: List[Tuple[np.ndarray, int, np.ndarray, str, str, str, list, list]] = []
+        update_slots = [(k, "common") for k in common_keys] + [
+            (k, "master_only") for k in master_only_keys
+        ]
+
+        # 3. Existing cases, one round per duplicate occurrence of a Warehouse row
+        rounds = (
+            pd.Series(exist_w).groupby(exist_w).cumcount().to_numpy()
+            if len(exist_w)
+            else np.array([], dtype=np.int64)
+        )
+        first_new = new_m[0] if len(new_m) else None
+        for round_no in range(int(rounds.max()) + 1 if len(rounds) else 0):
+            in_round = rounds == round_no
+            r_m = exist_m[in_round]
+            r_w = exist_w[in_round]
+
+            for meta_col in METADATA_COLUMNS:
+                if meta_col not in master.columns or meta_col not in wh.columns:
+                    continue
+                if meta_col in wh_columns_before:
+                    eligible = np.ones(len(r_m), dtype=bool)
+                elif first_new is not None and meta_col in layout:
+                    # Column only exists once the first new case was appended
+                    eligible = r_m > first_new
+                else:
+                    continue
+                if not eligible.any():
+                    continue
+                e_m, e_w = r_m[eligible], r_w[eligible]
+                col_pos = wh.columns.get_loc(meta_col)
+                old = wh[meta_col].iloc[e_w].to_numpy(dtype=object)
+                new = master[meta_col].iloc[e_m].to_numpy(dtype=object)
+                wh.iloc[e_w, col_pos] = new
+                wh_dates.invalidate(meta_col)
+                if meta_col == "Source_Sheet":
+                    changed = int(np.asarray(old != new, dtype=bool).sum())
+                    if changed:
+                        stats["source_sheet_updates"] = (
+                            stats.get("source_sheet_updates", 0) + changed
+                        )
+                else:
+                    stats["source_vendor_updates"] = stats.get("source_vendor_updates", 0) + len(
+                        e_m
+                    )
+
+            for slot, (semantic_key, kind) in enumerate(update_slots, start=1):
+                m_col = master_cols[semantic_key]
+                w_col = wh_cols[semantic_key] if kind == "common" else m_col
+                if kind == "common" and w_col in METADATA_COLUMNS:
+                    continue
+
+                m_vals = master[m_col].iloc[r_m]
+                notna = m_vals.notna().to_numpy()
+                if not notna.any():
+                    continue
+                s_m, s_w = r_m[notna], r_w[notna]
+                m_vals = m_vals[notna]
+                w_vals = wh[w_col].iloc[s_w]
+                col_pos = wh.columns.get_loc(w_col)
+
+                if kind == "master_only":
+                    change_type = "master_only_update"
+                    old = w_vals.to_numpy(dtype=object)
+                    new = m_vals.to_numpy(dtype=object)
+                    changed = np.asarray(old != new, dtype=bool)
+                    write = changed
+                elif semantic_key in self.date_semantic_keys:
+                    change_type = "date_update"
+                    m_none, m_day = (keys[s_m] for keys in master_dates.keys(m_col))
+                    w_none, w_day = (keys[s_w] for keys in wh_dates.keys(w_col))
+                    changed = ~_dates_equal_arrays(m_none, m_day, w_none, w_day)
+                    # Master always wins for dates (equal values are rewritten as-is)
+                    write = np.ones(len(s_m), dtype=bool)
+                else:
+                    if not ALWAYS_OVERWRITE_NONDATE:
+                        continue
+                    change_type = "field_update"
+                    w_obj = w_vals.to_numpy(dtype=object)
+                    w_is_none = np.fromiter(
+                        (v is None for v in w_obj), dtype=bool, count=len(w_obj)
+                    )
+                    changed = w_is_none | (
+                        m_vals.map(str).to_numpy(dtype=object)
+                        != w_vals.map(str).to_numpy(dtype=object)
+                    )
+                    write = changed
+
+                if write.any():
+                    wh.iloc[s_w[write], col_pos] = m_vals.to_numpy(dtype=object)[write]
+                    if change_type == "date_update":
+                        wh_dates.assign(w_col, s_w, m_none, m_day)
+                    else:
+                        wh_dates.invalidate(w_col)
+
+                n_changed = int(changed.sum())
+                if not n_changed:
+                    continue
+                stats["updates"] += n_changed
+                stats[
+                    "date_updates" if change_type == "date_update" else "field_updates"
+                ] += n_changed
+                batches.append(
+                    (
+                        s_m[changed],
+                        slot,
+                        s_w[changed],
+                        w_col,
+                        semantic_key,
+                        change_type,
+                        w_vals[changed].tolist(),
+                        m_vals[changed].tolist(),
+                    )
+                )
+
+        # 4. New cases: buffered and appended at the bottom in one concat (Master order)
+        buffer = NewCaseBuffer(base_len=base_len)
+        for mi in new_m:
+            buffer.add(mi, m_keys[mi])
+        wh, appended = buffer.flush(wh, master, layout)
+        new_rows: List[Tuple[int, str, Dict[str, Any], int]] = [
+            (mi, case_key, row_data, buffer.row_index(i))
+            for i, (mi, case_key, row_data) in enumerate(
+                zip(buffer.master_positions, buffer.case_keys, appended)
+            )
+        ]
+        stats["appends"] = len(buffer)
+
+        # 5. Record changes in Master row order (then column order), as the row loop does
+        self._record_update_changes(batches, new_rows, m_keys)
+
+        print(f"  [OK] Updates: {stats['updates']} cells changed")
+        print(f"    - Date updates: {stats['date_updates']}")
+        print(f"    - Field updates: {stats['field_updates']}")
+        print(f"    - New records: {stats['appends']}")
+        if "source_sheet_updates" in stats:
+            print(f"    - Source_Sheet updates: {stats['source_sheet_updates']}")
+
+        return wh, stats
+
+    def _record_update_changes(
+        self,
+        batches: List[Tuple[np.ndarray, int, np.ndarray, str, str, str, list, list]],
+        new_rows: List[Tuple[int, str, Dict[str, Any], int]],
+        m_keys: np.ndarray,
+    ) -> None:
+        """
+        Write collected change batches into the ChangeTracker in one bulk append.
+
+        Entries are ordered by (Master row, column slot); new records use slot 0.
+        """
+        parts: Dict[str, List[Any]] = {
+            name: []
+            for name in ("m_pos", "slot", "row", "column", "semantic", "type", "case", "old", "new")
+        }
+
+        def _add(m_pos, slot, rows, column, semantic, change_type, case, old, new):
+            n = len(rows)
+            parts["m_pos"].append(np.asarray(m_pos, dtype=np.int64))
+            parts["slot"].append(np.full(n, slot, dtype=np.int64))
+            parts["row"].append(np.asarray(rows, dtype=np.int64))
+            for name, value in (
+                ("column", column),
+                ("semantic", semantic),
+                ("type", change_type),
+                ("case", case),
+            ):
+                arr = np.empty(n, dtype=object)
+                arr[:] = value
+                parts[name].append(arr)
+            for name, values in (("old", old), ("new", new)):
+                arr = np.empty(n, dtype=object)
+                arr[:] = values
+                parts[name].append(arr)
+
+        for m_pos, slot, w_pos, column, semantic_key, change_type, old, new in batches:
+            _add(m_pos, slot, w_pos, column, semantic_key, change_type, m_keys[m_pos], old, new)
+
+        if new_rows:
+            n_new = len(new_rows)
+            _add(
+                [mi for mi, *_rest in new_rows],
+                0,
+                [row_index for *_rest, row_index in new_rows],
+                "",
+                "",
+                "new_record",
+                "",
+                [None] * n_new,
+                [None] * n_new,
+            )
+            for _mi, case_no, row_data, _row_index in new_rows:
+                self.change_tracker.new_cases[str(case_no)] = dict(row_data or {})
+
+        if not parts["row"]:
+            return
+        merged = {name: np.concatenate(chunks) for name, chunks in parts.items()}
+        order = np.lexsort((merged["slot"], merged["m_pos"]))
+        self.change_tracker.add_changes(
+            row_index=merged["row"][order],
+            column_name=merged["column"][order],
+            semantic_key=merged["semantic"][order],
+            change_type=merged["type"][order],
+            case_no=merged["case"][order],
+            old_values=merged["old"][order],
+            new_values=merged["new"][order],
+        )
+
     def synchronize(
-        self, master_xlsx: str, warehouse_xlsx: str, output_path: Optional[str] = None
+        self,
+        master_xlsx: str,
+        warehouse_xlsx: str,
+        output_path: Optional[str] = None,
+        delta_only: bool = False,
+        delta_path: Optional[str] = None,
     ) -> SyncResult:
         """
         Synchronize Master data into Warehouse file.
@@ -1630,9 +2590,15 @@ class DataSynchronizerV30:
             master_xlsx: Path to Master Excel file
             warehouse_xlsx: Path to Warehouse Excel file
             output_path: Path for output file (optional, auto-generated if None)
+            delta_only: Dry run: compute matches, updates and appends, write only the
+                cell delta (case, column, old, new, type) and skip all Excel output.
+                The incremental state store is read but not updated.
+            delta_path: Delta file for ``delta_only`` (``.jsonl`` or ``.parquet``;
+                default ``<output stem>.delta.jsonl``)
 
         Returns:
             SyncResult object with success status, messages, and statistics
+            (``output_path`` is the delta file for ``delta_only``)
 
         Example:
             >>> sync = DataSynchronizerV30()
@@ -1641,12 +2607,17 @@ class DataSynchronizerV30:
             >>>     print(f"Success! Output: {result.output_path}")
             >>>     print(f"Changes: {result.stats}")
         """
+        state_store: Optional[CaseStateStore] = None
         try:
             # Phase 1: Load files by sheets (NEW: Sheet-by-sheet processing)
             print("\n" + "=" * 60)
             print("PHASE 1: Loading Files by Sheets")
             print("=" * 60)
 
+            # Parse all workbooks concurrently when a worker pool is configured
+            if self.load_workers > 1:
+                self._prefetch_workbooks(master_xlsx, warehouse_xlsx)
+
             # Load Master files (HITACHI + SIEMENS)
             master_sheets = self._load_master_files(master_xlsx)
 
@@ -1685,6 +2656,13 @@ class DataSynchronizerV30:
             processed_sheets = {}
             total_stats = {"updates": 0, "appends": 0, "field_updates": 0, "date_updates": 0}
 
+            # Incremental state (optional)
+            state_store = CaseStateStore(self.state_store_path) if self.state_store_path else None
+            generation = uuid.uuid4().hex  # this run's id in the state store and delta meta
+            base_generations: Dict[str, Optional[str]] = {}
+            delta_frames: List[pd.DataFrame] = []
+            incremental_stats: Dict[str, Dict[str, int]] = {}
+
             # Get common sheet names with semantic matching
             common_sheets = {}  # Dict[master_sheet, warehouse_sheet]
             master_only_sheets = []
@@ -1741,11 +2719,50 @@ class DataSynchronizerV30:
                     m_df, w_df, master_columns, warehouse_columns
                 )
 
+                # Incremental mode: only new/changed cases go through the update engine
+                incremental_ctx = None
+                m_df_sync = m_df
+                if state_store is not None:
+                    m_df_sync, incremental_ctx = self._prepare_incremental(
+                        state_store,
+                        self._incremental_scope(master_path, warehouse_path, m_sheet_name),
+                        m_df,
+                        w_df,
+                        master_columns,
+                        warehouse_columns,
+                        label=m_sheet_name,
+                    )
+
                 # Apply updates
                 updated_w_df, stats = self._apply_updates(
-                    m_df, w_df, master_columns, warehouse_columns
+                    m_df_sync, w_df, master_columns, warehouse_columns
                 )
 
+                if incremental_ctx is not None:
+                    if not delta_only:
+                        self._finish_incremental(
+                            state_store, incremental_ctx, updated_w_df, generation
+                        )
+                        base_generations[incremental_ctx["scope"]] = incremental_ctx[
+                            "base_generation"
+                        ]
+                    delta_frames.append(incremental_ctx["delta"].to_frame(output_sheet_name))
+                    incremental_stats[output_sheet_name] = dict(
+                        incremental_ctx["delta"].summary(), skipped=incremental_ctx["skipped"]
+                    )
+
+                # ✅ Store the change tracker for this sheet
+                sheet_change_trackers[output_sheet_name] = self.change_tracker
+
+                # Accumulate stats
+                for key in total_stats:
+                    total_stats[key] += stats.get(key, 0)
+
+                if delta_only:
+                    # Dry run: output order and columns are not needed
+                    print(f"  [DRY-RUN] {output_sheet_name}: {stats.get('updates', 0)} updates")
+                    continue
+
                 # Maintain Master order after updates
                 updated_w_df = self._maintain_warehouse_order(
                     updated_w_df, m_df, master_columns, warehouse_columns
@@ -1755,19 +2772,22 @@ class DataSynchronizerV30:
                 if "Source_Sheet" in updated_w_df.columns:
                     updated_w_df = updated_w_df.drop(columns=["Source_Sheet"])
 
-                # ✅ Store the change tracker for this sheet
-                sheet_change_trackers[output_sheet_name] = self.change_tracker
-
                 processed_sheets[output_sheet_name] = (updated_w_df, w_header_row)
 
-                # Accumulate stats
-                for key in total_stats:
-                    total_stats[key] += stats.get(key, 0)
-
                 print(
                     f"  [OK] {output_sheet_name}: {len(updated_w_df)} rows, {stats.get('updates', 0)} updates"
                 )
 
+            if delta_only:
+                if state_store is not None:
+                    total_stats["incremental"] = incremental_stats
+                return self._write_delta_only(
+                    sheet_change_trackers,
+                    output_path or warehouse_xlsx,
+                    delta_path,
+                    total_stats,
+                )
+
             # Process warehouse-only sheets (keep as-is)
             for sheet_name in warehouse_only_sheets:
                 print(f"\n--- Keeping warehouse-only sheet: '{sheet_name}' ---")
@@ -1810,88 +2830,53 @@ class DataSynchronizerV30:
                 )
             )
 
-            # Save all sheets with standard 63-column header order
-            print(f"  Writing to: {Path(out).name}")
-            with pd.ExcelWriter(out, engine="openpyxl") as writer:
-                for sheet_name, (df, header_row) in processed_sheets.items():
-                    # Clean sheet name for Excel (remove invalid characters)
-                    clean_sheet_name = sheet_name.replace("/", "_").replace("\\", "_")[
-                        :31
-                    ]  # Excel limit
-                    # Apply standard 63-column header order before saving
-                    df_reordered = reorder_dataframe_columns(
-                        df, is_stage2=False, keep_unlisted=False, use_semantic_matching=True
-                    )
-                    df_reordered.to_excel(writer, sheet_name=clean_sheet_name, index=False)
-                    print(
-                        f"    - {clean_sheet_name}: {len(df)} rows, {len(df_reordered.columns)} columns (standard order)"
-                    )
-
-            print(f"  [OK] Saved {len(processed_sheets)} sheets")
-
-            # Apply color formatting to all sheets
-            print(f"  Applying color formatting...")
-            for sheet_name, (df, header_row) in processed_sheets.items():
-                clean_sheet_name = sheet_name.replace("/", "_").replace("\\", "_")[:31]
-                # ✅ Use the sheet-specific change tracker
-                if sheet_name in sheet_change_trackers:
-                    self.change_tracker = sheet_change_trackers[sheet_name]
-                    print(f"    - {clean_sheet_name}: {len(self.change_tracker.changes)} changes")
-                    self._apply_excel_formatting(out, clean_sheet_name, header_row)
-                else:
-                    print(f"    - {clean_sheet_name}: No change tracker (skipped)")
-            print(f"  [OK] Formatting applied to all sheets")
-
-            # Create merged file (NEW: Single sheet with all data combined)
-            print(f"\n[INFO] 합쳐진 단일시트 파일 생성 중...")
-
-            # Combine all sheet DataFrames in specific order
-            combined_dfs = []
-
-            # Define sheet order (Case List, RIL first)
-            sheet_order = []
-            if "Case List, RIL" in processed_sheets:
-                sheet_order.append("Case List, RIL")
-            if "HE Local" in processed_sheets:
-                sheet_order.append("HE Local")
-            if "HE-0214,0252 (Capacitor)" in processed_sheets:
-                sheet_order.append("HE-0214,0252 (Capacitor)")
-
-            # Add any remaining sheets not in the predefined order
-            for sheet_name in processed_sheets.keys():
-                if sheet_name not in sheet_order:
-                    sheet_order.append(sheet_name)
-
-            # Combine sheets in order
-            for sheet_name in sheet_order:
-                df, _ = processed_sheets[sheet_name]
-                df_copy = df.copy()
-                df_copy["Source_Sheet"] = sheet_name  # 출처 기록
-                combined_dfs.append(df_copy)
-
-            # Concatenate all sheets
-            merged_df = pd.concat(combined_dfs, ignore_index=True, sort=False)
-            print(f"  - 합쳐진 데이터: {len(merged_df)}행, {len(merged_df.columns)}컬럼")
-            print(f"  - Source_Sheet 컬럼 추가됨")
-
-            # Save merged file with standard 63-column header order
+            # Multi-sheet + merged outputs from the same sheet frames (one pass)
             merged_output_path = Path(out).with_name(
                 Path(out).stem.replace("_multi", "_merged") + ".xlsx"
             )
             if merged_output_path == Path(out):
                 # If no "_multi" in name, add "_merged" suffix
                 merged_output_path = Path(out).with_name(Path(out).stem + "_merged.xlsx")
-            # Apply standard 63-column header order before saving
-            merged_df_reordered = reorder_dataframe_columns(
-                merged_df, is_stage2=False, keep_unlisted=False, use_semantic_matching=True
+            merged_df_reordered, written_sheets = self._write_outputs(
+                processed_sheets, sheet_change_trackers, out, merged_output_path, total_stats
             )
-            with pd.ExcelWriter(merged_output_path, engine="openpyxl") as writer:
-                merged_df_reordered.to_excel(writer, sheet_name="Merged Data", index=False)
-
-            print(f"[OK] 합쳐진 파일 저장: {merged_output_path.name} (63개 헤더로 정리됨)")
 
             # Prepare result
             total_stats["output_file"] = out
+            if state_store is not None:
+                # Rows as written, every sheet: Warehouse-side edits, Warehouse-only
+                # rows and columns, and Warehouse-/Master-only sheets
+                for sheet_name, written in written_sheets.items():
+                    scope = self._incremental_scope(master_path, warehouse_path, sheet_name)
+                    delta, base_generations[scope + "|output"] = self._track_output_rows(
+                        state_store,
+                        scope + "|output",
+                        written,
+                        find_case_column(written.columns),
+                        generation,
+                    )
+                    delta_frames.append(delta.to_frame(sheet_name))
+                    incremental_stats.setdefault(sheet_name, dict(delta.summary(), skipped=0))
+
+                delta_path = Path(out).with_name(Path(out).stem + ".case_delta.jsonl")
+                delta_frame = (
+                    # A case can be reported by both the Master and the output state
+                    pd.concat(delta_frames, ignore_index=True).drop_duplicates(
+                        ["sheet", "case_no"], ignore_index=True
+                    )
+                    if delta_frames
+                    else pd.DataFrame(columns=["sheet", "case_no", "status"])
+                )
+                # Lets Stage 2 check that this delta follows the state its last output saw
+                delta_meta = {
+                    "generation": generation,
+                    "base_generations": base_generations,
+                    "workbooks": [file_stamp(out), file_stamp(merged_output_path)],
+                }
+                write_case_delta(delta_frame, delta_path, meta=delta_meta)
+                total_stats["delta_file"] = str(delta_path)
+                total_stats["incremental"] = incremental_stats
+                print(f"[OK] Case delta saved: {delta_path.name} ({len(delta_frame)} cases)")
             total_stats["merged_file"] = str(merged_output_path)
             total_stats["merged_rows"] = len(merged_df_reordered)
             total_stats["merged_columns"] = len(merged_df_reordered.columns)
@@ -1927,6 +2912,10 @@ class DataSynchronizerV30:
                 {},
                 matching_report=str(e),
             )
+        finally:
+            # Closed on every path, including failures in matching, updates or writing
+            if state_store is not None:
+                state_store.close()
 
     def _fuzzy_find_column(self, target_col: str, header_map: Dict[str, int]) -> Optional[int]:
         """
@@ -1938,9 +2927,8 @@ class DataSynchronizerV30:
         Example: "ETD/ATD" matches "ETD / ATD"
         """
         try:
-            from scripts.core.header_normalizer import HeaderNormalizer
+            from scripts.core.header_normalizer import HEADER_NORMALIZER as normalizer
 
-            normalizer = HeaderNormalizer()
             target_normalized = normalizer.normalize(target_col)
 
             for header, idx in header_map.items():
@@ -1953,9 +2941,258 @@ class DataSynchronizerV30:
 
         return None
 
+    def _write_outputs(
+        self,
+        processed_sheets: Dict[str, Tuple[pd.DataFrame, int]],
+        sheet_change_trackers: Dict[str, "ChangeTracker"],
+        out: str,
+        merged_output_path: Path,
+        total_stats: Dict[str, Any],
+    ) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
+        """
+        다중 시트/합친 파일을 한 번에 저장합니다. | Write the multi-sheet and merged outputs.
+
+        The 63-column order comes from the shared ``HeaderOrderManager`` cache (once
+        per distinct column signature) and both workbooks are written from the same
+        sheet frames; with ``concurrent_writes`` the two files are written in
+        parallel threads.
+
+        Args:
+            processed_sheets: ``{sheet name: (DataFrame, header_row)}``
+            sheet_change_trackers: Change tracker per sheet (highlight colors)
+            out: Multi-sheet workbook path
+            merged_output_path: Merged single-sheet workbook path
+            total_stats: Stats dict updated with the case index sidecar entries
+
+        Returns:
+            Tuple of (merged DataFrame, ``{sheet name: DataFrame}`` of the multi-sheet
+            workbook), both as written
+        """
+        sheets = {name: df for name, (df, _) in processed_sheets.items()}
+
+        # Standard order per sheet first: sheets sharing a layout reuse one mapping
+        manager = get_header_manager()
+        misses = manager.misses
+        reordered = {name: reorder_standard(df) for name, df in sheets.items()}
+        merged_df = build_merged_frame(sheets)
+        print(
+            f"  [INFO] Header order resolved for {manager.misses - misses} new column "
+            f"signature(s) ({len(reordered) + 1} frames)"
+        )
+
+        def write_multi() -> None:
+            # Change colors are applied while writing (no reopen/resave/reverify pass).
+            print(f"  Writing to: {Path(out).name} (engine: {excel_engine()})")
+            case_indexes: Dict[str, CaseKeyIndex] = {}
+            case_columns: Dict[str, Any] = {}
+            with HighlightingExcelWriter(out) as writer:
+                for sheet_name, df_reordered in reordered.items():
+                    # Clean sheet name for Excel (remove invalid characters)
+                    clean_sheet_name = sheet_name.replace("/", "_").replace("\\", "_")[
+                        :31
+                    ]  # Excel limit
+
+                    # Case No. → row index, shared by highlighting and the sidecar
+                    case_index = None
+                    case_column = find_case_column(df_reordered.columns)
+                    if case_column is not None:
+                        case_index = CaseKeyIndex.from_frame(
+                            df_reordered, case_column, mode="strip"
+                        )
+                        case_indexes[clean_sheet_name] = case_index
+                        case_columns[clean_sheet_name] = case_column
+
+                    # ✅ Use the sheet-specific change tracker
+                    plan = None
+                    tracker = sheet_change_trackers.get(sheet_name)
+                    if tracker is not None and len(tracker):
+                        plan = plan_highlights(
+                            df_reordered, tracker, self._fuzzy_find_column, case_index
+                        )
+
+                    counts = writer.write_sheet(df_reordered, clean_sheet_name, plan)
+                    print(
+                        f"    - {clean_sheet_name}: {len(df_reordered)} rows, {len(df_reordered.columns)} columns (standard order)"
+                    )
+                    if plan is not None:
+                        print(
+                            f"      [COLOR] {len(tracker)} changes → orange {counts['orange']}, "
+                            f"yellow {counts['yellow']} "
+                            f"(semantic {plan.match_by_semantic}, exact {plan.match_by_exact}, "
+                            f"fuzzy {plan.match_by_fuzzy})"
+                        )
+
+            print(f"  [OK] Saved {len(processed_sheets)} sheets with change highlighting")
+
+            sidecar_path = write_case_index_sidecar(out, case_indexes, case_columns)
+            duplicate_cases = sum(len(index.duplicates()) for index in case_indexes.values())
+            total_stats["case_index_file"] = str(sidecar_path)
+            total_stats["duplicate_case_keys"] = duplicate_cases
+            print(
+                f"  [OK] Case index saved: {sidecar_path.name} "
+                f"({sum(len(index) for index in case_indexes.values())} cases, "
+                f"{duplicate_cases} duplicated)"
+            )
+
+        def write_merged() -> None:
+            # Single sheet with all data combined, standard 63-column order
+            print(f"  - 합쳐진 데이터: {len(merged_df)}행, {len(merged_df.columns)}컬럼")
+            with pd.ExcelWriter(merged_output_path, engine=excel_engine()) as writer:
+                merged_df.to_excel(writer, sheet_name="Merged Data", index=False)
+            print(f"[OK] 합쳐진 파일 저장: {merged_output_path.name} (63개 헤더로 정리됨)")
+
+        if self.concurrent_writes:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                for future in [pool.submit(write_multi), pool.submit(write_merged)]:
+                    future.result()
+        else:
+            write_multi()
+            write_merged()
+
+        return merged_df, reordered
+
+    def _write_delta_only(
+        self,
+        sheet_change_trackers: Dict[str, "ChangeTracker"],
+        output_path: str,
+        delta_path: Optional[str],
+        total_stats: Dict[str, Any],
+    ) -> SyncResult:
+        """
+        드라이런 델타 저장. | Write the dry-run cell delta instead of the workbooks.
+
+        Args:
+            sheet_change_trackers: Change tracker per output sheet
+            output_path: Output (or warehouse) path the default delta name derives from
+            delta_path: Explicit delta file (``.jsonl`` / ``.parquet``)
+            total_stats: Accumulated sync stats
+
+        Returns:
+            SyncResult whose ``output_path`` is the delta file
+        """
+        print("\n" + "=" * 60)
+        print("PHASE 3: Dry Run (delta only, no Excel output)")
+        print("=" * 60)
+
+        frames = [
+            tracker.log.to_delta_frame().assign(sheet=sheet)
+            for sheet, tracker in sheet_change_trackers.items()
+            if len(tracker)
+        ]
+        columns = ["sheet", *DELTA_COLUMNS.values()]
+        delta = (
+            pd.concat(frames, ignore_index=True)[columns]
+            if frames
+            else pd.DataFrame(columns=columns)
+        )
+        default = Path(output_path).with_name(Path(output_path).stem + ".delta.jsonl")
+        out = Path(delta_path) if delta_path else default
+        write_case_delta(delta, out)
+
+        total_stats["delta_only"] = True
+        total_stats["cell_delta_file"] = str(out)
+        total_stats["cell_changes"] = len(delta)
+        print(f"[OK] Delta saved: {out.name} ({len(delta)} cell changes)")
+        print(
+            f"Total changes: {total_stats['updates']} updates, {total_stats['appends']} new records"
+        )
+        return SyncResult(
+            True,
+            "Dry run done (delta only).",
+            str(out),
+            total_stats,
+            matching_report="All headers matched successfully",
+        )
+
+    def _sync_settings(self) -> Dict[str, Any]:
+        """배치 워커용 설정. | Picklable settings that rebuild this synchronizer in a worker."""
+
+        settings = self._loader_settings()
+        settings.update(
+            update_engine=self.update_engine,
+            concurrent_writes=self.concurrent_writes,
+        )
+        return settings
+
+    def synchronize_many(
+        self, jobs: Sequence[Sequence[Optional[str]]], workers: Optional[int] = 1
+    ) -> BatchSyncResult:
+        """
+        여러 벤더/프로젝트를 한 번에 동기화합니다. | Run several synchronizations as one batch.
+
+        Serial batches run every job on this instance, so the semantic matcher,
+        header detector and registry are built once. With ``workers > 1`` the jobs
+        run in a process pool; each worker builds one synchronizer from this one's
+        settings and reuses it for all jobs it receives.
+
+        Args:
+            jobs: ``(master, warehouse[, output])`` per job
+            workers: Worker processes (1 = serial in this process, None/0 = CPU count)
+
+        Returns:
+            BatchSyncResult with the per-job results (job order) and summed stats
+
+        Example:
+            >>> sync = DataSynchronizerV30()
+            >>> batch = sync.synchronize_many(
+            ...     [("HITACHI.xlsx", "WH_HE.xlsx", None), ("SIEMENS.xlsx", "WH_SIM.xlsx", None)],
+            ...     workers=2,
+            ... )
+            >>> batch.stats["updates"]
+        """
+        normalized: List[SyncJob] = []
+        for job in jobs:
+            if len(job) not in (2, 3):
+                raise ValueError(f"Sync job must be (master, warehouse[, output]), got {job!r}")
+            master, warehouse = str(job[0]), str(job[1])
+            output = job[2] if len(job) == 3 and job[2] else None
+            normalized.append((master, warehouse, output))
+
+        n_workers = int(workers) if workers else (os.cpu_count() or 1)
+        if n_workers < 1:
+            raise ValueError(f"workers must be >= 1 (got {workers})")
+        n_workers = min(n_workers, len(normalized)) or 1
+        if n_workers > 1 and self.state_store_path is not None:
+            raise ValueError(
+                "Parallel batch sync cannot share one state store; use workers=1 "
+                "or run incremental jobs separately"
+            )
+
+        print(f"\n[BATCH] {len(normalized)} sync job(s), {n_workers} worker(s)")
+        started = time.perf_counter()
+        if n_workers > 1:
+            settings = self._sync_settings()
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                futures = [pool.submit(_sync_job_task, settings, *job) for job in normalized]
+                results = [future.result() for future in futures]
+        else:
+            results = [self.synchronize(*job) for job in normalized]
+
+        stats: Dict[str, Any] = {key: 0 for key in BATCH_SUM_KEYS}
+        for result in results:
+            for key in BATCH_SUM_KEYS:
+                stats[key] += result.stats.get(key, 0) or 0
+        stats.update(
+            jobs=len(results),
+            succeeded=sum(result.success for result in results),
+            failed=[job[1] for job, result in zip(normalized, results) if not result.success],
+            outputs=[result.output_path for result in results],
+            workers=n_workers,
+            seconds=round(time.perf_counter() - started, 3),
+        )
+        print(
+            f"[BATCH] {stats['succeeded']}/{stats['jobs']} succeeded: "
+            f"{stats['updates']} updates, {stats['appends']} new records "
+            f"in {stats['seconds']:.1f}s"
+        )
+        return BatchSyncResult(results, stats)
+
     def _apply_excel_formatting(self, excel_file: str, sheet_name: str, header_row: int):
         """
-        Apply color formatting to the Excel file to highlight changes.
+        Apply color formatting to an already written Excel file (reopen + save + verify).
+
+        Legacy post-write formatter; ``synchronize`` now highlights cells while writing
+        through ``HighlightingExcelWriter``.
 
         Args:
             excel_file: Path to the Excel file
@@ -1963,14 +3200,14 @@ class DataSynchronizerV30:
             header_row: Row index where headers start (0-based from pandas)
         """
         try:
+            change_log = self.change_tracker.log
+
             # Early return if no changes to apply
-            if not self.change_tracker.changes:
+            if not len(change_log):
                 print(f"      [DEBUG] No changes to apply for {sheet_name}")
                 return
 
-            print(
-                f"      [DEBUG] Applying {len(self.change_tracker.changes)} changes to {sheet_name}"
-            )
+            print(f"      [DEBUG] Applying {len(change_log)} changes to {sheet_name}")
             print(f"      [DEBUG] Target file: {excel_file}")
 
             # ✅ Load without data_only to preserve formatting
@@ -2005,13 +3242,19 @@ class DataSynchronizerV30:
             print(f"      [DEBUG] Case No. column index: {case_no_col_idx}")
 
             # ✅ Phase 4: Build Case No. → Excel row mapping
-            case_to_row = {}
+            case_index = None
             if case_no_col_idx:
-                for row_idx in range(excel_header_row + 1, ws.max_row + 1):
-                    case_no_cell = ws.cell(row=row_idx, column=case_no_col_idx)
-                    if case_no_cell.value:
-                        case_to_row[str(case_no_cell.value).strip()] = row_idx
-                print(f"      [DEBUG] Built case_to_row mapping: {len(case_to_row)} cases")
+                case_values = [
+                    row[0]
+                    for row in ws.iter_rows(
+                        min_row=excel_header_row + 1,
+                        min_col=case_no_col_idx,
+                        max_col=case_no_col_idx,
+                        values_only=True,
+                    )
+                ]
+                case_index = CaseKeyIndex.from_values(case_values, mode="strip")
+                print(f"      [DEBUG] Built case index: {len(case_index)} cases")
 
             # Define fills
             orange_fill = PatternFill(start_color=ORANGE, end_color=ORANGE, fill_type="solid")
@@ -2024,38 +3267,46 @@ class DataSynchronizerV30:
             match_by_fuzzy = 0
             orange_cells: List[Tuple[int, int]] = []
 
-            for change in self.change_tracker.changes:
-                if change.change_type != "date_update":
-                    continue
-
-                # ✅ Phase 4: Use case_no to find correct row after reordering
-                if change.case_no and change.case_no in case_to_row:
-                    excel_row = case_to_row[change.case_no]
-                else:
-                    # Fallback to old method if case_no not available
-                    excel_row = change.row_index + excel_header_row + 1
-                    if change.case_no:
-                        print(
-                            f"      [WARN] Case No. '{change.case_no}' not found in case_to_row mapping"
-                        )
+            # Column resolution runs once per (column, semantic key) group
+            for (_, column_name, semantic_key), positions in change_log.groups(
+                change_type="date_update"
+            ):
+                group_size = len(positions)
 
                 # Level 1: Use semantic key mapping (most accurate)
                 actual_col_name = self.change_tracker.get_column_name(
-                    change.semantic_key, fallback=change.column_name
+                    semantic_key, fallback=column_name
                 )
 
                 # Level 2: Exact match in header_map
                 col_idx = header_map.get(actual_col_name)
                 if col_idx:
-                    match_by_semantic += 1 if change.semantic_key else 0
-                    match_by_exact += 1
+                    match_by_semantic += group_size if semantic_key else 0
+                    match_by_exact += group_size
                 else:
                     # Level 3: Fuzzy matching (last resort)
                     col_idx = self._fuzzy_find_column(actual_col_name, header_map)
                     if col_idx:
-                        match_by_fuzzy += 1
+                        match_by_fuzzy += group_size
+
+                if not col_idx:
+                    continue
+
+                for case_no, row_index in zip(
+                    change_log.case_no_array(positions), change_log.row_index[positions].tolist()
+                ):
+                    # ✅ Phase 4: Use case_no to find correct row after reordering
+                    found = (
+                        case_index.last_row(case_no) if case_no and case_index is not None else None
+                    )
+                    if found is not None:
+                        excel_row = found + excel_header_row + 1
+                    else:
+                        # Fallback to old method if case_no not available
+                        excel_row = row_index + excel_header_row + 1
+                        if case_no:
+                            print(f"      [WARN] Case No. '{case_no}' not found in case index")
 
-                if col_idx:
                     cell = ws.cell(row=excel_row, column=col_idx)
                     if cell.value is not None and str(cell.value).strip():
                         cell.fill = orange_fill
@@ -2070,16 +3321,16 @@ class DataSynchronizerV30:
             # Apply new records (yellow)
             yellow_applied = 0
             yellow_cells: List[Tuple[int, int]] = []
-            for change in self.change_tracker.changes:
-                if change.change_type == "new_record":
-                    excel_row = change.row_index + excel_header_row + 1
+            new_positions = change_log.positions(change_type="new_record")
+            for row_index in change_log.row_index[new_positions].tolist():
+                excel_row = row_index + excel_header_row + 1
 
-                    # Color all cells with data in this row
-                    for cell in ws[excel_row]:
-                        if cell.value is not None and str(cell.value).strip():
-                            cell.fill = yellow_fill
-                            yellow_applied += 1
-                            yellow_cells.append((excel_row, cell.col_idx))
+                # Color all cells with data in this row
+                for cell in ws[excel_row]:
+                    if cell.value is not None and str(cell.value).strip():
+                        cell.fill = yellow_fill
+                        yellow_applied += 1
+                        yellow_cells.append((excel_row, cell.col_idx))
 
             print(f"      [DEBUG] Yellow cells applied: {yellow_applied}")
 
@@ -2152,14 +3403,74 @@ class DataSynchronizerV30:
             traceback.print_exc()
 
 
+# ===== Process-pool sheet loading =====
+_WORKER_LOADER: Optional[Tuple[str, DataSynchronizerV30]] = None
+
+
+def _load_sheet_task(
+    settings: Dict[str, Any],
+    file_path: str,
+    sheet_name: str,
+    file_label: str,
+    vendor_header_row: Optional[int],
+) -> Tuple[pd.DataFrame, int]:
+    """
+    워커 프로세스의 시트 로드 작업. | Sheet load task run inside a pool worker.
+
+    The loader is rebuilt once per worker process from ``settings`` and reused for
+    every further task with the same settings.
+    """
+    global _WORKER_LOADER
+
+    token = repr(sorted(settings.items()))
+    if _WORKER_LOADER is None or _WORKER_LOADER[0] != token:
+        loader = DataSynchronizerV30(
+            date_semantic_keys=settings["date_semantic_keys"],
+            header_overrides=settings["header_overrides"],
+            min_header_confidence=settings["min_header_confidence"],
+        )
+        loader.debug_dhl_wh = settings["debug_dhl_wh"]
+        _WORKER_LOADER = (token, loader)
+    return _WORKER_LOADER[1]._load_sheet(file_path, sheet_name, file_label, vendor_header_row)
+
+
+# ===== Process-pool batch sync =====
+_WORKER_SYNCHRONIZER: Optional[Tuple[str, DataSynchronizerV30]] = None
+
+
+def _sync_job_task(
+    settings: Dict[str, Any], master_xlsx: str, warehouse_xlsx: str, output_path: Optional[str]
+) -> SyncResult:
+    """
+    워커 프로세스의 동기화 작업. | One ``synchronize_many`` job run inside a pool worker.
+
+    The synchronizer (matcher, detector, registry) is built once per worker process
+    from ``settings`` and reused for every further job.
+    """
+    global _WORKER_SYNCHRONIZER
+
+    token = repr(sorted(settings.items()))
+    if _WORKER_SYNCHRONIZER is None or _WORKER_SYNCHRONIZER[0] != token:
+        sync = DataSynchronizerV30(
+            date_semantic_keys=settings["date_semantic_keys"],
+            header_overrides=settings["header_overrides"],
+            min_header_confidence=settings["min_header_confidence"],
+            update_engine=settings["update_engine"],
+            concurrent_writes=settings["concurrent_writes"],
+        )
+        sync.debug_dhl_wh = settings["debug_dhl_wh"]
+        _WORKER_SYNCHRONIZER = (token, sync)
+    return _WORKER_SYNCHRONIZER[1].synchronize(master_xlsx, warehouse_xlsx, output_path)
+
+
 if __name__ == "__main__":
     import argparse
 
     ap = argparse.ArgumentParser(
         description="DataSynchronizer v3.0 - Semantic Header Matching Edition"
     )
-    ap.add_argument("--master", required=True, help="Path to Master Excel file")
-    ap.add_argument("--warehouse", required=True, help="Path to Warehouse Excel file")
+    ap.add_argument("--master", help="Path to Master Excel file")
+    ap.add_argument("--warehouse", help="Path to Warehouse Excel file")
     ap.add_argument("--out", default="", help="Output path (optional)")
     ap.add_argument(
         "--header-override",
@@ -2170,7 +3481,67 @@ if __name__ == "__main__":
             "Provide multiple times for multiple sheets."
         ),
     )
+    ap.add_argument(
+        "--update-engine",
+        choices=UPDATE_ENGINES,
+        default="vectorized",
+        help="Update engine (vectorized = column-wise masks, loop = legacy row loop)",
+    )
+    ap.add_argument(
+        "--state-store",
+        default="",
+        help="SQLite state file for incremental sync (skips unchanged cases, writes a case delta)",
+    )
+    ap.add_argument(
+        "--load-workers",
+        type=int,
+        default=1,
+        help="Worker processes for parallel sheet loading (1 = serial, 0 = CPU count)",
+    )
+    ap.add_argument(
+        "--dry-run",
+        action="store_true",
+        help=(
+            "Compute changes only: write a cell delta (case, column, old, new, type), "
+            "no Excel (single master/warehouse runs only)"
+        ),
+    )
+    ap.add_argument(
+        "--delta-out",
+        default="",
+        help="Delta file for --dry-run (.jsonl or .parquet; default <out>.delta.jsonl)",
+    )
+    ap.add_argument(
+        "--job",
+        nargs="+",
+        action="append",
+        default=[],
+        metavar="PATH",
+        help=(
+            "Batch job: MASTER WAREHOUSE [OUT]. Provide multiple times to sync several "
+            "vendors in one run (replaces --master/--warehouse)."
+        ),
+    )
+    ap.add_argument(
+        "--batch-workers",
+        type=int,
+        default=1,
+        help="Worker processes for --job batches (1 = serial, 0 = CPU count)",
+    )
+    ap.add_argument(
+        "--concurrent-writes",
+        action="store_true",
+        help="Write the multi-sheet and merged outputs in parallel threads",
+    )
     args = ap.parse_args()
+    if any(len(job) not in (2, 3) for job in args.job):
+        ap.error("--job expects MASTER WAREHOUSE [OUT]")
+    if args.job and (args.master or args.warehouse or args.out):
+        ap.error("--job cannot be combined with --master/--warehouse/--out")
+    if args.job and (args.dry_run or args.delta_out):
+        ap.error("--dry-run/--delta-out cannot be combined with --job")
+    if not args.job and not (args.master and args.warehouse):
+        ap.error("--master and --warehouse are required unless --job is given")
 
     print("\n" + "=" * 60)
     print("DataSynchronizer v3.0")
@@ -2182,8 +3553,32 @@ if __name__ == "__main__":
     except ValueError as override_error:
         ap.error(str(override_error))
 
-    sync = DataSynchronizerV30(header_overrides=overrides)
-    res = sync.synchronize(args.master, args.warehouse, args.out or None)
+    sync = DataSynchronizerV30(
+        header_overrides=overrides,
+        update_engine=args.update_engine,
+        state_store=args.state_store or None,
+        load_workers=args.load_workers,
+        concurrent_writes=args.concurrent_writes,
+    )
+    if args.job:
+        batch = sync.synchronize_many(args.job, workers=args.batch_workers)
+
+        print("\n" + "=" * 60)
+        print("BATCH RESULT")
+        print("=" * 60)
+        for job, job_result in zip(args.job, batch.results):
+            status = "OK" if job_result.success else "FAILED"
+            print(f"[{status}] {Path(job[1]).name} -> {job_result.output_path}")
+        print(f"Stats:   {batch.stats}")
+        exit(0 if batch.success else 1)
+
+    res = sync.synchronize(
+        args.master,
+        args.warehouse,
+        args.out or None,
+        delta_only=args.dry_run,
+        delta_path=args.delta_out or None,
+    )
 
     print("\n" + "=" * 60)
     print("FINAL RESULT")
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""
+Stage 1 write-time change highlighting
+======================================
+
+변경 셀 색상을 엑셀 작성 시점에 적용합니다 (재오픈/재저장/재검증 없음).
+| Applies the orange (date update) and yellow (new record) fills while the
+Stage 1 workbook is written, so the file is produced in a single pass.
+
+- XlsxWriter available → cells are written with cached cell formats
+- Otherwise → openpyxl engine, fills set on the in-memory worksheet before save
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from scripts.core.case_index import CaseKeyIndex
+
+try:  # Optional fast writer
+    import xlsxwriter  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    xlsxwriter = None
+
+ORANGE = "FFFFA500"  # Changed date cell (ARGB)
+YELLOW = "FFFFFF00"  # New row (ARGB)
+
+# pandas ExcelWriter defaults, reused when a highlighted cell holds a date
+DATETIME_FORMAT = "YYYY-MM-DD HH:MM:SS"
+DATE_FORMAT = "YYYY-MM-DD"
+
+FuzzyFinder = Callable[[str, Dict[str, int]], Optional[int]]
+
+
+@dataclass
+class HighlightPlan:
+    """시트별 강조 셀 계획. | Cells to highlight in one sheet (0-based data row, column)."""
+
+    orange: List[Tuple[int, int]] = field(default_factory=list)
+    yellow: List[Tuple[int, int]] = field(default_factory=list)
+    match_by_semantic: int = 0
+    match_by_exact: int = 0
+    match_by_fuzzy: int = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.orange or self.yellow)
+
+    def cell_colors(self) -> Dict[Tuple[int, int], str]:
+        """셀 → 색상 (노란색 우선). | Cell → fill color; yellow wins like the old formatter."""
+
+        colors = {cell: ORANGE for cell in self.orange}
+        colors.update({cell: YELLOW for cell in self.yellow})
+        return colors
+
+
+def excel_engine() -> str:
+    """사용할 엔진 이름. | Writer engine to use ("xlsxwriter" when installed)."""
+
+    return "xlsxwriter" if xlsxwriter is not None else "openpyxl"
+
+
+def _non_empty_mask(values: pd.Series) -> np.ndarray:
+    """엑셀에 값이 남는 셀. | Cells that end up non-blank once written."""
+
+    notna = values.notna().to_numpy()
+    text = values.astype(object).map(lambda v: str(v).strip() != "").to_numpy(dtype=bool)
+    return notna & text
+
+
+def plan_highlights(
+    df: pd.DataFrame,
+    change_tracker: Any,
+    fuzzy_find: Optional[FuzzyFinder] = None,
+    case_index: Optional[CaseKeyIndex] = None,
+) -> HighlightPlan:
+    """
+    변경 로그로부터 강조 셀을 계산합니다. | Resolve change-log entries to cells of ``df``.
+
+    Mirrors the reopen-based formatter: date updates are located through the
+    written Case No. column (falling back to the stored row index) and resolved to
+    a column via semantic key → exact header → fuzzy match; new records color every
+    non-blank cell of their row.
+
+    Args:
+        df: DataFrame exactly as it will be written (header on Excel row 1)
+        change_tracker: ChangeTracker of the sheet (``log`` + ``get_column_name``)
+        fuzzy_find: Optional fallback ``(name, header_map) -> 1-based column``
+        case_index: Strip-mode ``CaseKeyIndex`` of ``df``'s Case No. column (built
+            here when omitted; the last row of a duplicated case wins)
+
+    Returns:
+        HighlightPlan with 0-based (row, column) positions
+    """
+    plan = HighlightPlan()
+    log = change_tracker.log
+    if not len(log) or df.empty:
+        return plan
+
+    # Header map (1-based, last duplicate wins) and Case No. column
+    header_map: Dict[str, int] = {}
+    case_col_idx: Optional[int] = None
+    for c_idx, col in enumerate(df.columns, start=1):
+        if col is None:
+            continue
+        header_name = str(col).strip()
+        header_map[header_name] = c_idx
+        if "Case" in header_name and "No" in header_name:
+            case_col_idx = c_idx
+
+    if case_index is None and case_col_idx:
+        case_index = CaseKeyIndex.from_values(df.iloc[:, case_col_idx - 1], mode="strip")
+
+    n_rows = len(df)
+    column_cache: Dict[int, np.ndarray] = {}
+
+    def _filled(col_pos: int) -> np.ndarray:
+        if col_pos not in column_cache:
+            column_cache[col_pos] = _non_empty_mask(df.iloc[:, col_pos])
+        return column_cache[col_pos]
+
+    for (_, column_name, semantic_key), positions in log.groups(change_type="date_update"):
+        group_size = len(positions)
+        actual_col_name = change_tracker.get_column_name(semantic_key, fallback=column_name)
+
+        col_idx = header_map.get(actual_col_name)
+        if col_idx:
+            plan.match_by_semantic += group_size if semantic_key else 0
+            plan.match_by_exact += group_size
+        elif fuzzy_find is not None:
+            col_idx = fuzzy_find(actual_col_name, header_map)
+            if col_idx:
+                plan.match_by_fuzzy += group_size
+        if not col_idx:
+            continue
+
+        col_pos = col_idx - 1
+        filled = _filled(col_pos)
+        for case_no, row_index in zip(
+            log.case_no_array(positions), log.row_index[positions].tolist()
+        ):
+            found = case_index.last_row(case_no) if case_no and case_index is not None else None
+            if found is not None:
+                row_pos = found
+            else:
+                row_pos = row_index
+                if case_no:
+                    print(f"      [WARN] Case No. '{case_no}' not found in case index")
+            if 0 <= row_pos < n_rows and filled[row_pos]:
+                plan.orange.append((row_pos, col_pos))
+
+    new_rows = log.row_index[log.positions(change_type="new_record")]
+    new_rows = np.unique(new_rows[(new_rows >= 0) & (new_rows < n_rows)])
+    if len(new_rows):
+        block = df.iloc[new_rows]
+        for col_pos in range(df.shape[1]):
+            filled = _non_empty_mask(block.iloc[:, col_pos])
+            plan.yellow.extend((int(r), col_pos) for r in new_rows[filled])
+        plan.yellow.sort()
+
+    return plan
+
+
+class HighlightingExcelWriter:
+    """
+    강조 색상을 쓰기 시점에 적용하는 엑셀 작성기. | Excel writer that applies fills while writing.
+
+    Example:
+        >>> with HighlightingExcelWriter("out.xlsx") as writer:
+        ...     writer.write_sheet(df, "Case List", plan)
+    """
+
+    def __init__(self, path: str, engine: Optional[str] = None) -> None:
+        """작성기 생성. | Open a pandas ExcelWriter on ``path``."""
+
+        self.engine = engine or excel_engine()
+        self._writer = pd.ExcelWriter(path, engine=self.engine)
+        self._formats: Dict[Tuple[str, str], Any] = {}
+        self.applied: Dict[str, Dict[str, int]] = {}
+
+    def __enter__(self) -> "HighlightingExcelWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """파일 저장 (1회). | Save the workbook once."""
+
+        self._writer.close()
+
+    def write_sheet(
+        self, df: pd.DataFrame, sheet_name: str, plan: Optional[HighlightPlan] = None
+    ) -> Dict[str, int]:
+        """
+        시트 작성 + 강조. | Write ``df`` to ``sheet_name`` and apply the plan's fills.
+
+        Returns:
+            Counts of applied fills ``{"orange": n, "yellow": n}``
+        """
+        df.to_excel(self._writer, sheet_name=sheet_name, index=False)
+        counts = {"orange": 0, "yellow": 0}
+        if plan:
+            worksheet = self._writer.sheets[sheet_name]
+            colors = plan.cell_colors()
+            if self.engine == "xlsxwriter":
+                self._apply_xlsxwriter(worksheet, df, colors)
+            else:
+                self._apply_openpyxl(worksheet, colors)
+            for color in colors.values():
+                counts["orange" if color == ORANGE else "yellow"] += 1
+        self.applied[sheet_name] = counts
+        return counts
+
+    def _format(self, color: str, kind: str):
+        """셀 서식 캐시. | Cached XlsxWriter format per (color, value kind)."""
+
+        key = (color, kind)
+        if key not in self._formats:
+            props: Dict[str, Any] = {"bg_color": "#" + color[2:], "pattern": 1}
+            if kind == "datetime":
+                props["num_format"] = DATETIME_FORMAT
+            elif kind == "date":
+                props["num_format"] = DATE_FORMAT
+            self._formats[key] = self._writer.book.add_format(props)
+        return self._formats[key]
+
+    def _apply_xlsxwriter(
+        self, worksheet: Any, df: pd.DataFrame, colors: Dict[Tuple[int, int], str]
+    ) -> None:
+        """XlsxWriter: 값과 서식을 함께 다시 기록 (메모리 내). | Rewrite cells with a format."""
+
+        for (row_pos, col_pos), color in colors.items():
+            value = df.iat[row_pos, col_pos]
+            if isinstance(value, np.generic):
+                value = value.item()
+            if isinstance(value, _dt.datetime):
+                if isinstance(value, pd.Timestamp):
+                    value = value.to_pydatetime()
+                if value.tzinfo is not None:
+                    value = value.replace(tzinfo=None)
+                worksheet.write_datetime(
+                    row_pos + 1, col_pos, value, self._format(color, "datetime")
+                )
+            elif isinstance(value, _dt.date):
+                worksheet.write_datetime(row_pos + 1, col_pos, value, self._format(color, "date"))
+            elif isinstance(value, (bool, int, float)):
+                worksheet.write(row_pos + 1, col_pos, value, self._format(color, "plain"))
+            else:
+                worksheet.write_string(
+                    row_pos + 1, col_pos, str(value), self._format(color, "plain")
+                )
+
+    @staticmethod
+    def _apply_openpyxl(worksheet: Any, colors: Dict[Tuple[int, int], str]) -> None:
+        """openpyxl: 저장 전 메모리 워크시트에 채우기 적용. | Fill in-memory cells before save."""
+
+        from openpyxl.styles import PatternFill
+
+        fills = {
+            color: PatternFill(start_color=color, end_color=color, fill_type="solid")
+            for color in set(colors.values())
+        }
+        for (row_pos, col_pos), color in colors.items():
+            worksheet.cell(row=row_pos + 2, column=col_pos + 1).fill = fills[color]
@@ -37,10 +37,12 @@ For details, see: @core/README.md
 
 from __future__ import annotations
 
+import json
 from copy import copy
 from pathlib import Path
 from typing import Iterable, Optional, Tuple
 
+import numpy as np
 import pandas as pd  # type: ignore[import-untyped]
 import yaml
 
@@ -83,6 +85,18 @@ from core.standard_header_order import (
     normalize_header_names_for_stage2,
     analyze_header_compatibility,
 )
+from core.case_fingerprint import read_case_delta, read_case_delta_meta, schema_signature
+from core.case_index import (
+    CaseKeyIndex,
+    file_stamp,
+    find_case_column,
+    load_case_index,
+    normalize_case_keys,
+)
+from core.column_resolver import resolve_columns
+from core.dtype_policy import compact_frame, frame_memory
+from core.excel_reader import open_workbook, read_excel
+from core.excel_stream import ExcelChunkWriter, iter_excel_chunks, list_sheet_names
 from .stack_and_sqm import add_sqm_and_stack, get_sqm_with_fallback
 
 SITE_COLUMN_LOOKUP = {col.lower() for col in SITE_COLUMNS}
@@ -165,15 +179,36 @@ def resolve_derived_output_path(
 
 
 def _latest_location_and_date(
-    row: pd.Series,
-) -> Tuple[str | None, pd.Timestamp | pd.NaT]:
-    """최근 위치와 날짜를 계산합니다. / Compute the latest location and date."""
-    non_null = row.dropna()
-    if non_null.empty:
-        return None, pd.NaT
-    latest_date = non_null.max()
-    latest_columns = non_null[non_null == latest_date].index
-    return latest_columns[0], latest_date
+    frame: pd.DataFrame,
+    columns: list[str],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    행별 최근 위치와 날짜를 계산합니다. / Compute the latest location and date per row.
+
+    NaT-aware argmax over a ``datetime64[ns]`` matrix: ties go to the first column
+    (column order), rows without any date get ``None`` and ``NaT``.
+
+    Returns:
+        (object array of column names or None, datetime64[ns] array of dates)
+    """
+    n_rows = len(frame)
+    if not columns or n_rows == 0:
+        return np.full(n_rows, None, dtype=object), np.full(n_rows, np.datetime64("NaT"), "M8[ns]")
+
+    dates = np.column_stack(
+        [frame[column].to_numpy(dtype="datetime64[ns]") for column in columns]
+    )
+    missing = np.isnat(dates)
+    # NaT sorts as the minimum, so argmax picks the first column holding the row maximum
+    filled = np.where(missing, np.datetime64(np.iinfo(np.int64).min + 1, "ns"), dates)
+    latest = filled.argmax(axis=1)
+    has_date = ~missing.all(axis=1)
+
+    locations = np.asarray(columns, dtype=object)[latest]
+    locations[~has_date] = None
+    latest_dates = dates[np.arange(n_rows), latest]
+    latest_dates[~has_date] = np.datetime64("NaT")
+    return locations, latest_dates
 
 
 def _classify_storage(location: str | None) -> str:
@@ -196,32 +231,33 @@ def _to_datetime_columns(df: pd.DataFrame, columns: Iterable[str]) -> None:
         df[column] = pd.to_datetime(df[column], errors="coerce")
 
 
-def calculate_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """파생 컬럼을 계산합니다. / Compute derived columns."""
-    working_df = df.copy()
+def resolve_location_columns(df: pd.DataFrame) -> Tuple[list[str], list[str]]:
+    """
+    데이터가 있는 창고/현장 컬럼을 찾습니다. / Warehouse and site columns holding data.
 
-    # ✅ Find columns with actual data by checking all possible aliases
-    from core import HVDC_HEADER_REGISTRY
-    
-    wh_cols = []
-    for wh_key in ['dhl_wh', 'dsv_indoor', 'dsv_al_markaz', 'aaa_storage', 
-                   'dsv_outdoor', 'dsv_mzp', 'mosb', 'hauler_indoor', 'jdn_mzd']:
-        definition = HVDC_HEADER_REGISTRY.get_definition(wh_key)
-        # Check all aliases and find the one with data
-        for alias in definition.aliases:
-            if alias in working_df.columns and working_df[alias].notna().sum() > 0:
-                wh_cols.append(alias)
-                break  # Use first alias with data
-    
-    st_cols = []
-    for site_key in ['mir', 'shu', 'das', 'agi']:
-        definition = HVDC_HEADER_REGISTRY.get_definition(site_key)
-        # Check all aliases and find the one with data
-        for alias in definition.aliases:
-            if alias in working_df.columns and working_df[alias].notna().sum() > 0:
-                st_cols.append(alias)
-                break  # Use first alias with data
+    Returns:
+        (warehouse columns, site columns): per registry key, the first alias with data
+    """
+    # ✅ One non-null pass over the alias columns, same rule as Stage 3 (core.column_resolver)
+    return resolve_columns(df).location_columns
+
+
+def calculate_derived_columns(
+    df: pd.DataFrame,
+    location_columns: Optional[Tuple[list[str], list[str]]] = None,
+) -> pd.DataFrame:
+    """
+    파생 컬럼을 계산합니다. / Compute derived columns.
 
+    Args:
+        df: Synced Stage 1 rows
+        location_columns: ``resolve_location_columns`` result of the full frame
+            (pass it when ``df`` is a subset of rows; default: resolved from ``df``)
+    """
+    # 얕은 복사: 컬럼 단위 대입만 하므로 입력 프레임과 원본 dtype이 유지됨 (copy-on-write)
+    working_df = df.copy(deep=False)
+
+    wh_cols, st_cols = location_columns or resolve_location_columns(working_df)
     _to_datetime_columns(working_df, wh_cols + st_cols)
 
     if wh_cols:
@@ -238,78 +274,40 @@ def calculate_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
     else:
         working_df[STATUS_SITE_COLUMN] = ""
 
-    working_df[STATUS_CURRENT_COLUMN] = working_df.apply(
-        lambda row: (
-            "site"
-            if row[STATUS_SITE_COLUMN] == 1
-            else ("warehouse" if row[STATUS_WAREHOUSE_COLUMN] == 1 else "Pre Arrival")
-        ),
-        axis=1,
-    )
+    site_any = working_df[STATUS_SITE_COLUMN].to_numpy() == 1
+    warehouse_any = working_df[STATUS_WAREHOUSE_COLUMN].to_numpy() == 1
+    status_current = np.select(
+        [site_any, warehouse_any], ["site", "warehouse"], default="Pre Arrival"
+    ).astype(object)
+    working_df[STATUS_CURRENT_COLUMN] = pd.Series(status_current, index=working_df.index)
 
-    if st_cols:
-        site_latest = working_df[st_cols].apply(
-            _latest_location_and_date,
-            axis=1,
-            result_type="expand",
-        )
-    else:
-        site_latest = pd.DataFrame(index=working_df.index, columns=[0, 1])
+    site_locations, site_dates = _latest_location_and_date(working_df, st_cols)
+    warehouse_locations, warehouse_dates = _latest_location_and_date(working_df, wh_cols)
 
-    if wh_cols:
-        warehouse_latest = working_df[wh_cols].apply(
-            _latest_location_and_date,
-            axis=1,
-            result_type="expand",
-        )
-    else:
-        warehouse_latest = pd.DataFrame(index=working_df.index, columns=[0, 1])
-
-    if not site_latest.empty:
-        site_latest.columns = ["location", "date"]
-    if not warehouse_latest.empty:
-        warehouse_latest.columns = ["location", "date"]
-
-    location_series = pd.Series("Pre Arrival", index=working_df.index)
-    location_date_series = pd.Series(
-        pd.NaT,
-        index=working_df.index,
-        dtype="datetime64[ns]",
+    # site 우선, 그 다음 warehouse; 위치가 없으면 Pre Arrival
+    locations = np.select(
+        [site_any, warehouse_any], [site_locations, warehouse_locations], default=None
+    )
+    locations[pd.isna(locations)] = "Pre Arrival"
+    location_dates = np.where(
+        site_any,
+        site_dates,
+        np.where(warehouse_any, warehouse_dates, np.datetime64("NaT", "ns")),
+    )
+
+    location_series = pd.Series(locations, index=working_df.index)
+    working_df[STATUS_LOCATION_COLUMN] = location_series
+    working_df[STATUS_LOCATION_DATE_COLUMN] = pd.Series(
+        location_dates, index=working_df.index, dtype="datetime64[ns]"
     )
 
-    site_mask = working_df[STATUS_CURRENT_COLUMN] == "site"
-    warehouse_mask = working_df[STATUS_CURRENT_COLUMN] == "warehouse"
-
-    if not site_latest.empty:
-        site_locations = site_latest.loc[site_mask, "location"]
-        site_locations = site_locations.fillna("Pre Arrival")
-        location_series.loc[site_mask] = site_locations
-        site_dates = site_latest.loc[site_mask, "date"]
-        location_date_series.loc[site_mask] = site_dates
-
-    if not warehouse_latest.empty:
-        warehouse_locations = warehouse_latest.loc[
-            warehouse_mask,
-            "location",
-        ]
-        warehouse_locations = warehouse_locations.fillna("Pre Arrival")
-        location_series.loc[warehouse_mask] = warehouse_locations
-        location_date_series.loc[warehouse_mask] = warehouse_latest.loc[
-            warehouse_mask,
-            "date",
-        ]
-
-    location_filled = location_series.replace({None: "Pre Arrival"})
-    working_df[STATUS_LOCATION_COLUMN] = location_filled
-    working_df[STATUS_LOCATION_DATE_COLUMN] = location_date_series
-
-    storage_series = location_series.apply(_classify_storage)
-    unresolved_storage_mask = storage_series == ""
-    storage_series.loc[unresolved_storage_mask] = working_df.loc[
-        unresolved_storage_mask,
-        STATUS_CURRENT_COLUMN,
-    ]
-    working_df[STATUS_STORAGE_COLUMN] = storage_series
+    # 보관 유형은 위치 이름에만 의존하므로 고유 위치별로 한 번만 분류
+    storage_lookup = {
+        location: _classify_storage(location) for location in pd.unique(locations)
+    }
+    storage = location_series.map(storage_lookup).to_numpy(dtype=object)
+    storage = np.where(storage == "", status_current, storage)
+    working_df[STATUS_STORAGE_COLUMN] = pd.Series(storage, index=working_df.index)
 
     if wh_cols:
         warehouse_handling = working_df[wh_cols].notna().sum(axis=1)
@@ -358,14 +356,333 @@ def calculate_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
     return working_df
 
 
+STAGE2_STATE_SUFFIX = ".stage2_state.json"
+STAGE2_STATE_VERSION = 2
+
+
+def stage2_state_path(output_path: str | Path) -> Path:
+    """파생 결과 상태 파일 경로 / ``<derived stem>.stage2_state.json`` next to the output."""
+    output = Path(output_path)
+    return output.with_name(output.stem + STAGE2_STATE_SUFFIX)
+
+
+def derived_schema_signature(
+    df: pd.DataFrame, location_columns: Tuple[list[str], list[str]]
+) -> str:
+    """입력 스키마 서명 / Signature of the input columns and the resolved location columns."""
+    wh_cols, st_cols = location_columns
+    return schema_signature([str(c) for c in df.columns], wh_cols, st_cols, DERIVED_COLUMNS)
+
+
+def write_stage2_state(
+    output_path: str | Path,
+    signature: str,
+    input_path: Optional[str | Path] = None,
+    generation: Optional[str] = None,
+) -> Path:
+    """
+    파생 결과 상태 저장 / Record the schema and file stamp of a written derived workbook.
+
+    The next incremental run only reuses the workbook when both still match and
+    its case delta follows ``generation`` (``delta_chain_problem``).
+
+    Args:
+        input_path: Synced workbook the output was derived from
+        generation: Stage 1 generation of that workbook (from its case delta meta),
+            None when unknown
+    """
+    output = Path(output_path)
+    payload = {
+        "version": STAGE2_STATE_VERSION,
+        "signature": signature,
+        "output": file_stamp(output),
+        "input": None if input_path is None else file_stamp(input_path),
+        "generation": generation,
+    }
+    state_path = stage2_state_path(output)
+    state_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    return state_path
+
+
+def read_stage2_state(output_path: str | Path) -> Optional[dict]:
+    """상태 로드 / Stored state, or None when missing, stale or from another version."""
+    output = Path(output_path)
+    state_path = stage2_state_path(output)
+    if not output.exists() or not state_path.exists():
+        return None
+    try:
+        payload = json.loads(state_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if payload.get("version") != STAGE2_STATE_VERSION or payload.get("output") != file_stamp(
+        output
+    ):
+        return None
+    return payload
+
+
+def delta_generation(meta: Optional[dict], input_path: str | Path) -> Optional[str]:
+    """입력의 Stage 1 세대 / Generation of ``input_path`` if the delta meta describes it."""
+    if meta is None or file_stamp(input_path) not in meta.get("workbooks", []):
+        return None
+    return meta.get("generation")
+
+
+def delta_chain_problem(
+    state: dict, meta: Optional[dict], input_path: str | Path
+) -> Optional[str]:
+    """
+    델타 연속성 검사 / Why a case delta cannot be applied to the previous output.
+
+    The delta must describe ``input_path`` and follow the Stage 1 generation the
+    previous output was derived from: every Stage 1 scope it was classified against
+    was last saved by that generation (scopes without stored state report all their
+    cases as new). Re-running on the same generation and input is also fine.
+
+    Returns:
+        Reason for a full recompute, or None when the delta chains
+    """
+    if meta is None:
+        return "델타 메타 파일 없음"
+    if delta_generation(meta, input_path) is None:
+        return "입력 파일이 델타를 만든 Stage 1 결과와 다름"
+    previous = state.get("generation")
+    if previous is None:
+        return "이전 결과의 Stage 1 세대 정보 없음"
+    if meta.get("generation") == previous:
+        if state.get("input") != file_stamp(input_path):
+            return "같은 세대의 다른 입력 파일"
+        return None
+    bases = meta.get("base_generations", {}).values()
+    if any(base is not None and base != previous for base in bases):
+        return "델타가 이전 결과 이후의 Stage 1 실행을 건너뜀"
+    return None
+
+
+def read_delta_case_keys(delta_path: str | Path) -> set[str]:
+    """
+    Stage 1 델타의 영향 케이스 / New and changed case keys of a Stage 1 case delta.
+
+    Keys use the Stage 1 rule (strip + upper), as written to ``*.case_delta.jsonl``.
+    """
+    delta = read_case_delta(delta_path)
+    if delta.empty:
+        return set()
+    affected = delta[delta["status"].isin(["new", "changed"])]
+    keys = normalize_case_keys(affected["case_no"], mode="upper")
+    return {key for key in keys if key}
+
+
+def splice_derived_columns(
+    df: pd.DataFrame,
+    previous: pd.DataFrame,
+    affected_keys: Iterable[str],
+    location_columns: Tuple[list[str], list[str]],
+    case_index: Optional[CaseKeyIndex] = None,
+) -> Optional[Tuple[pd.DataFrame, int]]:
+    """
+    변경 케이스만 재계산 / Recompute derived columns for affected rows only.
+
+    Rows whose case key is unique, unaffected by the delta and found once in the
+    previous derived output take that output's derived values; all other rows
+    (affected, new, blank or duplicated keys) are recomputed.
+
+    Args:
+        df: Current synced rows (full frame)
+        previous: Previous Stage 2 output (as written)
+        affected_keys: Case keys to recompute (``read_delta_case_keys``)
+        location_columns: ``resolve_location_columns(df)``
+        case_index: Case index of ``df`` (``load_case_index``); rebuilt from the
+            case column when omitted
+
+    Returns:
+        (frame as ``calculate_derived_columns(df)`` returns it, recomputed row count),
+        or None when either frame has no case column or ``case_index`` has another
+        row count than ``df``
+    """
+    previous_case_col = find_case_column(previous.columns)
+    # The output went through the Stage 2 header normalization (site  handling → site handling)
+    previous_names = {
+        column: normalize_header_names_for_stage2(pd.DataFrame(columns=[column])).columns[0]
+        for column in DERIVED_COLUMNS
+    }
+    if case_index is None:
+        case_col = find_case_column(df.columns)
+        if case_col is None:
+            return None
+        case_index = CaseKeyIndex.from_values(df[case_col], "upper")
+    if previous_case_col is None or case_index.n_rows != len(df):
+        return None
+
+    current = case_index.with_mode("upper")
+    keys = current.keys
+    previous_index = CaseKeyIndex.from_values(previous[previous_case_col], "upper")
+    # Row of each current key in the previous output (-1: missing or duplicated there)
+    previous_rows = previous_index.lookup(keys, normalize=False)
+    previous_rows[previous_rows != previous_index.lookup(keys, "last", normalize=False)] = -1
+
+    reuse = (
+        (previous_rows >= 0)
+        & (current.lookup(keys, normalize=False) == current.lookup(keys, "last", normalize=False))
+        & ~pd.Series(keys).isin(set(affected_keys)).to_numpy()
+    )
+    recompute = np.flatnonzero(~reuse)
+
+    computed = calculate_derived_columns(df.iloc[recompute], location_columns)
+    wh_cols, st_cols = location_columns
+    result = df.copy(deep=False)
+    _to_datetime_columns(result, wh_cols + st_cols)
+    for column in DERIVED_COLUMNS:
+        if column not in computed.columns:
+            continue
+        values = np.empty(len(df), dtype=object)
+        values[recompute] = computed[column].to_numpy(dtype=object)
+        # Same schema, same output columns: a derived column the previous output
+        # lacks was dropped by the reorder and is dropped again, so it stays empty
+        if previous_names[column] in previous.columns:
+            values[reuse] = previous[previous_names[column]].to_numpy(dtype=object)[
+                previous_rows[reuse]
+            ]
+        result[column] = pd.Series(values, index=df.index).infer_objects()
+    return result[list(computed.columns)], len(recompute)
+
+
+def _incremental_derived(
+    df: pd.DataFrame,
+    location_columns: Tuple[list[str], list[str]],
+    signature: str,
+    case_delta: str | Path,
+    previous_output: str | Path,
+    input_path: str | Path,
+    case_index: Optional[CaseKeyIndex] = None,
+) -> Optional[pd.DataFrame]:
+    """델타 기반 증분 계산 (불가 시 None) / Incremental derived frame, or None for a full run."""
+    state = read_stage2_state(previous_output)
+    if state is None:
+        print("[INFO] 증분 처리 불가: 이전 결과/상태 파일 없음 또는 변경됨 - 전체 재계산")
+        return None
+    if state.get("signature") != signature:
+        print("[INFO] 증분 처리 불가: 입력 스키마 변경 - 전체 재계산")
+        return None
+    problem = delta_chain_problem(state, read_case_delta_meta(case_delta), input_path)
+    if problem is not None:
+        print(f"[INFO] 증분 처리 불가: {problem} - 전체 재계산")
+        return None
+
+    affected = read_delta_case_keys(case_delta)
+    previous = read_excel(previous_output)
+    spliced = splice_derived_columns(df, previous, affected, location_columns, case_index)
+    if spliced is None:
+        print("[INFO] 증분 처리 불가: Case No. 컬럼 없음 - 전체 재계산")
+        return None
+
+    result, recomputed = spliced
+    print(
+        f"[INCREMENTAL] Stage 2: 델타 {len(affected)}개 케이스, "
+        f"재계산 {recomputed}/{len(df)}행, 재사용 {len(df) - recomputed}행"
+    )
+    return result
+
+
+def _stream_layout(
+    input_path: Path, sheet_names: list[str], chunk_size: int
+) -> Tuple[list, pd.DataFrame, int]:
+    """
+    스트리밍 1차 패스 / Column union, data presence and row count of all sheets.
+
+    Returns:
+        (columns in ``pd.concat`` order, one-row frame with 1 for columns holding
+        data and NaN otherwise, total rows)
+    """
+    columns: dict = {}
+    with_data: set = set()
+    rows = 0
+    for sheet_name in sheet_names:
+        for chunk in iter_excel_chunks(input_path, sheet_name, chunk_size, coerce=False):
+            columns.update(dict.fromkeys(chunk.columns))
+            with_data.update(chunk.columns[chunk.notna().any()])
+            rows += len(chunk)
+        if len(sheet_names) > 1:
+            columns.setdefault("Source_Sheet")
+            with_data.add("Source_Sheet")
+    presence = pd.DataFrame(
+        {column: [1 if column in with_data else np.nan] for column in columns}
+    )
+    return list(columns), presence, rows
+
+
+def _process_derived_columns_streaming(
+    input_path: Path, sheet_names: list[str], output_path: Path, chunk_size: int
+) -> None:
+    """
+    청크 스트리밍 파생 계산 / Compute and write derived columns chunk by chunk.
+
+    A first pass collects the column union and which columns hold data (for the
+    location columns), the second computes each chunk and appends it to the
+    output, so peak memory follows ``chunk_size`` rather than the history length.
+    """
+    columns, presence, total_rows = _stream_layout(input_path, sheet_names, chunk_size)
+    location_columns = resolve_location_columns(presence)
+    print(f"[INFO] 스트리밍 모드: {total_rows}행, {len(columns)}컬럼, 청크 {chunk_size}행")
+
+    chunks = 0
+    peak_bytes = 0
+    sqm_count = 0
+    stack_count = 0
+    with ExcelChunkWriter(output_path) as writer:
+        for sheet_name in sheet_names:
+            for chunk in iter_excel_chunks(input_path, sheet_name, chunk_size):
+                if len(sheet_names) > 1:
+                    chunk["Source_Sheet"] = sheet_name
+                chunk = calculate_derived_columns(chunk.reindex(columns=columns), location_columns)
+                chunk = normalize_header_names_for_stage2(chunk)
+                chunk = reorder_dataframe_columns(chunk, is_stage2=True, use_semantic_matching=True)
+                chunk = chunk.loc[:, ~chunk.columns.duplicated()]
+
+                validation = validate_sqm_stack_presence(chunk)
+                sqm_count += validation["sqm_calculated_count"]
+                stack_count += validation["stack_parsed_count"]
+                peak_bytes = max(peak_bytes, frame_memory(chunk))
+                writer.write(chunk)
+                chunks += 1
+                print(f"[STREAM] 청크 {chunks}: 누적 {writer.rows}/{total_rows}행")
+
+    print(f"[MEM] Stage 2 스트리밍: 청크 {chunks}개, 최대 청크 {peak_bytes / 1024**2:.1f} MB")
+    print(f"  - SQM 계산됨: {sqm_count}개")
+    print(f"  - Stack_Status 파싱됨: {stack_count}개")
+    print(
+        "SUCCESS: 파생 컬럼 %s개 계산 완료 (행: %s, 컬럼: %s)"
+        % (len(DERIVED_COLUMNS), writer.rows, len(writer.columns or []))
+    )
+    signature = derived_schema_signature(pd.DataFrame(columns=columns), location_columns)
+    write_stage2_state(output_path, signature, input_path)
+    print(f"SUCCESS: 파일 저장 완료: {output_path}")
+
+
 def process_derived_columns(
     input_file: Optional[str | Path] = None,
     *,
     pipeline_config_path: Optional[Path] = None,
     stage2_config_path: Optional[Path] = None,
     project_root: Optional[Path] = None,
+    case_delta: Optional[str | Path] = None,
+    previous_output: Optional[str | Path] = None,
+    chunk_size: Optional[int] = None,
 ) -> bool:
-    """파생 컬럼을 계산합니다. / Process derived columns."""
+    """
+    파생 컬럼을 계산합니다. / Process derived columns.
+
+    Args:
+        input_file: Synced Stage 1 workbook (default: resolved from the configs)
+        case_delta: Stage 1 case delta (``*.case_delta.jsonl``); when given, only
+            new/changed cases are recomputed and the rest is reused from the
+            previous output (full recompute if the schema or that output changed,
+            or the delta does not follow the Stage 1 run that output came from)
+        previous_output: Previous Stage 2 workbook (default: the configured output)
+        chunk_size: Stream the input in chunks of this many rows (bounded memory
+            for long histories); skips the case index and header compatibility
+            reports and cannot be combined with ``case_delta``
+    """
     resolved_input_path = (
         resolve_synced_input_path(
             pipeline_config_path=pipeline_config_path,
@@ -387,11 +704,21 @@ def process_derived_columns(
     if not resolved_input_path.exists():
         raise FileNotFoundError(f"입력 파일을 찾을 수 없습니다: {resolved_input_path}")
 
+    if chunk_size:
+        if case_delta is not None:
+            raise ValueError("chunk_size와 case_delta는 함께 사용할 수 없습니다")
+        stage2_config = load_stage2_config(config_path=stage2_config_path)
+        output_path = resolve_derived_output_path(stage2_config=stage2_config, project_root=root)
+        _process_derived_columns_streaming(
+            resolved_input_path, list_sheet_names(resolved_input_path), output_path, chunk_size
+        )
+        return True
+
     # 데이터 로드 (Multi-sheet support)
     print(f"[INFO] Multi-sheet 파일 로드 중: {Path(resolved_input_path).name}")
     
     # Check if file has multiple sheets
-    xl = pd.ExcelFile(resolved_input_path)
+    xl = open_workbook(resolved_input_path)
     sheet_names = xl.sheet_names
     print(f"  - 발견된 시트: {len(sheet_names)}개")
     for i, sheet_name in enumerate(sheet_names):
@@ -400,25 +727,57 @@ def process_derived_columns(
     if len(sheet_names) > 1:
         # Multi-sheet: Load all sheets and combine
         print(f"[INFO] 다중 시트 감지 - 모든 시트를 합치는 중...")
-        all_dfs = []
+        all_dfs = {}
         
         for sheet_name in sheet_names:
             print(f"  - 시트 '{sheet_name}' 로드 중...")
-            sheet_df = pd.read_excel(xl, sheet_name=sheet_name)
+            sheet_df = read_excel(xl, sheet_name=sheet_name)
             sheet_df["Source_Sheet"] = sheet_name  # 출처 기록
-            all_dfs.append(sheet_df)
+            all_dfs[sheet_name] = sheet_df
             print(f"    [OK] {len(sheet_df)}행 로드됨")
         
         # Combine all sheets
-        df = pd.concat(all_dfs, ignore_index=True, sort=False)
+        df = pd.concat(all_dfs.values(), ignore_index=True, sort=False)
         print(f"[OK] 시트 합치기 완료: {len(df)}행, {len(df.columns)}컬럼")
         print(f"  - Source_Sheet 컬럼 추가됨")
     else:
         # Single sheet: Load normally
-        df = pd.read_excel(resolved_input_path)
+        df = read_excel(xl, sheet_name=sheet_names[0])
+        all_dfs = {sheet_names[0]: df}
         print(f"[OK] 단일 시트 로드 완료: {len(df)}행, {len(df.columns)}컬럼")
 
-    df = calculate_derived_columns(df)
+    # Case No. 색인: Stage 1 사이드카 재사용 (없거나 오래되면 재생성)
+    # Upper-case keys: the Stage 1 delta rule, used for the incremental splice below
+    case_index = CaseKeyIndex.concat(
+        list(load_case_index(resolved_input_path, all_dfs, mode="upper").values())
+    )
+    duplicates = case_index.duplicates()
+    print(f"[INFO] Case 색인: {len(case_index)}개 케이스, 중복 {len(duplicates)}개")
+    if len(duplicates):
+        print(f"  - 중복 예시: {duplicates['case_key'].head(5).tolist()}")
+
+    df, load_report = compact_frame(df, "Stage 2 load")
+    print(f"[MEM] {load_report}")
+
+    stage2_config = load_stage2_config(config_path=stage2_config_path)
+    output_path = resolve_derived_output_path(stage2_config=stage2_config, project_root=root)
+    location_columns = resolve_location_columns(df)
+    signature = derived_schema_signature(df, location_columns)
+
+    spliced = None
+    if case_delta is not None:
+        spliced = _incremental_derived(
+            df,
+            location_columns,
+            signature,
+            case_delta,
+            previous_output or output_path,
+            resolved_input_path,
+            case_index,
+        )
+    df = calculate_derived_columns(df, location_columns) if spliced is None else spliced
+    df, derived_report = compact_frame(df, "Stage 2 derived")
+    print(f"[MEM] {derived_report}")
 
     # ✅ 헤더명 정규화 추가 (No → no., site  handling → site handling)
     print("\n[INFO] Stage 2 헤더명 정규화 중...")
@@ -452,27 +811,9 @@ def process_derived_columns(
     df = reorder_dataframe_columns(df, is_stage2=True, use_semantic_matching=True)
     print(f"  [SUCCESS] 재정렬 완료: {len(df.columns)}개 컬럼")
 
-    # ✅ Find columns with actual data by checking all possible aliases
-    from core import HVDC_HEADER_REGISTRY
-    
-    wh_cols_found = []
-    for wh_key in ['dhl_wh', 'dsv_indoor', 'dsv_al_markaz', 'aaa_storage', 
-                   'dsv_outdoor', 'dsv_mzp', 'mosb', 'hauler_indoor', 'jdn_mzd']:
-        definition = HVDC_HEADER_REGISTRY.get_definition(wh_key)
-        # Check all aliases and find the one with data
-        for alias in definition.aliases:
-            if alias in df.columns and df[alias].notna().sum() > 0:
-                wh_cols_found.append(alias)
-                break  # Use first alias with data
-    
-    st_cols_found = []
-    for site_key in ['mir', 'shu', 'das', 'agi']:
-        definition = HVDC_HEADER_REGISTRY.get_definition(site_key)
-        # Check all aliases and find the one with data
-        for alias in definition.aliases:
-            if alias in df.columns and df[alias].notna().sum() > 0:
-                st_cols_found.append(alias)
-                break  # Use first alias with data
+    # Resolved once on the loaded frame; header normalization/reorder keep these names
+    wh_cols_found = [column for column in location_columns[0] if column in df.columns]
+    st_cols_found = [column for column in location_columns[1] if column in df.columns]
 
     print(f"Warehouse 컬럼: {len(wh_cols_found)}개 - {wh_cols_found}")
     print(f"Site 컬럼: {len(st_cols_found)}개 - {st_cols_found}")
@@ -489,18 +830,47 @@ def process_derived_columns(
         df = df.loc[:, ~df.columns.duplicated()]
         print(f"[OK] 중복 제거 후 컬럼 수: {len(df.columns)}")
 
-    stage2_config = load_stage2_config(config_path=stage2_config_path)
-    output_path = resolve_derived_output_path(stage2_config=stage2_config, project_root=root)
     df.to_excel(output_path, index=False)
+    generation = (
+        None
+        if case_delta is None
+        else delta_generation(read_case_delta_meta(case_delta), resolved_input_path)
+    )
+    write_stage2_state(output_path, signature, resolved_input_path, generation)
     print(f"SUCCESS: 파일 저장 완료: {output_path}")
 
     return True
 
 
-def main() -> int:
+def main(argv: Optional[list[str]] = None) -> int:
     """메인 실행을 수행합니다. / Execute script entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Stage 2 파생 컬럼 처리")
+    parser.add_argument("--input", default=None, help="Stage 1 동기화 파일 (기본: 설정 파일)")
+    parser.add_argument(
+        "--case-delta",
+        default=None,
+        help="Stage 1 case delta (*.case_delta.jsonl): 변경 케이스만 재계산",
+    )
+    parser.add_argument(
+        "--previous-output", default=None, help="재사용할 이전 Stage 2 결과 (기본: 출력 경로)"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="행 청크 단위 스트리밍 처리 (예: 20000, 메모리 상한)",
+    )
+    args = parser.parse_args(argv)
+
     try:
-        success = process_derived_columns()
+        success = process_derived_columns(
+            args.input,
+            case_delta=args.case_delta,
+            previous_output=args.previous_output,
+            chunk_size=args.chunk_size,
+        )
         if success:
             stage2_config = load_stage2_config()
             derived_path = resolve_derived_output_path(stage2_config=stage2_config)
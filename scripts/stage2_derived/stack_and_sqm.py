@@ -20,12 +20,13 @@ from __future__ import annotations
 
 import math
 import re
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
 import pandas as pd
 
 # Core 모듈에서 Stack_Status 파싱 함수 import
 from core.data_parser import parse_stack_status as core_parse_stack_status
+from core.parse_cache import STACK_STATUS_PARSER, DistinctValueParser
 
 # 정규식 패턴 사전 컴파일 (성능 최적화)
 NOT_STACK_PATTERNS = [
@@ -47,7 +48,7 @@ PCS_PAT = re.compile(r"(\d+)\s*(pcs?)", re.IGNORECASE)
 TIER_PAT = re.compile(r"(\d+)\s*(tier|tiers?)", re.IGNORECASE)
 
 
-def _to_float(value: Union[str, float, int, None]) -> Optional[float]:
+def _parse_float(value: Union[str, float, int, None]) -> Optional[float]:
     """
     안전한 float 변환 함수
 
@@ -74,6 +75,63 @@ def _to_float(value: Union[str, float, int, None]) -> Optional[float]:
         return None
 
 
+# 치수 문자열은 반복값이 많으므로 고유값별로 한 번만 변환 (LRU 캐시)
+FLOAT_PARSER = DistinctValueParser(_parse_float)
+
+
+def _to_float(value: Union[str, float, int, None]) -> Optional[float]:
+    """안전한 float 변환 (캐시 경유) / Cached ``_parse_float``."""
+    return FLOAT_PARSER(value)
+
+
+def _find_dimension_columns(
+    columns, l_col: Optional[str] = None, w_col: Optional[str] = None
+) -> Tuple[Optional[str], Optional[str]]:
+    """길이/너비 컬럼 탐지 (compute_sqm_from_dims와 동일 규칙)"""
+    if not l_col:
+        for col in ["L(CM)", "Length (cm)", "L CM", "Length", "L(mm)", "L(MM)"]:
+            if col in columns:
+                l_col = col
+                break
+
+    if not w_col:
+        for col in ["W(CM)", "Width (cm)", "W CM", "Width", "W(mm)", "W(MM)"]:
+            if col in columns:
+                w_col = col
+                break
+
+    return l_col, w_col
+
+
+def _sqm_column(
+    df: pd.DataFrame, l_col: Optional[str] = None, w_col: Optional[str] = None
+) -> pd.Series:
+    """
+    컬럼 단위 SQM 계산 (행별 compute_sqm_from_dims와 같은 결과)
+
+    치수 값은 FLOAT_PARSER.map으로 고유값별 1회만 변환합니다.
+    """
+    if df.empty:
+        return pd.Series(index=df.index, dtype=float)
+
+    l_col, w_col = _find_dimension_columns(df.columns, l_col, w_col)
+    if not l_col or not w_col or l_col not in df.columns or w_col not in df.columns:
+        return pd.Series([None] * len(df), index=df.index)
+
+    lengths = FLOAT_PARSER.map(df[l_col]).tolist()
+    widths = FLOAT_PARSER.map(df[w_col]).tolist()
+    l_scale = 10.0 if "mm" in l_col.lower() else 1.0
+    w_scale = 10.0 if "mm" in w_col.lower() else 1.0
+
+    values = []
+    for L, W in zip(lengths, widths):
+        if L is None or W is None or pd.isna(L) or pd.isna(W) or L <= 0 or W <= 0:
+            values.append(None)
+        else:
+            values.append(round(((L / l_scale) * (W / w_scale)) / 10000.0, 2))
+    return pd.Series(values, index=df.index)
+
+
 def compute_sqm_from_dims(
     row: pd.Series, l_col: Optional[str] = None, w_col: Optional[str] = None
 ) -> Optional[float]:
@@ -89,17 +147,7 @@ def compute_sqm_from_dims(
         계산된 SQM 값 또는 None (계산 불가 시)
     """
     # 컬럼명 자동 탐지
-    if not l_col:
-        for col in ["L(CM)", "Length (cm)", "L CM", "Length", "L(mm)", "L(MM)"]:
-            if col in row.index:
-                l_col = col
-                break
-
-    if not w_col:
-        for col in ["W(CM)", "Width (cm)", "W CM", "Width", "W(mm)", "W(MM)"]:
-            if col in row.index:
-                w_col = col
-                break
+    l_col, w_col = _find_dimension_columns(row.index, l_col, w_col)
 
     if not l_col or not w_col:
         return None
@@ -160,9 +208,7 @@ def add_sqm_and_stack(
 
     # SQM 계산
     if l_col or w_col or any(col in df.columns for col in ["L(CM)", "W(CM)", "Length", "Width"]):
-        result_df["SQM"] = result_df.apply(
-            lambda row: compute_sqm_from_dims(row, l_col, w_col), axis=1
-        )
+        result_df["SQM"] = _sqm_column(result_df, l_col, w_col)
     else:
         # 치수 컬럼이 없어도 기본값으로 SQM 컬럼 추가
         result_df["SQM"] = None
@@ -170,12 +216,12 @@ def add_sqm_and_stack(
     # Stack_Status 계산
     if stack_col or any(col in df.columns for col in ["Stackability", "Stackable", "Stack"]):
         if stack_col and stack_col in df.columns:
-            result_df["Stack_Status"] = df[stack_col].apply(parse_stack_status)
+            result_df["Stack_Status"] = STACK_STATUS_PARSER.map(df[stack_col])
         else:
             # 자동 탐지
             for col in ["Stackability", "Stackable", "Stack", "Stack ability"]:
                 if col in df.columns:
-                    result_df["Stack_Status"] = df[col].apply(parse_stack_status)
+                    result_df["Stack_Status"] = STACK_STATUS_PARSER.map(df[col])
                     break
             else:
                 # Stack 컬럼이 없으면 기본값으로 Stack_Status 컬럼 추가
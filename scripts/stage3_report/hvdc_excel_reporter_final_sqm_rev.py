@@ -36,6 +36,7 @@ import re
 
 # Core 중앙집중식 헤더 관리 사용
 from core import get_warehouse_columns, get_site_columns
+from core.excel_reader import open_workbook, read_excel
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -376,7 +377,7 @@ class CorrectedWarehouseIOCalculator:
             logger.warning(f"File not found: {file_path}")
             return pd.DataFrame()
 
-        xl = pd.ExcelFile(file_path)
+        xl = open_workbook(file_path)
         all_dfs = []
 
         logger.info(f" Loading {len(xl.sheet_names)} sheets from {vendor_name} file")
@@ -384,7 +385,7 @@ class CorrectedWarehouseIOCalculator:
         for sheet_name in xl.sheet_names:
             logger.info(f"  Loading sheet: '{sheet_name}'")
             try:
-                df = pd.read_excel(xl, sheet_name=sheet_name, engine="openpyxl")
+                df = read_excel(xl, sheet_name=sheet_name)
 
                 if df.empty:
                     logger.warning(f"  Skipping empty sheet: '{sheet_name}'")
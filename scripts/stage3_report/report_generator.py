@@ -26,6 +26,7 @@ import os
 import re
 import sys
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -39,10 +40,13 @@ from core.standard_header_order import (
     normalize_header_names_for_stage3,
     analyze_header_compatibility,
 )
-from core.data_parser import parse_stack_status
+from core.parse_cache import STACK_STATUS_PARSER
 from core.header_registry import HVDC_HEADER_REGISTRY, HeaderCategory
 from core import get_warehouse_columns, get_site_columns
-from core.header_normalizer import HeaderNormalizer
+from core.header_normalizer import HEADER_NORMALIZER
+from core.column_resolver import resolve_columns
+from core.dtype_policy import compact_frame
+from core.excel_reader import read_excel
 from core.flow_ledger_v2 import (
     build_flow_ledger,
     monthly_inout_table,
@@ -266,8 +270,8 @@ def _calculate_stack_status(df: pd.DataFrame, stack_col: str = "Stack") -> pd.Se
         logger.warning(f"[WARN] '{stack_col}' 컬럼이 없습니다. Stack_Status를 None으로 설정합니다.")
         return pd.Series([None] * len(df), index=df.index)
 
-    # core.data_parser 사용
-    return df[stack_col].apply(parse_stack_status)
+    # core.data_parser 파서를 고유값별 1회 적용 (Stage 2와 LRU 캐시 공유)
+    return STACK_STATUS_PARSER.map(df[stack_col])
 
 
 def _calculate_total_sqm(df: pd.DataFrame) -> pd.Series:
@@ -590,7 +594,7 @@ class CorrectedWarehouseIOCalculator:
             # HITACHI 데이터 로드 (전체)
             if self.hitachi_file.exists():
                 logger.info(f" HITACHI 데이터 로드: {self.hitachi_file}")
-                hitachi_data = pd.read_excel(self.hitachi_file, engine="openpyxl")
+                hitachi_data = read_excel(self.hitachi_file)
                 
                 # Remove duplicate columns before processing
                 duplicate_cols = hitachi_data.columns[hitachi_data.columns.duplicated()].tolist()
@@ -621,13 +625,11 @@ class CorrectedWarehouseIOCalculator:
 
                 #  FIX 1: AAA Storage 컬럼 검증
                 print(f"\n HITACHI 파일 창고 컬럼 분석:")
+                # 별칭 컬럼 건수는 한 번에 계산 (중복 컬럼은 첫 번째 기준)
+                resolution = resolve_columns(hitachi_data)
                 for warehouse in self.warehouse_columns:
                     if warehouse in hitachi_data.columns:
-                        col_data = hitachi_data[warehouse]
-                        # Ensure we have a Series, not a DataFrame
-                        if isinstance(col_data, pd.DataFrame):
-                            col_data = col_data.iloc[:, 0]  # Take first column if DataFrame
-                        non_null_count = col_data.notna().sum()
+                        non_null_count = resolution.non_null_count(warehouse)
                         print(f"    {warehouse}: {non_null_count}건 데이터")
                     else:
                         print(f"    {warehouse}: 컬럼 없음 - 빈 컬럼 추가")
@@ -660,7 +662,7 @@ class CorrectedWarehouseIOCalculator:
             # SIMENSE 데이터 로드 (전체)
             if self.simense_file.exists():
                 logger.info(f" SIMENSE 데이터 로드: {self.simense_file}")
-                simense_data = pd.read_excel(self.simense_file, engine="openpyxl")
+                simense_data = read_excel(self.simense_file)
                 # [패치] 컬럼명 정규화 및 동의어 매핑
                 simense_data.columns = normalize_columns(simense_data.columns)
                 simense_data = apply_column_synonyms(simense_data)
@@ -670,9 +672,10 @@ class CorrectedWarehouseIOCalculator:
 
                 #  FIX 1: AAA Storage 컬럼 검증 및 보완
                 print(f"\n SIMENSE 파일 창고 컬럼 분석:")
+                resolution = resolve_columns(simense_data)
                 for warehouse in self.warehouse_columns:
                     if warehouse in simense_data.columns:
-                        non_null_count = simense_data[warehouse].notna().sum()
+                        non_null_count = resolution.non_null_count(warehouse)
                         print(f"    {warehouse}: {non_null_count}건 데이터")
                     else:
                         print(f"    {warehouse}: 컬럼 없음 - 빈 컬럼 추가")
@@ -708,6 +711,7 @@ class CorrectedWarehouseIOCalculator:
                 #  FIX: 통합 후 누락 컬럼 재확인
                 print(f"\n 통합 데이터 컬럼 검증:")
                 missing_warehouses = []
+                resolution = resolve_columns(self.combined_data)
                 for warehouse in self.warehouse_columns:
                     if warehouse not in self.combined_data.columns:
                         missing_warehouses.append(warehouse)
@@ -720,7 +724,7 @@ class CorrectedWarehouseIOCalculator:
                             col_data = col_data.iloc[:, 0]  # Take first column if DataFrame
                             # Update the actual column
                             self.combined_data[warehouse] = col_data
-                        non_null_count = col_data.notna().sum()
+                        non_null_count = resolution.non_null_count(warehouse)
                         print(f"    {warehouse}: {non_null_count}건 데이터")
 
                 if missing_warehouses:
@@ -2781,12 +2785,14 @@ def _canonical_warehouses() -> List[str]:
     return [d.description for d in _warehouse_defs()]
 
 
+@lru_cache(maxsize=None)
 def _alias_map_normalized() -> Dict[str, str]:
     """
     별칭 → 정식 라벨 매핑(노멀라이즈된 키).
     모든 별칭을 HeaderNormalizer로 정규화해 lookup 키로 사용.
+    최초 1회만 생성 (``_canon_warehouse``가 값마다 호출하므로) - 읽기 전용으로 사용.
     """
-    normalizer = HeaderNormalizer()
+    normalizer = HEADER_NORMALIZER
     amap: Dict[str, str] = {}
     for d in _warehouse_defs():
         canonical = d.description  # e.g., "DSV Indoor"
@@ -2808,7 +2814,7 @@ def _canon_warehouse(value: object) -> Optional[str]:
     if not s:
         return None
     _amap = _alias_map_normalized()
-    k = HeaderNormalizer().normalize(s)
+    k = HEADER_NORMALIZER.normalize(s)
     return _amap.get(k)
 
 
@@ -2866,8 +2872,8 @@ def _build_latest_snapshot_from_master(stats: Dict) -> Dict[str, int]:
     if not loc_col or not qty_col:
         return {}
 
-    # 헤더 정규화(별칭→정식 라벨)
-    normalizer = HeaderNormalizer()
+    # 헤더 정규화(별칭→정식 라벨, 공유 캐시 인스턴스)
+    normalizer = HEADER_NORMALIZER
 
     # 레지스트리에서 창고 라벨(정식) 수집
     WAREHOUSE_LABELS = {
@@ -3823,13 +3829,11 @@ class HVDCExcelReporterFinal:
 
         #  FIX: 원본 데이터 시트들 (컬럼 보존)
         # ✅ Source_Vendor 컬럼 사용 (Stage 1-2와 일관성) + SIEMENS 철자 수정
-        hitachi_original = stats["processed_data"][
-            stats["processed_data"]["Source_Vendor"] == "HITACHI"
-        ].copy()
-        siemens_original = stats["processed_data"][
-            stats["processed_data"]["Source_Vendor"] == "SIEMENS"
-        ].copy()
-        combined_original = stats["processed_data"].copy()
+        # 전체 복사 대신 dtype 정책 적용 (category/Arrow 문자열, 나머지 컬럼은 공유)
+        combined_original, memory_report = compact_frame(stats["processed_data"], "Stage 3 원본 데이터")
+        print(f"[MEM] {memory_report}")
+        hitachi_original = combined_original[combined_original["Source_Vendor"] == "HITACHI"]
+        siemens_original = combined_original[combined_original["Source_Vendor"] == "SIEMENS"]
 
         #  검증: AAA Storage 컬럼 존재 확인
         print(f"\n 최종 데이터 컬럼 검증:")
@@ -47,6 +47,8 @@ import sys
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
 from core import get_warehouse_columns, get_site_columns
+from core.dtype_policy import compact_frame
+from core.excel_reader import read_excel
 
 # Optional deps
 try:
@@ -705,8 +707,12 @@ class HybridAnomalyDetector:
 # ----- CLI (optional) ----------------------------------------------------------
 def _load_excel(path: str, sheet: Optional[str] = None) -> pd.DataFrame:
     if path.lower().endswith((".xlsx", ".xlsm", ".xls")):
-        return pd.read_excel(path, sheet_name=sheet)
-    return pd.read_csv(path)
+        df = read_excel(path, sheet_name=sheet)
+    else:
+        df = pd.read_csv(path)
+    df, memory_report = compact_frame(df, "Stage 4 load")
+    logger.info(f"[MEM] {memory_report}")
+    return df
 
 
 def main():
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-import re, shutil
+import re, shutil, sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple, Union
@@ -8,6 +8,9 @@ from typing import Dict, Iterable, List, Optional, Tuple, Union
 import openpyxl
 from openpyxl.styles import PatternFill
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from core.case_index import CaseKeyIndex
+
 # ---- ARGB 정의(불투명: FF alpha). 검증 스크립트 호환 위해 00/FF 모두 허용 ----
 DEFAULT_STAGE3_SHEET = "통합_원본데이터_Fixed"
 
@@ -104,13 +107,20 @@ class AnomalyVisualizer:
         debug_matched = 0
         debug_total = 0
         
-        for r in range(2, ws.max_row+1):
-            debug_total += 1
-            raw_id = ws.cell(row=r, column=case_col_idx).value
-            cid = _norm_case(raw_id)
-            if not cid or cid not in self.by_case:
-                continue
-
+        # Case 열을 한 번 읽어 색인 → 이상치 케이스의 행만 방문
+        case_values = [
+            row[0]
+            for row in ws.iter_rows(
+                min_row=2, min_col=case_col_idx, max_col=case_col_idx, values_only=True
+            )
+        ]
+        case_index = CaseKeyIndex.from_values(case_values, mode="compact")
+        debug_total = len(case_values)
+        matched_rows = sorted(
+            (int(pos) + 2, cid) for cid in self.by_case for pos in case_index.rows(cid)
+        )
+
+        for r, cid in matched_rows:
             debug_matched += 1
 
             # 동일 Case의 다중 이상치 처리: 시간역전(날짜열) + ML/품질/과도체류(행 전체) 병행
@@ -156,7 +166,7 @@ class AnomalyVisualizer:
                 else:
                     cnt["ml_outlier"] += 1
         
-        print(f"[DEBUG] 전체 {debug_total}행 중 {debug_matched}행 매칭됨 ({debug_matched/debug_total*100:.1f}%)")
+        print(f"[DEBUG] 전체 {debug_total}행 중 {debug_matched}행 매칭됨 ({debug_matched/max(debug_total, 1)*100:.1f}%)")
         print(f"[DEBUG] 색상 적용: 시간역전={cnt['time_reversal']}, ML={cnt['ml_outlier']}, 품질={cnt['data_quality']}, 과도체류={cnt['excessive_dwell']}")
 
         wb.save(excel_file)
@@ -5,6 +5,7 @@ HVDC 이상치 보고서에 통합_원본데이터_Fixed 시트 추가 및 색
 """
 
 import json
+import sys
 import pandas as pd
 import openpyxl
 from openpyxl.styles import PatternFill, Font, Border, Side
@@ -12,6 +13,10 @@ from openpyxl.utils.dataframe import dataframe_to_rows
 from pathlib import Path
 from typing import Dict, List
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from core.case_index import CaseKeyIndex
+from core.excel_reader import read_excel
+
 
 def create_final_colored_report():
     """
@@ -35,7 +40,7 @@ def create_final_colored_report():
     print(f"   최신 보고서: {latest_report.name}")
 
     try:
-        df_source = pd.read_excel(latest_report, sheet_name="통합_원본데이터_Fixed")
+        df_source = read_excel(latest_report, sheet_name="통합_원본데이터_Fixed")
         print(f"   데이터 로드 완료: {len(df_source)}행 × {len(df_source.columns)}열")
     except Exception as e:
         print(f"ERROR: 시트 로드 실패: {e}")
@@ -136,11 +141,9 @@ def create_final_colored_report():
     anomaly_counts = {"시간 역전": 0, "ml_high": 0, "ml_medium": 0, "데이터 품질": 0, "기타": 0}
 
     # Case ID → Row 매핑 생성 (성능 향상)
-    case_id_map = {}
-    for row in range(2, ws.max_row + 1):
-        cell_value = ws.cell(row=row, column=case_col).value
-        if cell_value:
-            case_id_map[str(cell_value).strip()] = row
+    # 시트에 쓴 df_source의 Case 열로 색인 (엑셀 행 = 위치 + 2, 중복 시 마지막 행)
+    case_index = CaseKeyIndex.from_values(df_source.iloc[:, case_col - 1], mode="strip")
+    case_id_map = {key: pos + 2 for key, pos in case_index.position_map("last").items()}
 
     print(f"   Case ID 매핑 완료: {len(case_id_map)}개")
 
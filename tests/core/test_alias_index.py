@@ -0,0 +1,67 @@
+"""별칭 역색인 테스트 / Tests for the registry alias index used by SemanticMatcher."""
+
+import pandas as pd
+
+from scripts.core.header_normalizer import HeaderNormalizer
+from scripts.core.header_registry import HVDC_HEADER_REGISTRY, HeaderRegistry
+from scripts.core.semantic_matcher import SemanticMatcher
+
+COLUMNS = [
+    "Case No.",
+    "Case No",  # same variants as "Case No.": the first column keeps them
+    "ETA/ATA",
+    "DHL WH",
+    "DSV Indoor ",
+    "Site Name X",
+    "No",
+    "G.W(kg)",
+    "Remark",
+    "Stack status code",
+]
+
+
+def test_index_variants_match_normalizer():
+    """변형 = 정규화 결과 / Index variants equal the per-alias normalization."""
+
+    normalizer = HeaderNormalizer()
+    index = HVDC_HEADER_REGISTRY.alias_index(normalizer)
+    assert HVDC_HEADER_REGISTRY.alias_index(HeaderNormalizer()) is index
+
+    for key, definition in HVDC_HEADER_REGISTRY.definitions.items():
+        expected = []
+        for alias in definition.aliases:
+            expected.extend(normalizer.normalize_with_alternatives(alias))
+        assert index.variants[key] == tuple(dict.fromkeys(expected))
+        for rank, variant in enumerate(index.variants[key]):
+            assert index.by_variant[variant][key] == rank
+
+
+def test_candidates_keep_every_partial_match():
+    """n-gram 후보 = 전체 스캔 / Candidate filtering drops only zero-score columns."""
+
+    matcher = SemanticMatcher(min_confidence=0.3)
+    df = pd.DataFrame(columns=COLUMNS)
+    normalized = matcher._normalize_dataframe_columns(df)
+    index = HVDC_HEADER_REGISTRY.alias_index(matcher.normalizer)
+    grams = matcher._column_ngrams(normalized)
+
+    for key in HVDC_HEADER_REGISTRY.get_all_semantic_keys():
+        aliases = list(index.variants[key])
+        candidates = matcher._partial_candidates(key, index, normalized, grams)
+        assert matcher._find_partial_matches(
+            aliases, normalized, set(), candidates
+        ) == matcher._find_partial_matches(aliases, normalized, set())
+
+    report = matcher.match_dataframe(df)
+    assert report.get_column_name("case_number") == "Case No."
+    assert report.get_column_name("eta_ata") == "ETA/ATA"
+
+
+def test_register_drops_cached_index():
+    """등록 시 색인 재생성 / Registering a definition rebuilds the index."""
+
+    registry = HeaderRegistry()
+    before = registry.alias_index()
+    definition = registry.get_definition("case_number")
+    registry.register(definition)
+    assert registry.alias_index() is not before
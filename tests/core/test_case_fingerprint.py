@@ -0,0 +1,59 @@
+"""케이스 지문/상태 저장소 테스트 / Tests for case fingerprints and the state store."""
+
+import pandas as pd
+
+from scripts.core.case_fingerprint import (
+    CaseStateStore,
+    classify_cases,
+    fingerprint_rows,
+    read_case_delta,
+    schema_signature,
+    write_case_delta,
+)
+
+
+def test_fingerprint_ignores_dtype_but_not_values():
+    """dtype 차이는 무시, 값 차이는 반영 / Same text -> same hash, new value -> new hash."""
+
+    a = pd.DataFrame({"x": ["1", "2", None], "y": ["a", "b", "c"]})
+    b = pd.DataFrame({"x": pd.Series(["1", "2", None], dtype=object), "y": ["a", "B", "c"]})
+
+    fa = fingerprint_rows(a, ["x", "y", "missing"])
+    fb = fingerprint_rows(b, ["x", "y", "missing"])
+    assert fa[0] == fb[0] and fa[2] == fb[2]
+    assert fa[1] != fb[1]
+    assert (fingerprint_rows(a, ["x", "y"]) == fingerprint_rows(a.copy(), ["x", "y"])).all()
+
+
+def test_store_roundtrip_and_classification(tmp_path):
+    """저장/분류 / Stored state drives new, changed, deleted and unchanged."""
+
+    sig = schema_signature(["x", "y"], ["x"])
+    with CaseStateStore(tmp_path / "state" / "stage1.sqlite") as store:
+        assert store.load("Case List", sig).empty
+        store.save("Case List", sig, ["A1", "A2", "A3"], [1, 2, 3], [10, None, 30])
+
+    with CaseStateStore(tmp_path / "state" / "stage1.sqlite") as store:
+        state = store.load("Case List", sig)
+        assert state.loc["A1", "synced_fp"] == "10"
+        assert state.loc["A2", "synced_fp"] is None
+        assert store.load("Case List", "other-schema").empty
+
+    delta = classify_cases(state, ["A1", "A2", "B1"], [1, 5, 7])
+    assert delta.unchanged == ["A1"]
+    assert delta.changed == ["A2"]
+    assert delta.new == ["B1"]
+    assert delta.deleted == ["A3"]
+    assert delta.summary() == {"new": 1, "changed": 1, "deleted": 1, "unchanged": 1}
+
+
+def test_delta_file_roundtrip(tmp_path):
+    """델타 파일 입출력 / JSONL and CSV deltas read back identically."""
+
+    delta = classify_cases(pd.DataFrame(columns=["master_fp", "synced_fp"]), ["007", "A1"], [1, 2])
+    frame = delta.to_frame("HE Local")
+    for name in ("delta.jsonl", "delta.csv"):
+        out = write_case_delta(frame, tmp_path / name)
+        back = read_case_delta(out)
+        assert back["case_no"].tolist() == ["007", "A1"]
+        assert back["status"].tolist() == ["new", "new"]
@@ -0,0 +1,98 @@
+"""케이스 키 색인 테스트 / Tests for the shared case-key index and its sidecar."""
+
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from scripts.core.case_index import (
+    CaseKeyIndex,
+    case_index_sidecar_path,
+    load_case_index,
+    normalize_case_keys,
+    read_case_index_sidecar,
+    write_case_index_sidecar,
+)
+
+CASES = ["HE-0001", " he 0002", None, "HE0001", 123, float("nan"), "", "SIM/0003 ", "HE-0002"]
+
+
+def _legacy_compact(value) -> str:
+    return re.sub(r"[^A-Z0-9]", "", str(value).strip().upper())
+
+
+def test_compact_keys_match_legacy_regex():
+    """정규화 동등성 / Vectorized keys equal the old per-value ``re.sub``."""
+
+    keys = normalize_case_keys(pd.Series(CASES))
+    expected = ["" if pd.isna(v) else _legacy_compact(v) for v in CASES]
+    assert keys.tolist() == expected
+    assert normalize_case_keys(CASES, mode="strip").tolist()[:2] == ["HE-0001", "he 0002"]
+
+
+def test_rows_lookup_and_duplicates():
+    """행 조회와 중복 보고 / Row positions, batch lookup and duplicate report."""
+
+    index = CaseKeyIndex.from_values(CASES)
+
+    assert len(index) == 4
+    assert "HE0001" in index and "" not in index
+    assert index.rows("HE0001").tolist() == [0, 3]
+    assert index.first_row("HE0002") == 1
+    assert index.last_row("HE0002") == 8
+    assert index.first_row("MISSING") is None
+    assert index.position_map("first") == {"HE0001": 0, "HE0002": 1, "123": 4, "SIM0003": 7}
+
+    positions = index.lookup(["he-0002", "nope", "SIM 0003"], keep="last")
+    assert positions.tolist() == [8, -1, 7]
+
+    duplicates = index.duplicates()
+    assert duplicates["case_key"].tolist() == ["HE0001", "HE0002"]
+    assert duplicates["rows"].tolist() == [[0, 3], [1, 8]]
+
+
+def test_concat_offsets_rows():
+    """이어붙이기 / Concatenated indexes use ``pd.concat`` row positions."""
+
+    first = CaseKeyIndex.from_values(["A1", "B2"])
+    second = CaseKeyIndex.from_values(["B2", "C3"])
+    combined = CaseKeyIndex.concat([first, second])
+
+    assert combined.rows("B2").tolist() == [1, 2]
+    assert combined.n_rows == 4
+    with pytest.raises(ValueError):
+        CaseKeyIndex.concat([first, CaseKeyIndex.from_values(["A1"], mode="strip")])
+
+
+def test_sidecar_round_trip_and_staleness(tmp_path):
+    """사이드카 저장/검증 / Sidecar loads for the same workbook and goes stale on change."""
+
+    workbook = tmp_path / "synced.xlsx"
+    frames = {
+        "Case List": pd.DataFrame({"Case No.": ["HE-0001", "HE-0002"], "Qty": [1, 2]}),
+        "Other": pd.DataFrame({"Qty": [3]}),
+    }
+    with pd.ExcelWriter(workbook) as writer:
+        for sheet, frame in frames.items():
+            frame.to_excel(writer, sheet_name=sheet, index=False)
+
+    written = {"Case List": CaseKeyIndex.from_frame(frames["Case List"], "Case No.", mode="strip")}
+    path = write_case_index_sidecar(workbook, written, {"Case List": "Case No."})
+    assert path == case_index_sidecar_path(workbook) == tmp_path / "synced.case_index.json"
+
+    stored = read_case_index_sidecar(workbook)
+    assert list(stored) == ["Case List"]
+    np.testing.assert_array_equal(stored["Case List"].keys, written["Case List"].keys)
+
+    loaded = load_case_index(workbook, frames)
+    assert list(loaded) == ["Case List", "Other"]
+    assert loaded["Case List"].mode == "compact"
+    assert loaded["Case List"].first_row("HE0002") == 1
+    assert loaded["Other"].n_rows == 1 and len(loaded["Other"]) == 0
+
+    with open(workbook, "ab") as handle:
+        handle.write(b"\0")
+    assert read_case_index_sidecar(workbook) is None
+    rebuilt = load_case_index(workbook, frames)
+    assert rebuilt["Case List"].rows("HE0001").tolist() == [0]
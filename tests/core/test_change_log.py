@@ -0,0 +1,113 @@
+"""컬럼형 변경 로그 테스트 / Tests for the columnar ChangeLog."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from scripts.core.change_log import ChangeLog
+
+
+def _sample_log() -> ChangeLog:
+    """샘플 로그 생성 / Build a small mixed log."""
+
+    log = ChangeLog(initial_capacity=2)
+    log.append(5, "ETA", "date_update", semantic_key="eta_ata", case_no="A1", new_value="x")
+    log.extend(
+        row_index=[1, 2, 3],
+        column_name="DHL WH",
+        change_type="date_update",
+        semantic_key="dhl_wh",
+        case_no=np.array(["B1", "B2", "B3"], dtype=object),
+        old_values=[None, pd.Timestamp("2024-01-01"), 1.5],
+        new_values=["2024-01-02", "2024-01-03", "2024-01-04"],
+    )
+    log.extend(row_index=[9], column_name="", change_type="new_record")
+    log.append(0, "ETA", "date_update", semantic_key="eta_ata", case_no="C1")
+    return log
+
+
+def test_extend_grows_typed_arrays():
+    """배열 확장 및 타입 / Arrays grow and keep their dtypes."""
+
+    log = _sample_log()
+
+    assert len(log) == 6
+    assert log.row_index.tolist() == [5, 1, 2, 3, 9, 0]
+    assert log.row_index.dtype == np.int64
+    assert log.type_ids.dtype == np.int8
+    assert log.case_no_array().tolist() == ["A1", "B1", "B2", "B3", "", "C1"]
+    assert log.count("date_update") == 5
+    assert log.count("unknown") == 0
+
+
+def test_groups_by_type_and_column():
+    """그룹 반복 순서 / Groups follow first appearance, positions keep order."""
+
+    log = _sample_log()
+    groups = [(key, pos.tolist()) for key, pos in log.groups(change_type="date_update")]
+
+    assert groups == [
+        (("date_update", "ETA", "eta_ata"), [0, 5]),
+        (("date_update", "DHL WH", "dhl_wh"), [1, 2, 3]),
+    ]
+    assert log.positions(change_type="new_record").tolist() == [4]
+    assert log.positions(column_name="DHL WH").tolist() == [1, 2, 3]
+
+
+def test_records_and_csv_export(tmp_path):
+    """레코드/CSV 내보내기 / Records round-trip and CSV export."""
+
+    log = _sample_log()
+    records = list(log.iter_records())
+    assert records[2] == (
+        2,
+        "DHL WH",
+        pd.Timestamp("2024-01-01"),
+        "2024-01-03",
+        "date_update",
+        "dhl_wh",
+        "B2",
+    )
+
+    frame = log.to_frame()
+    assert isinstance(frame["change_type"].dtype, pd.CategoricalDtype)
+
+    out = log.export(tmp_path / "audit" / "changes.csv")
+    loaded = pd.read_csv(out)
+    assert loaded["case_no"].fillna("").tolist() == ["A1", "B1", "B2", "B3", "", "C1"]
+    assert pd.isna(loaded["old_value"][1])
+    assert loaded["old_value"][2] == "2024-01-01 00:00:00"
+
+    with pytest.raises(ValueError):
+        log.export(tmp_path / "changes.xlsx")
+
+
+def test_delta_frame_layout():
+    """간결한 델타 / Delta rows use the case, column, old, new, type layout."""
+
+    delta = _sample_log().to_delta_frame()
+    assert list(delta.columns) == ["case", "column", "old", "new", "type"]
+    assert delta.iloc[2].tolist() == [
+        "B2",
+        "DHL WH",
+        "2024-01-01 00:00:00",
+        "2024-01-03",
+        "date_update",
+    ]
+
+
+def test_parquet_export(tmp_path):
+    """Parquet 내보내기 / Parquet export when an engine is installed."""
+
+    pytest.importorskip("pyarrow")
+    out = _sample_log().to_parquet(tmp_path / "changes.parquet")
+    assert len(pd.read_parquet(out)) == 6
+
+
+def test_mismatched_value_length_rejected():
+    """값 길이 검증 / Value side table length must match."""
+
+    with pytest.raises(ValueError):
+        ChangeLog().extend(
+            row_index=[1, 2], column_name="A", change_type="field_update", old_values=[1]
+        )
@@ -0,0 +1,60 @@
+"""컬럼 해석 서비스 테스트 / Tests for the cached warehouse/site column resolution."""
+
+import numpy as np
+import pandas as pd
+
+from scripts.core.column_resolver import ColumnResolver
+from scripts.core.header_registry import HVDC_HEADER_REGISTRY
+
+
+def _alias_loop(df: pd.DataFrame, keys):
+    """이전 구현 / The former per-alias ``notna().sum()`` walk."""
+
+    found = []
+    for key in keys:
+        for alias in HVDC_HEADER_REGISTRY.get_definition(key).aliases:
+            if alias in df.columns and df[alias].notna().sum() > 0:
+                found.append(alias)
+                break
+    return found
+
+
+def _frame() -> pd.DataFrame:
+    dhl_alias = HVDC_HEADER_REGISTRY.get_definition("dhl_wh").aliases[1]
+    return pd.DataFrame(
+        {
+            "Case No.": ["A", "B", "C"],
+            "DHL WH": [np.nan] * 3,  # present but empty: the next alias wins
+            dhl_alias: pd.to_datetime(["2024-01-01", None, None]),
+            "MOSB": pd.to_datetime([None, "2024-02-01", None]),
+            "MIR": pd.to_datetime(["2024-03-01", "2024-03-02", None]),
+            "SHU": [None] * 3,
+        }
+    )
+
+
+def test_resolution_matches_alias_loop():
+    """이전 규칙과 동일 / First alias with data per key, in registry order."""
+
+    df = _frame()
+    resolution = ColumnResolver().resolve(df)
+
+    warehouses = HVDC_HEADER_REGISTRY.get_warehouse_columns(use_primary_alias=False)
+    sites = HVDC_HEADER_REGISTRY.get_site_columns(use_primary_alias=False)
+    assert resolution.location_columns == (_alias_loop(df, warehouses), _alias_loop(df, sites))
+    assert resolution.get("dhl_wh") == df.columns[2]
+    assert resolution.get("shu") is None
+    assert resolution.non_null_count("MIR") == 2
+    assert resolution.non_null_count("DHL WH") == 0
+
+
+def test_resolution_follows_the_data():
+    """데이터 기준 해석 / A column gaining data is resolved on the next call."""
+
+    resolver = ColumnResolver()
+    df = _frame()
+    assert resolver.resolve(df).site_columns == ("MIR",)
+
+    changed = df.assign(SHU=pd.to_datetime(["2024-04-01", None, None]))
+    assert resolver.resolve(changed).site_columns == ("MIR", "SHU")
+    assert resolver.resolve(changed.iloc[2:]).location_columns == ([], [])
@@ -0,0 +1,65 @@
+"""dtype 정책 테스트 / Tests for the category/Arrow-string dtype policy."""
+
+import pandas as pd
+
+from scripts.core.dtype_policy import (
+    apply_dtype_policy,
+    compact_frame,
+    key_string_dtype,
+)
+
+
+def _frame(rows: int = 200) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Case No.": [f"HE-{i:04d}" for i in range(rows)],
+            "Source_Vendor": ["HITACHI", "SIEMENS"] * (rows // 2),
+            "Status_Location": ["MIR", None, "DSV Indoor", "Pre Arrival"] * (rows // 4),
+            "Source_Sheet": [f"sheet{i}" for i in range(rows)],  # high cardinality
+            "Vendor": [1, "x"] * (rows // 2),  # mixed values
+            "Pkg": range(rows),
+        }
+    )
+
+
+def test_low_cardinality_labels_become_categories():
+    """라벨 컬럼 변환 / Only string, low-cardinality label columns become categories."""
+
+    df = _frame()
+    out = apply_dtype_policy(df)
+
+    assert isinstance(out["Source_Vendor"].dtype, pd.CategoricalDtype)
+    assert isinstance(out["Status_Location"].dtype, pd.CategoricalDtype)
+    for column in ("Source_Sheet", "Vendor", "Pkg"):
+        assert out[column].dtype == df[column].dtype
+    pd.testing.assert_series_equal(
+        out["Status_Location"].astype(object), df["Status_Location"].astype(object)
+    )
+    if key_string_dtype() is not None:
+        assert out["Case No."].dtype == key_string_dtype()
+    assert (out["Case No."] == df["Case No."]).all()
+
+
+def test_policy_returns_new_frame_and_reports_memory():
+    """새 프레임 + 메모리 보고 / Input is untouched and the report shows the saving."""
+
+    df = _frame()
+    out, report = compact_frame(df, "test")
+
+    out["Extra"] = 1
+    assert "Extra" not in df.columns
+    assert df["Source_Vendor"].dtype != "category"
+    assert "Source_Vendor" in report.converted and "Vendor" not in report.converted
+    assert report.after < report.before and 0 < report.ratio < 1
+    assert str(report).startswith("test: ")
+
+
+def test_dtypes_survive_reorder_and_filter():
+    """dtype 유지 / Categories survive column selection and row filters."""
+
+    out = apply_dtype_policy(_frame())
+    subset = out[out["Source_Vendor"] == "HITACHI"][["Status_Location", "Source_Vendor"]]
+
+    assert isinstance(subset["Source_Vendor"].dtype, pd.CategoricalDtype)
+    assert subset["Source_Vendor"].unique().tolist() == ["HITACHI"]
+    assert apply_dtype_policy(subset)["Source_Vendor"].dtype == subset["Source_Vendor"].dtype
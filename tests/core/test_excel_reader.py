@@ -0,0 +1,106 @@
+"""공용 엑셀 리더 테스트 / Tests for the shared Excel reader."""
+
+import datetime as dt
+
+import pandas as pd
+import pytest
+
+from scripts.core import excel_reader
+from scripts.core.excel_reader import ExcelReader, coerce_frame, select_engine
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    """시트 2개 워크북 / Two-sheet workbook."""
+
+    path = tmp_path / "reader.xlsx"
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        pd.DataFrame(
+            {"Case No.": ["A1", "A2"], "ETA": [dt.datetime(2024, 1, 1), None], "Qty": [1, 2]}
+        ).to_excel(writer, sheet_name="Case List", index=False)
+        pd.DataFrame({"Case No.": ["B1"]}).to_excel(writer, sheet_name="HE Local", index=False)
+    return path
+
+
+def test_read_matches_pandas_and_records_timing(workbook):
+    """pandas 결과와 동일 + 시간 기록 / Same frame as pandas, timing recorded."""
+
+    reader = ExcelReader(engine="openpyxl", verbose=False)
+    df = reader.read(workbook, sheet_name="Case List")
+
+    pd.testing.assert_frame_equal(df, pd.read_excel(workbook, sheet_name="Case List"))
+    timing = reader.timings[-1]
+    assert (timing.sheet, timing.engine, timing.rows, timing.columns) == (
+        "Case List",
+        "openpyxl",
+        2,
+        3,
+    )
+    assert timing.seconds >= 0
+
+
+def test_all_sheets_via_open_workbook(workbook):
+    """전체 시트 읽기 / ``sheet_name=None`` and shared handles."""
+
+    reader = ExcelReader(verbose=False)
+    frames = reader.read(workbook, sheet_name=None)
+    assert list(frames) == ["Case List", "HE Local"]
+
+    with reader.open(workbook) as xl:
+        local = reader.read(xl, sheet_name="HE Local")
+    assert local["Case No."].tolist() == ["B1"]
+    assert reader.timing_frame()["sheet"].tolist() == ["Case List", "HE Local", "HE Local"]
+
+
+def test_engine_selection(monkeypatch):
+    """엔진 선택/대체 / Env override and fallback for missing backends."""
+
+    monkeypatch.setenv(excel_reader.ENGINE_ENV_VAR, "openpyxl")
+    assert select_engine() == "openpyxl"
+
+    monkeypatch.setattr(excel_reader, "python_calamine", None)
+    assert select_engine("calamine") == "openpyxl"
+    monkeypatch.delenv(excel_reader.ENGINE_ENV_VAR)
+    assert select_engine() == "openpyxl"
+
+
+def test_coerce_frame_harmonizes_backend_types():
+    """백엔드 간 dtype 통일 / Date objects and numeric objects are coerced."""
+
+    df = pd.DataFrame(
+        {
+            "date_only": pd.Series([dt.date(2024, 1, 1), None], dtype=object),
+            "numbers": pd.Series([1, 2.5], dtype=object),
+            "mixed": pd.Series(["x", 1], dtype=object),
+            "flags": pd.Series([True, False], dtype=object),
+        }
+    )
+    out = coerce_frame(df)
+
+    assert str(out["date_only"].dtype).startswith("datetime64")
+    assert out["numbers"].dtype == float
+    assert out["mixed"].dtype == object
+    assert out["flags"].dtype == object
+
+
+def test_non_ooxml_files_use_pandas_default_engine():
+    """xls 등은 pandas 기본 엔진 / openpyxl is not forced on legacy formats."""
+
+    reader = ExcelReader(engine="openpyxl", verbose=False)
+    assert reader.engine_for("legacy.xls") is None
+    assert reader.engine_for("report.XLSX") == "openpyxl"
+
+
+def test_timings_are_bounded_and_use_opened_path(workbook, monkeypatch):
+    """기록 상한 + 경로 / Only the latest reads are kept; handles record the opened path."""
+
+    monkeypatch.setattr(excel_reader, "MAX_TIMINGS", 2)
+    reader = ExcelReader(engine="openpyxl", verbose=False)
+    for _ in range(3):
+        reader.read(workbook, sheet_name="HE Local")
+    with reader.open(workbook) as xl:
+        reader.read(xl, sheet_name="Case List")
+
+    assert len(reader.timings) == 2
+    assert reader.timings[-1].path == str(workbook)
+    assert reader.timing_frame()["sheet"].tolist() == ["HE Local", "Case List"]
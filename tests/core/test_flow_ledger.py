@@ -0,0 +1,228 @@
+"""흐름 원장 테스트 / Parity tests for the vectorized flow ledger transitions."""
+
+import random
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+
+SCRIPTS = Path(__file__).resolve().parents[2] / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+from core.flow_ledger_v2 import (  # noqa: E402
+    SITES,
+    STAGE_PRIO,
+    WAREHOUSES,
+    WH_PRIO,
+    Event,
+    _canon,
+    _canon_map,
+    _stage_of,
+    _to_dubai_aware,
+    build_flow_ledger,
+)
+
+RAW_FILES = [SCRIPTS / "raw" / "HVDC Hitachi.xlsx", SCRIPTS / "raw" / "Case List.xlsx"]
+
+
+# fmt: off
+def _baseline_build_flow_ledger(
+    master_df: pd.DataFrame,
+    case_cols=("Case No", "Case", "Case_ID", "Case_Number", "case_no", "case"),
+    qty_cols=("Pkg", "pkg", "Pkg_Quantity", "pkg_quantity", "quantity", "qty"),
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """기준 구현 / ``build_flow_ledger`` as of the baseline commit, copied verbatim.
+
+    Only the name differs; keep the body untouched so the parity tests compare the
+    vectorized version against the real original loop.
+    """
+    if master_df is None or master_df.empty:
+        cols = ["Year_Month", "Warehouse", "Kind", "Qty"]
+        return pd.DataFrame(columns=cols), pd.DataFrame(columns=["case", "ts", "src", "dst", "qty"])
+
+    df = master_df.copy()
+
+    def _pick(cands):
+        cc = {c.lower().replace(" ", "_") for c in cands}
+        for c in df.columns:
+            if c.lower().replace(" ", "_") in cc:
+                return c
+        return None
+
+    col_case = _pick(case_cols) or "row_id"
+    if col_case not in df.columns:
+        df[col_case] = df.index
+
+    col_qty = _pick(qty_cols)
+    if not col_qty:
+        col_qty = "__qty__"
+        df[col_qty] = 1
+
+    amap = _canon_map()
+
+    # 1) Melt warehouse/site datetime columns to long format
+    loc_cols = [c for c in df.columns if _canon(c, amap) in (WAREHOUSES | SITES)]
+    long = (
+        df[[col_case, col_qty] + loc_cols]
+        .melt(id_vars=[col_case, col_qty], var_name="loc", value_name="ts")
+        .dropna(subset=["ts"])
+        .copy()
+    )
+
+    # 2) 두바이 기준 시간/월버킷
+    long["ts"] = _to_dubai_aware(long["ts"])
+    long["Year_Month"] = long["ts"].dt.strftime("%Y-%m")
+
+    # 3) 정규화/정렬 키
+    long["loc"] = long["loc"].map(lambda s: _canon(s, amap))
+    long["stage"] = long["loc"].map(_stage_of)
+    long["stage_prio"] = long["stage"].map(STAGE_PRIO)
+    long["wh_prio"] = long["loc"].map(lambda s: WH_PRIO.get(s, 999))
+    long["qty"] = long[col_qty].astype("float").fillna(0).astype(int)
+    long = long[long["qty"] > 0]
+
+    # 4) Same-timestamp handling: sum same warehouse, preserve WH↔Site path transitions
+    same_wh = (
+        long.groupby([col_case, "ts", "loc", "stage", "stage_prio", "wh_prio"], as_index=False)[
+            "qty"
+        ]
+        .sum()
+        .sort_values([col_case, "ts", "stage_prio", "wh_prio"])
+    )
+
+    events: List[Event] = []
+    edges: List[Tuple[str, pd.Timestamp, Optional[str], Optional[str], int]] = []
+    final_rows: List[Tuple[str, pd.Timestamp, str, int]] = []
+
+    # (a) Same-timestamp chain transitions: interpret path as adjacent pairs A→B
+    for case, gts in same_wh.groupby(col_case, sort=False):
+        for ts, one_ts in gts.groupby("ts", sort=False):
+            one_ts = one_ts.sort_values(["stage_prio", "wh_prio"])  # warehouse last (final state)
+            path = [r.loc for r in one_ts.itertuples()]  # includes WH + Site/Shipping
+
+            if len(path) >= 2:
+                for a, b in zip(path[:-1], path[1:]):
+                    if a == b:
+                        continue
+                    qty_a = int(one_ts.loc[one_ts["loc"] == a, "qty"].iloc[0])
+                    ym = ts.strftime("%Y-%m")
+                    if a in WAREHOUSES and b in WAREHOUSES:
+                        edges.append((str(case), ts, a, b, qty_a))
+                        events.append(Event(str(case), ym, "OUT", a, qty_a, ts, src=a, dst=b))
+                        events.append(Event(str(case), ym, "IN", b, qty_a, ts, src=a, dst=b))
+                    elif a in WAREHOUSES and b not in WAREHOUSES:
+                        events.append(Event(str(case), ym, "OUT", a, qty_a, ts, src=a, dst=b))
+                    elif a not in WAREHOUSES and b in WAREHOUSES:
+                        events.append(Event(str(case), ym, "IN", b, qty_a, ts, src=a, dst=b))
+
+            # (b) Store final state (WH or Site) for cross-timestamp transitions
+            if path:
+                last_loc = path[-1]
+                qty_last = int(one_ts.loc[one_ts["loc"] == last_loc, "qty"].iloc[0])
+                final_rows.append((str(case), ts, last_loc, qty_last))
+
+    # (c) Cross-timestamp transitions: use only final states, prevent duplicate transitions
+    if final_rows:
+        fr = pd.DataFrame(final_rows, columns=[col_case, "ts", "loc", "qty"]).sort_values(
+            [col_case, "ts"]
+        )
+        for case, g in fr.groupby(col_case, sort=False):
+            prev_loc = None
+            for r in g.itertuples(index=False):
+                loc, ts, qty = r.loc, r.ts, int(r.qty)
+                ym = ts.strftime("%Y-%m")
+                if prev_loc is None:
+                    if loc in WAREHOUSES:
+                        events.append(Event(str(case), ym, "IN", loc, qty, ts, src=None, dst=loc))
+                else:
+                    if prev_loc != loc:
+                        if prev_loc in WAREHOUSES and loc in WAREHOUSES:
+                            edges.append((str(case), ts, prev_loc, loc, qty))
+                            events.append(
+                                Event(
+                                    str(case), ym, "OUT", prev_loc, qty, ts, src=prev_loc, dst=loc
+                                )
+                            )
+                            events.append(
+                                Event(str(case), ym, "IN", loc, qty, ts, src=prev_loc, dst=loc)
+                            )
+                        elif prev_loc in WAREHOUSES and loc not in WAREHOUSES:
+                            events.append(
+                                Event(
+                                    str(case), ym, "OUT", prev_loc, qty, ts, src=prev_loc, dst=loc
+                                )
+                            )
+                        elif prev_loc not in WAREHOUSES and loc in WAREHOUSES:
+                            events.append(
+                                Event(str(case), ym, "IN", loc, qty, ts, src=prev_loc, dst=loc)
+                            )
+                prev_loc = loc
+
+    # 5) Monthly warehouse IN/OUT aggregation
+    if not events:
+        cols = ["Year_Month", "Warehouse", "Kind", "Qty"]
+        return pd.DataFrame(columns=cols), pd.DataFrame(columns=["case", "ts", "src", "dst", "qty"])
+
+    ev = pd.DataFrame([e.__dict__ for e in events])
+    ledger = (
+        ev.groupby(["ym", "warehouse", "kind"], as_index=False)["qty"]
+        .sum()
+        .rename(
+            columns={"ym": "Year_Month", "warehouse": "Warehouse", "kind": "Kind", "qty": "Qty"}
+        )
+    )
+    edges_df = pd.DataFrame(edges, columns=["case", "ts", "src", "dst", "qty"]).sort_values(
+        ["case", "ts"]
+    )
+
+    return ledger, edges_df
+
+
+# --------------------------- Monthly Table + Cumulative (cumsum) ---------------------------
+# fmt: on
+
+
+def _synthetic(seed: int, rows: int = 80) -> pd.DataFrame:
+    """합성 원본 / Case rows with warehouse/site dates, same-day hops and bad quantities."""
+
+    rng = random.Random(seed)
+    days = list(pd.date_range("2024-01-28", periods=10, freq="D"))
+    locations = sorted(WAREHOUSES | SITES)
+    data = {
+        "Case No": [f"C{rng.randint(1, rows // 3)}" for _ in range(rows)],
+        "Pkg": [rng.choice([1, 2, 3, 0, np.nan]) for _ in range(rows)],
+    }
+    for location in locations:
+        data[location] = [
+            rng.choice(days[:3]) if rng.random() < 0.3 else rng.choice(days + [pd.NaT] * 10)
+            for _ in range(rows)
+        ]
+    return pd.DataFrame(data)
+
+
+def _assert_same(df: pd.DataFrame):
+    ledger, edges = build_flow_ledger(df)
+    expected_ledger, expected_edges = _baseline_build_flow_ledger(df)
+    pd.testing.assert_frame_equal(ledger, expected_ledger, check_dtype=False)
+    pd.testing.assert_frame_equal(edges, expected_edges, check_dtype=False)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_loop_implementation(seed):
+    """루프 구현과 동일 / Same ledger and edges (incl. order) as the loop version."""
+
+    _assert_same(_synthetic(seed))
+
+
+@pytest.mark.parametrize("path", RAW_FILES, ids=lambda p: p.name)
+def test_matches_loop_on_sample_raw_files(path):
+    """샘플 원본 파일 / Parity on the sample raw files when they are readable."""
+
+    try:
+        df = pd.read_excel(path)
+    except Exception as exc:  # missing or protected sample
+        pytest.skip(f"sample not readable: {exc}")
+    _assert_same(df)
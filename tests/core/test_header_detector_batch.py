@@ -0,0 +1,70 @@
+"""일괄 헤더 점수 테스트 / Tests for batch header-row scoring and workbook detection."""
+
+import numpy as np
+import pandas as pd
+
+from scripts.core.header_detector import HeaderDetector, detect_workbook
+
+ROWS = [
+    ["Shipment Report", None, None, None, None],
+    [None, None, None, None, None],
+    ["Case No.", "ETA date", "Number", "Qty", "Site"],
+    ["A1", pd.Timestamp("2024-01-01"), 1, 1.0, True],
+    ["A2", "2024-01-02", 3, 3, "MIR"],
+    ["A2", None, 4.0, "x", 7],
+]
+
+
+def _row_wise(detector: HeaderDetector, df: pd.DataFrame):
+    """행별 기존 계산 / Features from the per-row ``_calculate_*`` helpers."""
+
+    features = []
+    for idx in range(min(len(df), detector.max_search_rows)):
+        row = df.iloc[idx]
+        features.append(
+            [
+                detector._calculate_density_score(row),
+                detector._calculate_text_score(row),
+                detector._calculate_uniqueness_score(row),
+                detector._calculate_keyword_score(row),
+                detector._validate_data_rows(df, idx),
+            ]
+        )
+    return np.array(features, dtype=float)
+
+
+def test_batch_scores_match_row_helpers():
+    """행별 결과와 동일 / Batch features equal the row helpers (1 == 1.0 == True merge)."""
+
+    detector = HeaderDetector(max_search_rows=4)
+    df = pd.DataFrame(ROWS)
+    scores = detector.score_rows(df)
+    batch = np.column_stack(
+        [scores.density, scores.text, scores.uniqueness, scores.keywords, scores.validation]
+    )
+    np.testing.assert_array_equal(batch, _row_wise(detector, df))
+    assert detector.detect_from_dataframe(df)[0] == 2
+
+
+def test_keyword_regex_counts_overlapping_keywords():
+    """겹치는 키워드 / Keywords inside longer matches still count once each."""
+
+    detector = HeaderDetector()
+    detector.header_keywords = ["date", "ate", "dat", "eta", "etd"]
+    df = pd.DataFrame([["ETA date", "updated"], [1, 2]])
+    assert detector.score_rows(df).keywords[0] == detector._calculate_keyword_score(df.iloc[0])
+
+
+def test_detect_workbook_scores_every_sheet(tmp_path):
+    """시트별 결과 / One result per sheet, equal to single-sheet detection."""
+
+    path = tmp_path / "book.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame(ROWS).to_excel(writer, sheet_name="Case List", index=False, header=False)
+        pd.DataFrame(ROWS[2:]).to_excel(writer, sheet_name="HE", index=False, header=False)
+
+    results = detect_workbook(str(path))
+    assert list(results) == ["Case List", "HE"]
+    assert [result.row_index for result in results.values()] == [2, 0]
+    single = HeaderDetector().detect_with_diagnostics(str(path), sheet_name="HE")
+    assert results["HE"].to_tuple() == single.to_tuple()
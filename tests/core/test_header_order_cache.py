@@ -0,0 +1,62 @@
+"""헤더 재정렬 캐시 테스트 / Tests for the signature-keyed HeaderOrderManager cache."""
+
+import pandas as pd
+
+from scripts.core.standard_header_order import STAGE2_HEADER_ORDER, HeaderOrderManager
+
+COLUMNS = ["Extra", "SQM", "no", "Case No.", "site  handling", "DHL WH"]
+
+
+def test_same_columns_reuse_the_mapping():
+    """같은 컬럼은 캐시 적중 / Repeated column sets skip matching; options are separate keys."""
+
+    manager = HeaderOrderManager()
+    df = pd.DataFrame([range(len(COLUMNS))], columns=COLUMNS)
+
+    first = manager.reorder_dataframe(df, is_stage2=True)
+    second = manager.reorder_dataframe(df.copy(), is_stage2=True)
+    pd.testing.assert_frame_equal(first, second)
+    assert (manager.hits, manager.misses) == (1, 1)
+
+    trimmed = manager.reorder_dataframe(df, is_stage2=True, keep_unlisted=False)
+    assert "Extra" not in trimmed.columns and manager.misses == 2
+
+    order = manager.column_order(COLUMNS, is_stage2=True)
+    assert list(first.columns) == order.order and order.order[-1] == "Extra"
+    for std_col, current_col in order.reverse.items():
+        assert order.mapping[current_col] == std_col and std_col in STAGE2_HEADER_ORDER
+
+
+def test_cache_persists_across_managers(tmp_path, monkeypatch):
+    """디스크 캐시 재사용 / A new manager with the same file does no matching."""
+
+    path = tmp_path / "header_order.json"
+    HeaderOrderManager(cache_path=path).column_order(COLUMNS, is_stage2=True)
+    assert path.exists()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("matching should be served from the cache")
+
+    reloaded = HeaderOrderManager(cache_path=path)
+    monkeypatch.setattr(reloaded, "match_columns_to_standard", fail)
+    expected = HeaderOrderManager().column_order(COLUMNS, is_stage2=True).order
+    assert reloaded.column_order(COLUMNS, is_stage2=True).order == expected
+    assert reloaded.hits == 1
+
+
+def test_cache_ignored_when_registry_changes(tmp_path, monkeypatch):
+    """레지스트리 변경 시 캐시 무시 / Alias changes invalidate the saved orders."""
+
+    from scripts.core import standard_header_order
+
+    path = tmp_path / "header_order.json"
+    HeaderOrderManager(cache_path=path).column_order(COLUMNS, is_stage2=True)
+    assert not list(tmp_path.glob("*.tmp"))  # written through a replaced temp file
+    assert HeaderOrderManager().load_order_cache(path) == 1
+
+    monkeypatch.setattr(
+        standard_header_order.HVDC_HEADER_REGISTRY,
+        "snapshot_fingerprint",
+        lambda *args, **kwargs: "changed aliases",
+    )
+    assert HeaderOrderManager().load_order_cache(path) == 0
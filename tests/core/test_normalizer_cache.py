@@ -0,0 +1,42 @@
+"""공유 정규화 캐시 테스트 / Tests for the memoized header normalizer and name resolver."""
+
+from scripts.core.header_normalizer import CachedHeaderNormalizer, HeaderNormalizer
+from scripts.core.name_resolver import FlexibleNameResolver
+
+HEADERS = ["Case No.", "ETD/ATD", "  Total  Handling ", "DHL  WH", "QTY", 1, 1.0, True, "ＣＡＳＥ"]
+
+
+def test_cached_results_equal_uncached():
+    """결과 동일 / Same results as HeaderNormalizer, including typed keys (1, 1.0, True)."""
+
+    plain, cached = HeaderNormalizer(), CachedHeaderNormalizer(maxsize=4)
+    for _ in range(2):
+        for header in HEADERS:
+            assert cached.normalize(header) == plain.normalize(header)
+            assert cached.normalize(header, expand_abbreviations=False) == plain.normalize(
+                header, expand_abbreviations=False
+            )
+            assert cached.normalize_with_alternatives(str(header)) == (
+                plain.normalize_with_alternatives(str(header))
+            )
+
+    assert cached.cache_info().currsize == 4  # bounded
+    assert cached.hits > 0 and cached.misses > 0
+
+
+def test_alternatives_are_not_shared_lists():
+    """캐시 목록 보호 / Mutating a returned list does not change later results."""
+
+    cached = CachedHeaderNormalizer()
+    cached.normalize_with_alternatives("Case No.").append("mutated")
+    assert "mutated" not in cached.normalize_with_alternatives("Case No.")
+
+
+def test_resolver_memoizes_per_kind():
+    """종류별 캐시 / The resolver caches per (text, kind)."""
+
+    resolver = FlexibleNameResolver(normalizer=CachedHeaderNormalizer())
+    assert resolver.normalize("HVDC_Case-List.XLSX", "file") == "hvdccaselist.xlsx"
+    assert resolver.normalize("HVDC_Case-List.XLSX", "sheet") == "hvdc case listxlsx"
+    resolver.normalize(" HVDC_Case-List.XLSX ", "file")
+    assert (resolver.cache_info().hits, resolver.cache_info().misses) == (1, 2)
@@ -0,0 +1,47 @@
+"""고유값 파싱 캐시 테스트 / Tests for the memoized distinct-value parsing layer."""
+
+import numpy as np
+import pandas as pd
+
+from scripts.core.data_parser import map_stack_status, parse_stack_status
+from scripts.core.parse_cache import DistinctValueParser
+
+STACK = ["Not stackable", "X2", None, "Stackable / 3 pcs", np.nan, "X2", "600kg/m2", ""]
+
+
+def test_map_matches_apply():
+    """apply 동등성 / Values and dtype equal ``Series.apply(parse_stack_status)``."""
+
+    series = pd.Series(STACK * 50, index=range(100, 500))
+    parser = DistinctValueParser(parse_stack_status)
+
+    pd.testing.assert_series_equal(parser.map(series), series.apply(parse_stack_status))
+    mixed = pd.Series([2, "2 tier", 2.0, None, True])
+    pd.testing.assert_series_equal(parser.map(mixed), mixed.apply(parse_stack_status))
+    assert map_stack_status(pd.Series(["Not stackable", "X2", "Stackable / 3"])).tolist() == [
+        0,
+        2,
+        3,
+    ]
+
+
+def test_each_distinct_value_parsed_once():
+    """고유값 1회 파싱 / Distinct values hit the parse function once across calls."""
+
+    calls = []
+
+    def parse(value):
+        calls.append(value)
+        return None if value is None else len(value)
+
+    parser = DistinctValueParser(parse, maxsize=2)
+    series = pd.Series(["aa", "b", None, "aa", "b"] * 10)
+
+    parsed = parser.map(series)
+    assert parsed.tolist()[:2] == [2, 1] and pd.isna(parsed[2])
+    assert sorted(c for c in calls if c is not None) == ["aa", "b"]
+
+    parser.map(series)
+    assert parser.cache_info().hits == 2
+    parser("ccc")  # evicts the least recently used entry
+    assert parser.cache_info().currsize == 2
@@ -0,0 +1,44 @@
+"""레지스트리 스냅샷 테스트 / Tests for the lazy registry and its alias index snapshot."""
+
+from scripts.core.header_registry import HeaderRegistry
+
+
+def test_definitions_are_built_on_first_use():
+    """지연 생성 / Creating a registry builds nothing until a lookup."""
+
+    registry = HeaderRegistry()
+    assert registry._definitions is None
+    assert registry.get_definition("case_number").aliases[0] == "Case No"
+    assert registry._definitions is not None
+
+
+def test_snapshot_round_trip(tmp_path, monkeypatch):
+    """스냅샷 재사용 / A second registry loads the index instead of building it."""
+
+    path = tmp_path / "registry.snapshot"
+    built = HeaderRegistry(snapshot_path=path).alias_index()
+    assert path.exists()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the index should come from the snapshot")
+
+    monkeypatch.setattr("scripts.core.header_registry.AliasIndex.build", fail)
+    loaded = HeaderRegistry(snapshot_path=path).alias_index()
+    assert loaded == built
+
+
+def test_stale_snapshot_is_rebuilt(tmp_path):
+    """정의 변경 시 무효화 / A snapshot of other definitions is ignored and rewritten."""
+
+    path = tmp_path / "registry.snapshot"
+    HeaderRegistry(snapshot_path=path).alias_index()
+
+    registry = HeaderRegistry(snapshot_path=path)
+    definition = registry.get_definition("case_number")
+    definition.aliases = definition.aliases + ["Kiste Nr"]
+    assert not registry.load_snapshot()
+    assert "kistenr" in registry.alias_index().by_variant
+    assert HeaderRegistry(snapshot_path=path).load_snapshot() is False
+
+    path.write_bytes(b"not a snapshot")
+    assert not registry.load_snapshot()
@@ -0,0 +1,66 @@
+"""시트 버퍼 테스트 / Tests for single-read sheet buffers."""
+
+import datetime as dt
+
+import pandas as pd
+import pytest
+
+from scripts.core import HeaderDetector
+from scripts.core.sheet_buffer import SheetBuffer
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    """제목/빈 행/중복 헤더가 있는 시트 / Sheet with title, blank rows and duplicate headers."""
+
+    rows = [
+        [None, None, None, None, None],
+        ["Shipment Report", None, None, None, None],
+        [None, None, None, None, None],
+        ["Case No.", "ETA", "Qty", "Qty", None],
+        ["A1", dt.datetime(2024, 1, 1), 1, 2.5, "NA"],
+        [None, None, None, None, None],
+        ["A2", "2024-01-02", 3, None, ""],
+        ["A3", dt.datetime(2024, 1, 3, 10), 4.0, "x", 7],
+    ]
+    path = tmp_path / "buffer.xlsx"
+    pd.DataFrame(rows).to_excel(path, index=False, header=False)
+    return path
+
+
+def test_with_header_matches_read_excel(workbook):
+    """헤더 재지정 동등성 / Re-headed frames equal ``read_excel(header=h)``."""
+
+    with pd.ExcelFile(workbook) as xl:
+        buffer = SheetBuffer.read(xl, "Sheet1")
+
+    assert len(buffer) == 8
+    for header_row in range(len(buffer)):
+        expected = pd.read_excel(workbook, header=header_row)
+        pd.testing.assert_frame_equal(buffer.with_header(header_row), expected)
+
+
+def test_preview_matches_partial_read(workbook):
+    """미리보기 동등성 / Previews equal ``read_excel(header=None, nrows=n)``."""
+
+    buffer = SheetBuffer.read(str(workbook))
+    for nrows in (1, 2, 4, 20):
+        expected = pd.read_excel(workbook, header=None, nrows=nrows)
+        pd.testing.assert_frame_equal(buffer.preview(nrows), expected)
+
+    detector = HeaderDetector()
+    from_file = detector.detect_with_diagnostics(str(workbook))
+    from_buffer = detector.detect_from_frame(buffer.preview(detector.max_search_rows))
+    assert from_buffer == from_file
+    assert from_buffer.row_index == 3
+
+
+def test_empty_sheet(tmp_path):
+    """빈 시트 / Empty sheets give empty frames."""
+
+    path = tmp_path / "empty.xlsx"
+    pd.DataFrame().to_excel(path)
+
+    buffer = SheetBuffer.read(str(path))
+    assert buffer.preview(5).empty
+    assert buffer.with_header(0).empty
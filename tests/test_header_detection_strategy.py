@@ -67,8 +67,8 @@ def test_vendor_fallback_when_heuristic_fails(tmp_path: Path, monkeypatch: pytes
 
     monkeypatch.setattr(
         sync.header_detector,
-        "detect_with_diagnostics",
-        lambda file_path, sheet_name: fake_result,
+        "detect_from_frame",
+        lambda df, expected_columns=None: fake_result,
     )
 
     sheet_data = sync._load_file_by_sheets(str(excel_path), "Warehouse")
@@ -76,3 +76,39 @@ def test_vendor_fallback_when_heuristic_fails(tmp_path: Path, monkeypatch: pytes
 
     assert header_row == 0
     assert "Case No." in df_loaded.columns
+
+
+def test_sheet_is_read_once_across_candidates(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """후보 재시도에도 시트는 1회만 읽음. | Failed candidates do not re-read the sheet."""
+
+    raw = pd.DataFrame(
+        [
+            ["Report", None, None],
+            [None, None, None],
+            ["Case No.", "Description", "ETA"],
+            ["A1", "Transformer", "2024-01-01"],
+            ["A2", "Reactor", "2024-01-02"],
+        ]
+    )
+    excel_path = tmp_path / "warehouse.xlsx"
+    raw.to_excel(excel_path, index=False, header=False)
+
+    # Wrong manual row first, so validation has to fall through to another candidate
+    sync = DataSynchronizerV30(header_overrides={("warehouse", "sheet1"): 0})
+    sync.debug_dhl_wh = False
+
+    calls = []
+    real_read_excel = pd.read_excel
+
+    def counting_read_excel(*args, **kwargs):
+        calls.append(kwargs.get("sheet_name"))
+        return real_read_excel(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_excel", counting_read_excel)
+
+    sheet_data = sync._load_file_by_sheets(str(excel_path), "Warehouse")
+    df, header_row = sheet_data["Sheet1"]
+
+    assert header_row == 2
+    assert df["Case No."].tolist() == ["A1", "A2"]
+    assert calls == ["Sheet1"]
@@ -0,0 +1,186 @@
+"""배치 동기화 테스트. | Tests for multi-vendor batch sync (``synchronize_many``)."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from scripts.stage1_sync_sorted.data_synchronizer_v30 import DataSynchronizerV30
+
+SCRIPT = (
+    Path(__file__).resolve().parents[1]
+    / "scripts"
+    / "stage1_sync_sorted"
+    / "data_synchronizer_v30.py"
+)
+
+
+def _write_pair(folder: Path, prefix: str, cases: int):
+    """Master/Warehouse 쌍 생성. | Master with newer dates than its Warehouse."""
+
+    folder = folder / prefix  # one pair per folder (no SIEMENS file auto-detected)
+    folder.mkdir()
+    paths = []
+    for name, eta in (("master", "2024-02-01"), ("warehouse", "2024-01-01")):
+        path = folder / f"{prefix}_{name}.xlsx"
+        pd.DataFrame(
+            {
+                "Case No.": [f"{prefix}{i}" for i in range(cases)],
+                "Description": ["Item"] * cases,
+                "ETA/ATA": [eta] * cases,
+            }
+        ).to_excel(path, sheet_name="Case List", index=False)
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def jobs(tmp_path: Path):
+    master_a, warehouse_a = _write_pair(tmp_path, "HE", 3)
+    master_b, warehouse_b = _write_pair(tmp_path, "PRJ", 2)
+    return [
+        (master_a, warehouse_a, str(tmp_path / "he_multi.xlsx")),
+        (master_b, warehouse_b, str(tmp_path / "prj_multi.xlsx")),
+    ]
+
+
+def _batch(jobs, workers):
+    sync = DataSynchronizerV30()
+    sync.debug_dhl_wh = False
+    return sync.synchronize_many(jobs, workers=workers)
+
+
+def test_serial_batch_combines_stats(jobs):
+    """순차 배치 통계 합산. | Serial batch sums per-job stats, in job order."""
+
+    batch = _batch(jobs, workers=1)
+
+    assert batch.success
+    assert [r.output_path for r in batch.results] == [job[2] for job in jobs]
+    assert batch.stats["jobs"] == batch.stats["succeeded"] == 2
+    assert batch.stats["updates"] == sum(r.stats["updates"] for r in batch.results)
+    assert batch.stats["merged_rows"] == 5
+
+
+def test_parallel_batch_matches_serial(jobs):
+    """병렬 배치 동등성. | Pool results equal the serial batch."""
+
+    serial = _batch(jobs, workers=1)
+    parallel = _batch(jobs, workers=2)
+
+    assert parallel.stats["workers"] == 2
+    for key in ("updates", "appends", "date_updates", "merged_rows"):
+        assert parallel.stats[key] == serial.stats[key]
+    for par, ser in zip(parallel.results, serial.results):
+        assert par.output_path == ser.output_path
+        assert par.stats["updates"] == ser.stats["updates"]
+
+
+def test_invalid_jobs_rejected(tmp_path: Path):
+    """잘못된 작업 검증. | Malformed jobs and shared state stores are rejected."""
+
+    sync = DataSynchronizerV30(state_store=str(tmp_path / "state.sqlite"))
+    with pytest.raises(ValueError):
+        sync.synchronize_many([("only-master.xlsx",)])
+    with pytest.raises(ValueError):
+        sync.synchronize_many([("a.xlsx", "b.xlsx"), ("c.xlsx", "d.xlsx")], workers=2)
+
+
+def test_state_store_closed_on_failure(jobs, tmp_path: Path, monkeypatch):
+    """실패 시 상태 저장소 닫기. | The state store is closed when a sync fails midway."""
+
+    import scripts.stage1_sync_sorted.data_synchronizer_v30 as module
+
+    opened = []
+
+    class RecordingStore(module.CaseStateStore):
+        closed = False
+
+        def __init__(self, path):
+            super().__init__(path)
+            opened.append(self)
+
+        def close(self):
+            self.closed = True
+            super().close()
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("update failed")
+
+    monkeypatch.setattr(module, "CaseStateStore", RecordingStore)
+    sync = DataSynchronizerV30(state_store=str(tmp_path / "state.sqlite"))
+    monkeypatch.setattr(sync, "_apply_updates", fail)
+
+    result = sync.synchronize(*jobs[0])
+    assert not result.success
+    assert len(opened) == 1 and opened[0].closed
+
+
+def test_serial_batch_keeps_state_per_job(jobs, tmp_path: Path):
+    """작업별 증분 상태 유지. | Serial jobs sharing a state store keep their own state."""
+
+    sync = DataSynchronizerV30(state_store=str(tmp_path / "state.sqlite"))
+    sync.debug_dhl_wh = False
+    assert sync.synchronize_many(jobs).success
+
+    # Second run on the synced workbooks: every case is unchanged for both jobs
+    for _, warehouse, output in jobs:
+        synced = pd.read_excel(output, sheet_name="Case List")
+        synced.to_excel(warehouse, sheet_name="Case List", index=False)
+    batch = sync.synchronize_many(jobs)
+
+    assert batch.success
+    skipped = [result.stats["incremental"]["Case List"]["skipped"] for result in batch.results]
+    assert skipped == [3, 2]
+
+
+def test_case_delta_reports_warehouse_changes(jobs, tmp_path: Path):
+    """창고 측 변경도 델타에 기록. | Warehouse-side edits reach the case delta and its meta."""
+
+    from scripts.core.case_fingerprint import read_case_delta, read_case_delta_meta
+
+    master, warehouse, output = jobs[0]
+    sync = DataSynchronizerV30(state_store=str(tmp_path / "state.sqlite"))
+    sync.debug_dhl_wh = False
+
+    def _sync():
+        result = sync.synchronize(master, warehouse, output)
+        assert result.success
+        delta_file = result.stats["delta_file"]
+        return read_case_delta(delta_file), read_case_delta_meta(delta_file)
+
+    _sync()
+    # Rerun on the synced workbook: nothing changed
+    pd.read_excel(output, sheet_name="Case List").to_excel(
+        warehouse, sheet_name="Case List", index=False
+    )
+    delta, meta = _sync()
+    assert delta.empty
+
+    # Warehouse-side location date; the Master has none, so it is kept
+    edited = pd.read_excel(warehouse, sheet_name="Case List")
+    edited["DHL WH"] = edited["DHL WH"].astype(object)
+    edited.loc[edited["Case No."] == "HE1", "DHL WH"] = pd.Timestamp("2024-01-15")
+    edited.to_excel(warehouse, sheet_name="Case List", index=False)
+    delta3, meta3 = _sync()
+
+    assert delta3[["case_no", "status"]].values.tolist() == [["HE1", "changed"]]
+    assert set(meta3["base_generations"].values()) == {meta["generation"]}
+    assert len(meta3["workbooks"]) == 2
+
+
+def test_job_rejects_single_pair_flags(jobs, tmp_path: Path):
+    """--job 혼용 거부. | ``--job`` with --master/--warehouse/--out fails instead of ignoring them."""
+
+    master, warehouse, _ = jobs[0]
+    for extra in (["--master", master], ["--warehouse", warehouse], ["--out", "x.xlsx"]):
+        proc = subprocess.run(
+            [sys.executable, str(SCRIPT), *extra, "--job", master, warehouse],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+        )
+        assert proc.returncode == 2
+        assert "--job cannot be combined with --master/--warehouse/--out" in proc.stderr
@@ -0,0 +1,73 @@
+"""결합 출력 테스트. | Tests for the one-pass Stage 1 multi-sheet/merged output."""
+
+import pandas as pd
+
+from scripts.core import standard_header_order
+from scripts.core.standard_header_order import HeaderOrderManager, reorder_dataframe_columns
+from scripts.stage1_sync_sorted.combined_output import (
+    build_merged_frame,
+    merged_sheet_order,
+    reorder_standard,
+)
+
+
+def _sheets():
+    base = {
+        "Case No.": ["A1", "A2"],
+        "Description": ["x", "y"],
+        "Pkg": [1, 2],
+        "DHL WH": pd.to_datetime(["2024-01-01", None]),
+        "Unmapped Note": ["n1", "n2"],
+    }
+    other = {
+        "Case No.": ["B1"],
+        "Source_Sheet": ["stale"],
+        "MIR": pd.to_datetime(["2024-02-01"]),
+        "Pkg": [3.5],
+        "Description": ["z"],
+    }
+    return {
+        "Zeta": pd.DataFrame(base),
+        "HE Local": pd.DataFrame(other),
+        "Case List, RIL": pd.DataFrame(base).iloc[::-1].reset_index(drop=True),
+    }
+
+
+def _legacy_merged(sheets):
+    frames = []
+    for name in merged_sheet_order(list(sheets)):
+        df_copy = sheets[name].copy()
+        df_copy["Source_Sheet"] = name
+        frames.append(df_copy)
+    merged = pd.concat(frames, ignore_index=True, sort=False)
+    return reorder_dataframe_columns(
+        merged, is_stage2=False, keep_unlisted=False, use_semantic_matching=True
+    )
+
+
+def test_standard_order_matches_reorder(monkeypatch):
+    """공유 캐시 동등성. | Standard orders equal ``reorder_dataframe_columns`` per frame."""
+
+    manager = HeaderOrderManager()
+    monkeypatch.setattr(standard_header_order, "_manager", manager)
+    sheets = _sheets()
+    for df in sheets.values():
+        expected = reorder_dataframe_columns(
+            df, is_stage2=False, keep_unlisted=False, use_semantic_matching=True
+        )
+        pd.testing.assert_frame_equal(reorder_standard(df), expected)
+
+    # Two layouts: each matched once, every later frame served from the manager
+    assert manager.misses == 2 and manager.hits == 4
+
+
+def test_merged_frame_matches_legacy_concat():
+    """합친 프레임 동등성. | Merged frame equals copy + concat + reorder."""
+
+    sheets = _sheets()
+    assert merged_sheet_order(list(sheets)) == ["Case List, RIL", "HE Local", "Zeta"]
+
+    merged = build_merged_frame(sheets)
+    pd.testing.assert_frame_equal(merged, _legacy_merged(sheets))
+    assert merged["Source_Sheet"].tolist()[:3] == ["Case List, RIL", "Case List, RIL", "HE Local"]
+    assert sheets["HE Local"]["Source_Sheet"].tolist() == ["stale"]
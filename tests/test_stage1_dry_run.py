@@ -0,0 +1,78 @@
+"""드라이런 델타 테스트. | Tests for the Stage 1 delta-only (dry-run) mode."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from scripts.core.case_fingerprint import read_case_delta
+from scripts.stage1_sync_sorted.data_synchronizer_v30 import DataSynchronizerV30
+
+SCRIPT = (
+    Path(__file__).resolve().parents[1]
+    / "scripts"
+    / "stage1_sync_sorted"
+    / "data_synchronizer_v30.py"
+)
+
+
+def _write(path: Path, eta: str, cases: int) -> str:
+    pd.DataFrame(
+        {
+            "Case No.": [f"HE{i}" for i in range(cases)],
+            "Description": ["Item"] * cases,
+            "ETA/ATA": [eta] * cases,
+        }
+    ).to_excel(path, sheet_name="Case List", index=False)
+    return str(path)
+
+
+def _sync() -> DataSynchronizerV30:
+    sync = DataSynchronizerV30()
+    sync.debug_dhl_wh = False
+    return sync
+
+
+def test_dry_run_writes_only_delta(tmp_path: Path):
+    """엑셀 미작성 + 델타 동등성. | No workbook is written and the delta matches a full run."""
+
+    master = _write(tmp_path / "master.xlsx", "2024-02-01", 4)
+    warehouse = _write(tmp_path / "warehouse.xlsx", "2024-01-01", 3)
+    out = tmp_path / "out_multi.xlsx"
+
+    dry = _sync().synchronize(master, warehouse, str(out), delta_only=True)
+    assert dry.success
+    assert dry.output_path == str(tmp_path / "out_multi.delta.jsonl")
+    assert not out.exists()
+    assert sorted(p.name for p in tmp_path.glob("*.xlsx")) == ["master.xlsx", "warehouse.xlsx"]
+
+    delta = read_case_delta(dry.output_path)
+    assert list(delta.columns) == ["sheet", "case", "column", "old", "new", "type"]
+    assert len(delta) == dry.stats["cell_changes"]
+    updates = delta[delta["type"] == "date_update"]
+    assert sorted(updates["case"]) == ["HE0", "HE1", "HE2"]
+    assert set(updates["new"]) == {"2024-02-01"}
+
+    full_sync = _sync()
+    full = full_sync.synchronize(master, warehouse, str(out))
+    for key in ("updates", "appends", "date_updates", "field_updates"):
+        assert full.stats[key] == dry.stats[key]
+    assert out.exists()
+
+
+def test_dry_run_rejected_with_job(tmp_path: Path):
+    """배치 드라이런 거부. | ``--dry-run --job`` fails instead of writing full workbooks."""
+
+    master = _write(tmp_path / "master.xlsx", "2024-02-01", 2)
+    warehouse = _write(tmp_path / "warehouse.xlsx", "2024-01-01", 2)
+    for extra in (["--dry-run"], ["--delta-out", str(tmp_path / "d.jsonl")]):
+        proc = subprocess.run(
+            [sys.executable, str(SCRIPT), *extra, "--job", master, warehouse],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+        )
+        assert proc.returncode == 2
+        assert "cannot be combined with --job" in proc.stderr
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["master.xlsx", "warehouse.xlsx"]
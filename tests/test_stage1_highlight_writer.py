@@ -0,0 +1,104 @@
+"""작성 시점 강조 테스트. | Tests for Stage 1 write-time change highlighting."""
+
+from pathlib import Path
+from typing import Dict, Tuple
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+from scripts.stage1_sync_sorted.data_synchronizer_v30 import ChangeTracker, DataSynchronizerV30
+from scripts.stage1_sync_sorted.highlight_writer import (
+    ORANGE,
+    YELLOW,
+    HighlightingExcelWriter,
+    plan_highlights,
+)
+
+
+def _sheet() -> Tuple[pd.DataFrame, ChangeTracker]:
+    """합성 시트와 변경 로그. | Synthetic sheet with its change tracker."""
+
+    df = pd.DataFrame(
+        {
+            "Case No.": ["A1", "A2", "A3", "N1"],
+            "ETD / ATD": [pd.Timestamp("2024-01-01"), None, "2024-02-01", "2024-03-01"],
+            "DSV Indoor": [None, pd.Timestamp("2024-01-05 10:30"), None, None],
+            "Description": ["x", "y", "", 3],
+        }
+    )
+    tracker = ChangeTracker()
+    tracker.set_column_mapping("dsv_indoor", "DSV Indoor")
+    tracker.add_changes(
+        row_index=[0, 1, 2],
+        column_name="ETD/ATD",  # resolved through the fuzzy fallback
+        semantic_key="etd_atd",
+        change_type="date_update",
+        case_no=["A1", "A2", "ZZ"],
+    )
+    tracker.add_change(
+        row_index=1,
+        column_name="DSV Indoor",
+        semantic_key="dsv_indoor",
+        change_type="date_update",
+        case_no="A2",
+    )
+    tracker.add_change(row_index=0, column_name="Description", change_type="field_update")
+    tracker.log_new_case("N1", {}, row_index=3)
+    return df, tracker
+
+
+def _fills(path: Path, sheet: str) -> Dict[Tuple[int, int], str]:
+    """채워진 셀 목록. | Collect filled cells as {(row, col): rgb}."""
+
+    ws = load_workbook(path)[sheet]
+    found = {}
+    for row in ws.iter_rows():
+        for cell in row:
+            if cell.fill is not None and cell.fill.fill_type == "solid":
+                found[(cell.row, cell.column)] = str(cell.fill.start_color.rgb)[-6:]
+    return found
+
+
+def test_plan_matches_legacy_formatter(tmp_path: Path):
+    """계획이 기존 포매터 결과와 같다. | Plan equals the reopen-based formatter."""
+
+    df, tracker = _sheet()
+    sync = DataSynchronizerV30()
+    sync.change_tracker = tracker
+
+    legacy = tmp_path / "legacy.xlsx"
+    df.to_excel(legacy, sheet_name="S", index=False, engine="openpyxl")
+    sync._apply_excel_formatting(str(legacy), "S", 0)
+
+    plan = plan_highlights(df, tracker, sync._fuzzy_find_column)
+    expected = {(r + 2, c + 1): color[-6:] for (r, c), color in plan.cell_colors().items()}
+    assert _fills(legacy, "S") == expected
+    assert plan.match_by_fuzzy == 3
+    assert (2, 1) in plan.orange  # "ZZ" falls back to its stored row index
+    assert (1, 1) not in plan.orange  # blank cells are never painted
+
+
+@pytest.mark.parametrize("engine", ["xlsxwriter", "openpyxl"])
+def test_writer_applies_fills_in_one_pass(tmp_path: Path, engine: str):
+    """한 번의 작성으로 색상 적용. | Fills are present right after the single write."""
+
+    if engine == "xlsxwriter":
+        pytest.importorskip("xlsxwriter")
+    df, tracker = _sheet()
+    plan = plan_highlights(df, tracker, DataSynchronizerV30()._fuzzy_find_column)
+
+    out = tmp_path / f"out_{engine}.xlsx"
+    with HighlightingExcelWriter(str(out), engine=engine) as writer:
+        counts = writer.write_sheet(df, "Case List", plan)
+        writer.write_sheet(df, "Plain")
+
+    fills = _fills(out, "Case List")
+    assert counts == {"orange": list(fills.values()).count(ORANGE[-6:]), "yellow": 3}
+    assert fills[(5, 1)] == YELLOW[-6:]  # new record row
+    assert fills[(3, 3)] == ORANGE[-6:]  # DSV Indoor date update
+    assert _fills(out, "Plain") == {}
+
+    written = pd.read_excel(out, sheet_name="Case List")
+    assert written["DSV Indoor"].iloc[1] == pd.Timestamp("2024-01-05 10:30")
+    assert written["Description"].tolist()[:2] == ["x", "y"]
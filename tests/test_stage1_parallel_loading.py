@@ -0,0 +1,80 @@
+"""병렬 시트 로딩 테스트. | Tests for Stage 1 process-pool sheet loading."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from scripts.stage1_sync_sorted.data_synchronizer_v30 import DataSynchronizerV30
+
+
+def _write_workbook(path: Path, prefix: str) -> None:
+    """케이스 시트 3개 + 집계 시트. | Three case sheets plus an aggregate sheet."""
+
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        for n, sheet in enumerate(["Zeta", "Alpha", "Mid"], start=1):
+            pd.DataFrame(
+                {
+                    "Case No.": [f"{prefix}{sheet}{i}" for i in range(n + 2)],
+                    "Description": ["Item"] * (n + 2),
+                    "ETA": ["2024-01-01"] * (n + 2),
+                }
+            ).to_excel(writer, sheet_name=sheet, index=False)
+        pd.DataFrame({"Total": [1]}).to_excel(writer, sheet_name="Summary", index=False)
+
+
+def _loader(workers: int) -> DataSynchronizerV30:
+    sync = DataSynchronizerV30(load_workers=workers)
+    sync.debug_dhl_wh = False
+    return sync
+
+
+def test_parallel_matches_serial(tmp_path: Path):
+    """병렬 결과가 순차 결과와 동일. | Pool output equals the serial loader, in sheet order."""
+
+    master = tmp_path / "master.xlsx"
+    warehouse = tmp_path / "warehouse.xlsx"
+    _write_workbook(master, "M")
+    _write_workbook(warehouse, "W")
+    books = [(str(master), "Master"), (str(warehouse), "Warehouse")]
+
+    serial = _loader(1)._load_workbooks(books)
+    parallel = _loader(3)._load_workbooks(books)
+
+    assert list(parallel) == list(serial)
+    for key, sheets in serial.items():
+        assert list(parallel[key]) == list(sheets) == ["Zeta", "Alpha", "Mid"]
+        for name, (df, header_row) in sheets.items():
+            par_df, par_header = parallel[key][name]
+            assert par_header == header_row == 0
+            pd.testing.assert_frame_equal(par_df, df)
+
+
+def test_prefetch_feeds_load_file_by_sheets(tmp_path: Path):
+    """선로딩 캐시 사용. | Prefetched workbooks are served without reloading."""
+
+    master = tmp_path / "master.xlsx"
+    warehouse = tmp_path / "warehouse.xlsx"
+    _write_workbook(master, "M")
+    _write_workbook(warehouse, "W")
+
+    sync = _loader(2)
+    sync._prefetch_workbooks(str(master), str(warehouse))
+    cached = sync._prefetched_sheets[sync._workbook_key(str(warehouse))]
+
+    sheet_data = sync._load_file_by_sheets(str(warehouse), "Warehouse")
+    assert sheet_data is cached
+    assert sheet_data["Alpha"][0]["Case No."].tolist() == [
+        "WAlpha0",
+        "WAlpha1",
+        "WAlpha2",
+        "WAlpha3",
+    ]
+    assert sync._workbook_key(str(warehouse)) not in sync._prefetched_sheets
+
+
+def test_invalid_worker_count_rejected():
+    """워커 수 검증. | Negative worker counts are rejected."""
+
+    with pytest.raises(ValueError):
+        DataSynchronizerV30(load_workers=-1)
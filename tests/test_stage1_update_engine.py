@@ -0,0 +1,264 @@
+"""Stage 1 업데이트 엔진 동등성 테스트. | Parity tests for the Stage 1 update engines."""
+
+import datetime as dt
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from scripts.stage1_sync_sorted.data_synchronizer_v30 import (
+    ChangeTracker,
+    DataSynchronizerV30,
+    NewCaseBuffer,
+    _date_day_keys,
+    _dates_equal_arrays,
+)
+
+MASTER_COLS = {
+    "case_number": "Case No.",
+    "eta_ata": "ETA/ATA",
+    "dhl_wh": "DHL WH",
+    "description": "Description",
+    "mosb": "MOSB",
+}
+WH_COLS = {
+    "case_number": "Case_No",
+    "eta_ata": "ETA",
+    "description": "Description",
+    "mosb": "MOSB",
+}
+
+
+def _frames() -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """동기화용 합성 데이터. | Synthetic Master/Warehouse frames."""
+
+    master = pd.DataFrame(
+        {
+            "Case No.": ["a-1", "A2", "B3", None, "C4", "A2", "NEW1", "new1", "D5"],
+            "ETA/ATA": [
+                "2024-01-01",
+                pd.Timestamp("2024-02-01 10:00"),
+                None,
+                "2024-01-05",
+                "not a date",
+                "2024-03-01",
+                "2024-04-01",
+                None,
+                pd.Timestamp("2024-05-01"),
+            ],
+            "DHL WH": [None, "2024-01-02", "2024-01-03", None, None, None, "2024-01-09", None, 5],
+            "Description": ["Trafo", "Cable", None, "x", 1.5, "Cable2", "Panel", "Panel", "Same"],
+            "MOSB": [None, None, "2024-06-01", None, None, None, None, None, None],
+            "Source_Sheet": ["Case List"] * 9,
+            "Source_Vendor": ["HITACHI"] * 9,
+            "Extra": list(range(9)),
+        },
+        dtype=object,
+    )
+    warehouse = pd.DataFrame(
+        {
+            "Case_No": ["A1", "A2", "B-3", "C4", "D5", "E6"],
+            "ETA": [
+                "2024-01-01 08:00",
+                None,
+                "2024-01-01",
+                pd.NaT,
+                pd.Timestamp("2024-05-01"),
+                None,
+            ],
+            "Description": ["Trafo", None, "Old", "1.5", "Same", "Keep"],
+            "MOSB": [None, "2024-06-01", None, None, None, None],
+            "Source_Sheet": ["HE", "HE", "Case List", "HE", "HE", "HE"],
+            "Source_Vendor": [None] * 6,
+        },
+        dtype=object,
+    )
+    return master, warehouse
+
+
+def _run(engine: str, master: pd.DataFrame, warehouse: pd.DataFrame):
+    """지정 엔진으로 업데이트 실행. | Run _apply_updates with the given engine."""
+
+    sync = DataSynchronizerV30(update_engine=engine)
+    sync.change_tracker = ChangeTracker()
+    out, stats = sync._apply_updates(
+        master.copy(), warehouse.copy(), dict(MASTER_COLS), dict(WH_COLS)
+    )
+    return out, stats, sync.change_tracker
+
+
+def _change_rows(tracker: ChangeTracker):
+    """비교 가능한 변경 튜플. | Comparable change tuples."""
+
+    return [
+        (
+            c.row_index,
+            c.column_name,
+            c.change_type,
+            c.semantic_key,
+            c.case_no,
+            str(c.old_value),
+            str(c.new_value),
+        )
+        for c in tracker.changes
+    ]
+
+
+@pytest.mark.parametrize("new_first", [False, True])
+def test_vectorized_engine_matches_loop(new_first: bool):
+    """벡터화 엔진이 루프 엔진과 동일한 결과를 낸다. | Vectorized engine matches the loop."""
+
+    master, warehouse = _frames()
+    if new_first:
+        master = master.iloc[[6, 0, 1, 2, 3, 4, 5, 7, 8]].reset_index(drop=True)
+
+    loop_df, loop_stats, loop_tracker = _run("loop", master, warehouse)
+    vec_df, vec_stats, vec_tracker = _run("vectorized", master, warehouse)
+
+    assert list(vec_df.columns) == list(loop_df.columns)
+    pd.testing.assert_frame_equal(vec_df.astype(str), loop_df.astype(str))
+    assert vec_stats == loop_stats
+    assert _change_rows(vec_tracker) == _change_rows(loop_tracker)
+    assert list(vec_tracker.new_cases) == list(loop_tracker.new_cases)
+    assert vec_tracker.semantic_to_column == loop_tracker.semantic_to_column
+
+
+def test_vectorized_engine_counts():
+    """주요 통계 값 확인. | Spot-check statistics of the vectorized engine."""
+
+    master, warehouse = _frames()
+    _, stats, tracker = _run("vectorized", master, warehouse)
+
+    # "A-1" keeps its dash on the Master side, NEW1/new1 are appended twice
+    assert stats["appends"] == 3
+    types = [c.change_type for c in tracker.changes]
+    assert types.count("new_record") == 3
+    assert stats["date_updates"] == types.count("date_update")
+    assert stats["updates"] == stats["date_updates"] + stats["field_updates"]
+
+
+def test_new_case_rows_point_at_appended_rows():
+    """신규 케이스 행 인덱스가 실제 추가 행을 가리킨다. | new_record indexes hit appended rows."""
+
+    master, warehouse = _frames()
+    out, _, tracker = _run("vectorized", master, warehouse)
+
+    new_records = [c for c in tracker.changes if c.change_type == "new_record"]
+    assert [c.row_index for c in new_records] == [6, 7, 8]
+    for change, expected in zip(new_records, ["a-1", "NEW1", "new1"]):
+        assert out.at[change.row_index, "Case_No"] == expected
+    assert "Case No." not in out.columns  # renamed to the Warehouse header
+
+
+def test_new_case_buffer_single_flush():
+    """버퍼는 한 번의 concat으로 행을 추가한다. | Buffer appends all rows in one flush."""
+
+    master = pd.DataFrame({"Case No.": ["X1", "X2", "X3"], "Qty": [1, 2, 3]})
+    wh = pd.DataFrame({"Case_No": ["A1"], "Qty": [9]})
+
+    buffer = NewCaseBuffer(base_len=len(wh))
+    assert buffer.add(2, "X3") == 1
+    assert buffer.add(0, "X1") == 2
+
+    out, rows = buffer.flush(wh, master, {"Case_No": "Case No.", "Qty": "Qty"})
+    assert out["Case_No"].tolist() == ["A1", "X3", "X1"]
+    assert rows == [{"Case_No": "X3", "Qty": 3}, {"Case_No": "X1", "Qty": 1}]
+    with pytest.raises(ValueError):
+        buffer.flush(out, master, {"Case_No": "Case No."})
+
+
+def test_unknown_update_engine_rejected():
+    """알 수 없는 엔진은 거부된다. | Unknown engines raise ValueError."""
+
+    with pytest.raises(ValueError):
+        DataSynchronizerV30(update_engine="turbo")
+
+
+def test_incremental_skips_unchanged_cases(tmp_path):
+    """변경 없는 케이스는 건너뛴다. | Unchanged cases are skipped without changing the output."""
+
+    from scripts.core.case_fingerprint import CaseStateStore
+
+    master, warehouse = _frames()
+    sync = DataSynchronizerV30()
+
+    def _run_incremental(master_df, wh_df):
+        sync.change_tracker = ChangeTracker()
+        with CaseStateStore(tmp_path / "state.sqlite") as store:
+            subset, ctx = sync._prepare_incremental(
+                store, "Case List", master_df, wh_df.copy(), dict(MASTER_COLS), dict(WH_COLS)
+            )
+            out, stats = sync._apply_updates(subset, wh_df.copy(), dict(MASTER_COLS), dict(WH_COLS))
+            sync._finish_incremental(store, ctx, out)
+        return out, stats, ctx
+
+    first, _, ctx1 = _run_incremental(master, warehouse)
+    assert ctx1["skipped"] == 0
+    assert len(ctx1["delta"].new) == 6
+
+    # Second run on the synced output: nothing left to apply for the unique cases
+    second, stats2, ctx2 = _run_incremental(master, first)
+    full, full_stats, _ = _run("vectorized", master, first)
+    assert ctx2["skipped"] == 3  # B3, C4, D5 ("A-1" never matches, A2/NEW1 repeat)
+    # "new1" rewrites the NEW1 row's case number: its synced row changed
+    assert ctx2["delta"].changed == ["NEW1"]
+    assert ctx2["delta"].summary()["unchanged"] == 5
+    pd.testing.assert_frame_equal(second.astype(str), full.astype(str))
+    assert stats2["updates"] == full_stats["updates"]
+
+    # Third run: one Master value changed -> only that case is reported as changed
+    changed = master.copy()
+    changed.loc[8, "Description"] = "Updated"
+    third, stats3, ctx3 = _run_incremental(changed, second)
+    assert ctx3["delta"].changed == ["D5"]
+    assert third.loc[third["Case_No"] == "D5", "Description"].item() == "Updated"
+    assert stats3["field_updates"] >= 1
+
+    # Warehouse-side edit the Master does not overwrite (no Master ETA for B3)
+    edited = third.copy()
+    edited.loc[edited["Case_No"] == "B3", "ETA"] = "2024-07-01"
+    fourth, _, ctx4 = _run_incremental(changed, edited)
+    assert ctx4["delta"].changed == ["B3"]
+    assert fourth.loc[fourth["Case_No"] == "B3", "ETA"].item() == "2024-07-01"
+
+
+def test_date_keys_match_scalar_comparison():
+    """날짜 키 비교 = 셀 단위 비교. | Array date equality equals ``_dates_equal`` per pair."""
+
+    values = [
+        None,
+        float("nan"),
+        pd.NaT,
+        pd.Timestamp("2024-01-02 10:30"),
+        dt.datetime(2024, 1, 2),
+        dt.date(2024, 1, 3),
+        np.datetime64("2024-01-03T05:00"),
+        "2024-01-02",
+        "02/01/2024",
+        "Jan 3 2024",
+        "TBA",
+        "",
+        True,
+        45000,
+    ]
+    series = pd.Series(values, dtype=object)
+    is_none, day = _date_day_keys(series)
+    assert day.dtype == np.dtype("datetime64[D]")
+
+    left = np.repeat(np.arange(len(values)), len(values))
+    right = np.tile(np.arange(len(values)), len(values))
+    result = _dates_equal_arrays(is_none[left], day[left], is_none[right], day[right])
+
+    sync = DataSynchronizerV30()
+    expected = [sync._dates_equal(values[a], values[b]) for a, b in zip(left, right)]
+    assert result.tolist() == expected
+
+    # Offset strings (never produced by Excel itself) compare by their wall-clock date
+    offset_none, offset_day = _date_day_keys(pd.Series(["2024-01-02T23:00:00+05:00"], dtype=object))
+    assert not offset_none[0] and str(offset_day[0]) == "2024-01-02"
+
+    typed = pd.Series(pd.to_datetime(["2024-01-02 10:30", None]))
+    typed_none, typed_day = _date_day_keys(typed)
+    assert typed_none.tolist() == [False, False]
+    assert typed_day.astype(str).tolist() == ["2024-01-02", "NaT"]
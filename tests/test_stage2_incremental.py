@@ -0,0 +1,155 @@
+"""Stage 2 증분 처리 테스트. | Tests for delta-driven incremental Stage 2 runs."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import yaml
+
+from scripts.core.case_fingerprint import write_case_delta
+from scripts.core.case_index import file_stamp
+from scripts.stage2_derived.derived_columns_processor import (
+    process_derived_columns,
+    read_stage2_state,
+)
+
+
+def _synced(rows: int = 12) -> pd.DataFrame:
+    dates = pd.date_range("2024-01-01", periods=rows, freq="D")
+    return pd.DataFrame(
+        {
+            "Case No.": [f"HE-{i:03d}" for i in range(rows)],
+            "DHL WH": [d if i % 3 else None for i, d in enumerate(dates)],
+            "MIR": [d + pd.Timedelta(days=5) if i % 2 else None for i, d in enumerate(dates)],
+            "Stack": ["X2", "Not stackable", None] * (rows // 3),
+            "L(CM)": [120, 80, None] * (rows // 3),
+            "W(CM)": [100, 50, 40] * (rows // 3),
+        }
+    )
+
+
+@pytest.fixture
+def project(tmp_path: Path):
+    config = tmp_path / "stage2.yaml"
+    config.write_text(
+        yaml.safe_dump({"output": {"derived_file": str(tmp_path / "derived.xlsx")}}),
+        encoding="utf-8",
+    )
+    return tmp_path, config
+
+
+DELTA_COLUMNS = ["sheet", "case_no", "status"]
+
+
+def _run(tmp_path: Path, config: Path, frame: pd.DataFrame, name: str, **kwargs) -> pd.DataFrame:
+    synced = tmp_path / name
+    if not synced.exists():
+        frame.to_excel(synced, index=False)
+    assert process_derived_columns(
+        synced, stage2_config_path=config, project_root=tmp_path, **kwargs
+    )
+    return pd.read_excel(tmp_path / "derived.xlsx")
+
+
+def _stage1(
+    tmp_path: Path,
+    frame: pd.DataFrame,
+    name: str,
+    generation: str,
+    base: str | None,
+    rows: list | None = None,
+) -> Path:
+    """Stage 1 결과 + 델타 작성. | Synced workbook with its case delta and meta."""
+
+    synced = tmp_path / name
+    frame.to_excel(synced, index=False)
+    delta = tmp_path / (synced.stem + ".case_delta.jsonl")
+    meta = {
+        "generation": generation,
+        "base_generations": {"Case List": base},
+        "workbooks": [file_stamp(synced)],
+    }
+    write_case_delta(pd.DataFrame(rows or [], columns=DELTA_COLUMNS), delta, meta=meta)
+    return delta
+
+
+def test_incremental_matches_full_recompute(project, capsys):
+    """증분 = 전체 재계산. | Splicing changed cases gives the full-recompute workbook."""
+
+    tmp_path, config = project
+    first = _stage1(tmp_path, _synced(), "synced_v1.xlsx", "g1", None)
+    _run(tmp_path, config, _synced(), "synced_v1.xlsx", case_delta=first)
+    assert read_stage2_state(tmp_path / "derived.xlsx")["generation"] == "g1"
+
+    changed = _synced()
+    changed.loc[1, "MIR"] = pd.Timestamp("2024-03-01")
+    changed.loc[2, "Stack"] = "3 tier"
+    changed = pd.concat([changed, _synced(15).iloc[12:13]], ignore_index=True)
+    rows = [
+        ("Case List", "HE-001", "changed"),
+        ("Case List", "HE-002", "changed"),
+        ("Case List", "HE-012", "new"),
+    ]
+    delta = _stage1(tmp_path, changed, "synced_v2.xlsx", "g2", "g1", rows)
+
+    capsys.readouterr()
+    incremental = _run(tmp_path, config, changed, "synced_v2.xlsx", case_delta=delta)
+    assert "재계산 3/13행" in capsys.readouterr().out
+
+    full = _run(tmp_path, config, changed, "synced_v2.xlsx")
+    pd.testing.assert_frame_equal(incremental, full)
+    assert incremental.loc[1, "Status_Location_Date"] == pd.Timestamp("2024-03-01")
+
+
+def test_schema_change_falls_back_to_full(project, capsys):
+    """스키마 변경 시 전체 재계산. | A new input column forces a full recompute."""
+
+    tmp_path, config = project
+    _run(tmp_path, config, _synced(), "synced_v1.xlsx")
+    delta = tmp_path / "empty.case_delta.jsonl"
+    write_case_delta(pd.DataFrame(columns=DELTA_COLUMNS), delta)
+
+    capsys.readouterr()
+    out = _run(tmp_path, config, _synced().assign(Extra=1), "synced_v2.xlsx", case_delta=delta)
+
+    assert "입력 스키마 변경" in capsys.readouterr().out
+    assert "Extra" in out.columns
+
+
+@pytest.mark.parametrize(
+    ("generation", "base", "reason"),
+    [
+        ("g3", "g2", "Stage 1 실행을 건너뜀"),  # the g2 delta was never applied
+        ("g1", "g0", "같은 세대의 다른 입력 파일"),  # new workbook under the old generation
+    ],
+)
+def test_broken_delta_chain_falls_back_to_full(project, capsys, generation, base, reason):
+    """델타 연속성 없으면 전체 재계산. | A delta that does not chain forces a full recompute."""
+
+    tmp_path, config = project
+    first = _stage1(tmp_path, _synced(), "synced_v1.xlsx", "g1", None)
+    _run(tmp_path, config, _synced(), "synced_v1.xlsx", case_delta=first)
+
+    # Warehouse-side change the (stale) delta does not report
+    changed = _synced()
+    changed.loc[4, "MIR"] = pd.Timestamp("2024-03-01")
+    delta = _stage1(tmp_path, changed, "synced_v2.xlsx", generation, base)
+
+    capsys.readouterr()
+    out = _run(tmp_path, config, changed, "synced_v2.xlsx", case_delta=delta)
+    assert reason in capsys.readouterr().out
+    assert out.loc[4, "Status_Location_Date"] == pd.Timestamp("2024-03-01")
+
+
+def test_delta_for_another_workbook_falls_back(project, capsys):
+    """다른 입력의 델타 거부. | A delta written for another workbook is not applied."""
+
+    tmp_path, config = project
+    first = _stage1(tmp_path, _synced(), "synced_v1.xlsx", "g1", None)
+    _run(tmp_path, config, _synced(), "synced_v1.xlsx", case_delta=first)
+    delta = _stage1(tmp_path, _synced(), "synced_v2.xlsx", "g2", "g1")
+
+    capsys.readouterr()
+    _run(tmp_path, config, _synced(), "synced_v1.xlsx", case_delta=delta)
+    assert "델타를 만든 Stage 1 결과와 다름" in capsys.readouterr().out
+    assert read_stage2_state(tmp_path / "derived.xlsx")["generation"] is None
@@ -0,0 +1,77 @@
+"""최근 위치 엔진 테스트. | Tests for the vectorized Stage 2 latest-location engine."""
+
+import numpy as np
+import pandas as pd
+
+from scripts.stage2_derived.derived_columns_processor import (
+    _classify_storage,
+    _latest_location_and_date,
+    calculate_derived_columns,
+)
+
+WAREHOUSES = ["DHL WH", "DSV Indoor", "MOSB"]
+SITES = ["MIR", "SHU", "DAS", "AGI"]
+
+
+def _row_latest(row: pd.Series):
+    """행 단위 기준 구현. | Row-wise reference (the former ``apply`` version)."""
+
+    non_null = row.dropna()
+    if non_null.empty:
+        return None, pd.NaT
+    latest = non_null.max()
+    return non_null[non_null == latest].index[0], latest
+
+
+def _frame(rows: int = 300, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    data = {"Case No.": [f"HE-{i:04d}" for i in range(rows)]}
+    for column in WAREHOUSES + SITES:
+        days = pd.Series(
+            pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 10, rows), "D")
+        )
+        days[rng.random(rows) < 0.6] = pd.NaT
+        data[column] = days.dt.strftime("%Y-%m-%d")
+    return pd.DataFrame(data)
+
+
+def test_argmax_matches_row_reference_with_ties():
+    """동률은 앞 컬럼. | Latest column/date equal the row-wise reference; ties go left."""
+
+    df = _frame()
+    dates = df[SITES].apply(pd.to_datetime)
+    dates.iloc[0] = [pd.Timestamp("2024-02-01")] * 2 + [pd.NaT] * 2  # MIR/SHU tie
+
+    locations, latest = _latest_location_and_date(dates, SITES)
+    expected = [_row_latest(row) for _, row in dates.iterrows()]
+
+    assert locations.tolist() == [location for location, _ in expected]
+    assert locations[0] == "MIR"
+    np.testing.assert_array_equal(
+        latest, pd.to_datetime(pd.Series([date for _, date in expected])).to_numpy("M8[ns]")
+    )
+
+
+def test_status_columns_follow_site_then_warehouse():
+    """상태 컬럼. | Status_Current/Location/Storage follow the site > warehouse > Pre Arrival rule."""
+
+    out = calculate_derived_columns(_frame())
+
+    dates = out[WAREHOUSES + SITES]
+    for i in range(len(out)):
+        row = dates.iloc[i]
+        site, site_date = _row_latest(row[SITES])
+        warehouse, warehouse_date = _row_latest(row[WAREHOUSES])
+        current = "site" if site else ("warehouse" if warehouse else "Pre Arrival")
+        location = site or warehouse or "Pre Arrival"
+        storage = _classify_storage(location) or current
+
+        assert out["Status_Current"].iat[i] == current
+        assert out["Status_Location"].iat[i] == location
+        assert out["Status_Storage"].iat[i] == storage
+        if site or warehouse:
+            assert out["Status_Location_Date"].iat[i] == (site_date if site else warehouse_date)
+        else:
+            assert pd.isna(out["Status_Location_Date"].iat[i])
+
+    assert out["Status_Location_Date"].dtype == "datetime64[ns]"
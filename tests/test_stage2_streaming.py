@@ -0,0 +1,89 @@
+"""Stage 2 스트리밍 테스트. | Tests for chunked (streaming) Stage 2 runs."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+
+from scripts.core.excel_stream import ExcelChunkWriter, iter_excel_chunks
+from scripts.stage2_derived.derived_columns_processor import (
+    process_derived_columns,
+    read_stage2_state,
+)
+
+
+def _sheet(prefix: str, rows: int, offset: int = 0) -> pd.DataFrame:
+    dates = pd.date_range("2024-01-01", periods=rows, freq="D") + pd.Timedelta(days=offset)
+    return pd.DataFrame(
+        {
+            "Case No.": [f"{prefix}-{i:03d}" for i in range(rows)],
+            "DHL WH": [d if i % 3 else None for i, d in enumerate(dates)],
+            "MIR": [d + pd.Timedelta(days=5) if i % 2 else None for i, d in enumerate(dates)],
+            "Stack": ["X2", "Not stackable", None] * (rows // 3),
+            "L(CM)": [120, 80, None] * (rows // 3),
+            "W(CM)": [100, 50, 40] * (rows // 3),
+        }
+    )
+
+
+def _normalized(frame: pd.DataFrame) -> pd.DataFrame:
+    """청크별 dtype 추론 차이(NaN/NaT) 제거. | Compare values, not per-chunk dtypes."""
+
+    return frame.astype(object).where(frame.notna(), None)
+
+
+@pytest.fixture
+def synced(tmp_path: Path):
+    path = tmp_path / "synced.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        _sheet("HE", 30).to_excel(writer, sheet_name="Case List", index=False)
+        _sheet("SIM", 12, offset=40).assign(Extra="x").to_excel(
+            writer, sheet_name="HE Local", index=False
+        )
+    config = tmp_path / "stage2.yaml"
+    config.write_text(
+        yaml.safe_dump({"output": {"derived_file": str(tmp_path / "derived.xlsx")}}),
+        encoding="utf-8",
+    )
+    return tmp_path, path, config
+
+
+def test_streaming_matches_in_memory_run(synced, capsys):
+    """스트리밍 = 일괄 처리. | Chunked output equals the in-memory output."""
+
+    tmp_path, path, config = synced
+    run = dict(stage2_config_path=config, project_root=tmp_path)
+
+    assert process_derived_columns(path, **run)
+    full = pd.read_excel(tmp_path / "derived.xlsx")
+
+    capsys.readouterr()
+    assert process_derived_columns(path, chunk_size=7, **run)
+    out = capsys.readouterr().out
+    streamed = pd.read_excel(tmp_path / "derived.xlsx")
+
+    assert "청크 7개" in out  # 30 rows → 5 chunks, 12 rows → 2 chunks
+    assert read_stage2_state(tmp_path / "derived.xlsx") is not None
+    pd.testing.assert_frame_equal(_normalized(streamed), _normalized(full))
+
+
+def test_chunks_round_trip(tmp_path: Path):
+    """청크 읽기/쓰기 왕복. | Chunks concatenate to read_excel and write back unchanged."""
+
+    frame = _sheet("HE", 9).assign(Qty=np.arange(9), Note=[None] * 8 + ["last"])
+    source = tmp_path / "in.xlsx"
+    frame.to_excel(source, index=False)
+
+    chunks = list(iter_excel_chunks(source, chunksize=4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 1]
+    combined = pd.concat(chunks)
+    pd.testing.assert_frame_equal(_normalized(combined), _normalized(pd.read_excel(source)))
+
+    with ExcelChunkWriter(tmp_path / "out.xlsx") as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+    pd.testing.assert_frame_equal(
+        _normalized(pd.read_excel(tmp_path / "out.xlsx")), _normalized(pd.read_excel(source))
+    )